@@ -517,6 +517,61 @@ cdef class KDTree:
         return Values
 
 
+    def rbf_weights(self, coords, nnn, p=2):
+        """
+        Neighbours and normalised inverse-distance weights for `coords`.
+
+        These depend only on the tree and the target coordinates, so they can
+        be computed once and applied to any number of data arrays:
+        ``np.einsum("sdc,sd->sc", data[closest_n], n_weights)``.
+
+        Parameters
+        ----------
+        coords : array-like
+            Target coordinates, shape ``(n_coords, ndim)`` (may be unit-aware).
+        nnn : int
+            The number of neighbour points to sample from.
+        p : int
+            The power index to calculate weights, i.e., pow(distance, -p)
+
+        Returns
+        -------
+        closest_n : ndarray of int
+            Neighbour indices, shape ``(n_coords, nnn)`` (``(n_coords,)`` if nnn == 1).
+        n_weights : ndarray or None
+            Weights, shape ``(n_coords, nnn)``, summing to one on each row;
+            None if nnn == 1 (the nearest value is used as is).
+        """
+        # Convert coordinates to match tree's coordinate system
+        coords_converted = self._convert_coords_to_tree_units(coords)
+
+        if coords_converted.shape[1] != self.ndim:
+            raise RuntimeError(
+                f"Interpolation coordinates dimensionality ({coords_converted.shape[1]}) is different to kD-tree dimensionality ({self.ndim})."
+            )
+
+        # query nnn points to the coords
+        # distance_n is a list of distance to the nearest neighbours for all coords
+        # closest_n is the index of the neighbours from ncoords for all coords
+        # Note: query() returns sqr_dists=True by default, and converts coords itself
+        distance_n, closest_n = self.query(coords, k=nnn)
+
+        if np.any(closest_n > self.n):
+            raise RuntimeError(
+                "Error in rbf_interpolator_local_from_kdtree - a nearest neighbour wasn't found"
+            )
+
+        if nnn == 1:
+            return closest_n, None
+
+        # can decompose weighting vecotrs as IDW is a linear relationship
+        # build normalise weight vectors and multiply that with known data
+        epsilon = 1e-12
+        weights = 1 / np.power(epsilon + distance_n[:], p)
+        n_weights = (weights.T / np.sum(weights, axis=1)).T
+
+        return closest_n, n_weights
+
     def rbf_interpolator_local_from_kdtree(self, coords, data, nnn, p, verbose):
         """
         Performs an inverse distance (squared) mapping of data to the target `coords`.
@@ -545,45 +600,27 @@ cdef class KDTree:
         -------
         ndarray
             Interpolated data values at target coordinates
-        """
-        # Convert coordinates to match tree's coordinate system
-        coords_converted = self._convert_coords_to_tree_units(coords)
 
-        if coords_converted.shape[1] != self.ndim:
-            raise RuntimeError(
-                f"Interpolation coordinates dimensionality ({coords_converted.shape[1]}) is different to kD-tree dimensionality ({self.ndim})."
-            )
+        See Also
+        --------
+        rbf_weights : The neighbours and weights, for re-use with several data arrays.
+        """
         if data.shape[0] != self.n:
             raise RuntimeError(
                 f"Data does not match kd-tree size array ({data.shape[0]} v ({self.n}))"
             )
 
-        coords_contiguous = np.ascontiguousarray(coords_converted)
-        # query nnn points to the coords
-        # distance_n is a list of distance to the nearest neighbours for all coords_contiguous
-        # closest_n is the index of the neighbours from ncoords for all coords_contiguous
-        # Note: query() returns sqr_dists=True by default, and we use the converted coords
-        distance_n, closest_n = self.query(coords, k=nnn)
-
-        if np.any(closest_n > self.n):
-            raise RuntimeError(
-                "Error in rbf_interpolator_local_from_kdtree - a nearest neighbour wasn't found"
-            )
+        closest_n, n_weights = self.rbf_weights(coords, nnn, p)
 
         if verbose and uw.mpi.rank == 0:
             # For Debugging
-            # print(f"kd-tree diagnostics: d.shape - {distance_n.shape}, c.shape - {closest_n.shape}")
+            # print(f"kd-tree diagnostics: c.shape - {closest_n.shape}")
             print(f"Mapping values with nnn - {nnn} & p {p}  ... start", flush=True)
 
         if nnn == 1:
             # only use nearest neighbour raw data
             return data[closest_n]
 
-        # can decompose weighting vecotrs as IDW is a linear relationship
-        # build normalise weight vectors and multiply that with known data
-        epsilon = 1e-12
-        weights = 1 / np.power(epsilon + distance_n[:], p)
-        n_weights = (weights.T / np.sum(weights, axis=1)).T
         kdata = data[closest_n[:]]
 
         # magic with einstein summation power
@@ -60,6 +60,134 @@ def petsc_fvm_get_local_cell_sizes(mesh) -> np.array:
         return cell_radii, cell_centroids
 
 
+cdef extern from "petsc.h" nogil:
+    PetscErrorCode DMPlexGetTransitiveClosure(PetscDM, PetscInt, PetscBool, PetscInt *, PetscInt **)
+    PetscErrorCode DMPlexRestoreTransitiveClosure(PetscDM, PetscInt, PetscBool, PetscInt *, PetscInt **)
+    PetscErrorCode DMPlexGetConeSize(PetscDM, PetscInt, PetscInt *)
+    PetscErrorCode DMPlexGetCone(PetscDM, PetscInt, const PetscInt **)
+    PetscErrorCode DMPlexGetSupportSize(PetscDM, PetscInt, PetscInt *)
+    PetscErrorCode DMPlexGetSupport(PetscDM, PetscInt, const PetscInt **)
+
+
+def petsc_dmplex_get_connectivity(incoming_dm, n_cell_vertices, n_face_vertices):
+        """
+        Local cell / face connectivity of a (single element type) DMPlex,
+        extracted in one pass so that geometric tables can be built with
+        array operations.
+
+        Vertices are listed in closure order (the last entries of the
+        transitive closure, as `getTransitiveClosure(p)[0][-n:]`) and are
+        numbered from the start of the vertex stratum, i.e. they index the
+        local coordinate array.
+
+        Returns
+        -------
+        cell_vertices : (n_cells, n_cell_vertices) array
+        cell_faces : (n_cells, n_cell_faces) array of face indices (from fStart)
+        face_vertices : (n_faces, n_face_vertices) array
+        face_cells : (n_faces, 2) array of supporting cells (from cStart),
+            -1 in the second column for faces with a single cell (boundary)
+        """
+
+        cdef DM dm = incoming_dm
+        cdef PetscInt cStart, cEnd, fStart, fEnd, vStart, vEnd
+        cdef PetscInt p, i, j, size, nf
+        cdef PetscInt nv = n_cell_vertices
+        cdef PetscInt nfv = n_face_vertices
+        cdef PetscInt *closure = NULL
+        cdef const PetscInt *cone = NULL
+        cdef const PetscInt *support = NULL
+
+        cStart, cEnd = incoming_dm.getHeightStratum(0)
+        fStart, fEnd = incoming_dm.getHeightStratum(1)
+        vStart, vEnd = incoming_dm.getDepthStratum(0)
+
+        nf = incoming_dm.getConeSize(cStart) if cEnd > cStart else 0
+
+        cell_vertices_arr = np.empty((cEnd - cStart, nv), dtype=np.longlong)
+        cell_faces_arr = np.empty((cEnd - cStart, nf), dtype=np.longlong)
+        face_vertices_arr = np.empty((fEnd - fStart, nfv), dtype=np.longlong)
+        face_cells_arr = np.full((fEnd - fStart, 2), -1, dtype=np.longlong)
+
+        cdef long long[:, ::1] cell_vertices = cell_vertices_arr
+        cdef long long[:, ::1] cell_faces = cell_faces_arr
+        cdef long long[:, ::1] face_vertices = face_vertices_arr
+        cdef long long[:, ::1] face_cells = face_cells_arr
+
+        for p in range(cStart, cEnd):
+                CHKERRQ(DMPlexGetTransitiveClosure(dm.dm, p, PETSC_TRUE, &size, &closure))
+                if size < nv:
+                        DMPlexRestoreTransitiveClosure(dm.dm, p, PETSC_TRUE, &size, &closure)
+                        raise RuntimeError(f"Cell {p} has fewer than {nv} points in its closure (mixed element types?)")
+                for j in range(nv):
+                        cell_vertices[p - cStart, j] = closure[2 * (size - nv + j)] - vStart
+                CHKERRQ(DMPlexRestoreTransitiveClosure(dm.dm, p, PETSC_TRUE, &size, &closure))
+
+                CHKERRQ(DMPlexGetConeSize(dm.dm, p, &size))
+                if size != nf:
+                        raise RuntimeError(f"Cell {p} has {size} faces, expected {nf} (mixed element types?)")
+                CHKERRQ(DMPlexGetCone(dm.dm, p, &cone))
+                for j in range(nf):
+                        cell_faces[p - cStart, j] = cone[j] - fStart
+
+        for p in range(fStart, fEnd):
+                CHKERRQ(DMPlexGetTransitiveClosure(dm.dm, p, PETSC_TRUE, &size, &closure))
+                if size < nfv:
+                        DMPlexRestoreTransitiveClosure(dm.dm, p, PETSC_TRUE, &size, &closure)
+                        raise RuntimeError(f"Face {p} has fewer than {nfv} points in its closure (mixed element types?)")
+                for j in range(nfv):
+                        face_vertices[p - fStart, j] = closure[2 * (size - nfv + j)] - vStart
+                CHKERRQ(DMPlexRestoreTransitiveClosure(dm.dm, p, PETSC_TRUE, &size, &closure))
+
+                CHKERRQ(DMPlexGetSupportSize(dm.dm, p, &size))
+                CHKERRQ(DMPlexGetSupport(dm.dm, p, &support))
+                for j in range(min(size, 2)):
+                        face_cells[p - fStart, j] = support[j] - cStart
+
+        return cell_vertices_arr, cell_faces_arr, face_vertices_arr, face_cells_arr
+
+
+cdef extern from "petsc.h" nogil:
+    PetscErrorCode DMPlexCoordinatesToReference(PetscDM, PetscInt, PetscInt, const PetscReal *, PetscReal *)
+
+
+def petsc_dmplex_coordinates_to_reference(incoming_dm, cells, coords):
+        """
+        Reference-cell coordinates of points in known cells. Wraps
+        `DMPlexCoordinatesToReference` (PETSc reference cells span [-1, 1]
+        in each direction; non-affine cells are inverted by Newton iteration).
+
+        `cells` are local cell indices (from cStart); points with a negative
+        cell are skipped and returned as NaN.
+        """
+
+        cdef DM dm = incoming_dm
+        cdef PetscInt cStart, cEnd, i, n, dim, cdim
+        cdef long long[::1] c_cells
+        cdef double[:, ::1] c_coords
+        cdef double[:, ::1] c_ref
+
+        cStart, cEnd = incoming_dm.getHeightStratum(0)
+        dim = incoming_dm.getDimension()
+        cdim = incoming_dm.getCoordinateDim()
+
+        cells_arr = np.ascontiguousarray(cells, dtype=np.longlong).reshape(-1)
+        coords_arr = np.ascontiguousarray(coords, dtype=np.double).reshape(-1, cdim)
+        ref_arr = np.full((coords_arr.shape[0], dim), np.nan, dtype=np.double)
+
+        c_cells = cells_arr
+        c_coords = coords_arr
+        c_ref = ref_arr
+        n = cells_arr.shape[0]
+
+        for i in range(n):
+                if c_cells[i] < 0:
+                        continue
+                CHKERRQ(DMPlexCoordinatesToReference(dm.dm, c_cells[i] + cStart, 1, &c_coords[i, 0], &c_ref[i, 0]))
+
+        return ref_arr
+
+
 def petsc_dm_create_submesh_from_label(incoming_dm, boundary_label_name, boundary_label_value, marked_faces=True) -> float:
         """
         Wraps DMPlexCreateSubmesh
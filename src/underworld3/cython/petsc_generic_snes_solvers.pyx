@@ -9,6 +9,8 @@ from petsc4py import PETSc
 import underworld3
 import underworld3 as uw
 from   underworld3.utilities._jitextension import getext
+from   underworld3.utilities._jitextension import pointwise_memo_key, pointwise_memo_lookup, pointwise_memo_store
+from   underworld3.utilities._jitextension import PendingExtension, builds_deferred
 import underworld3.timing as timing
 
 from underworld3.utilities._api_tools import uw_object
@@ -39,6 +41,20 @@ class SolverBaseClass(uw_object):
         self.compiled_extensions = None
         self.constants_manifest = []
 
+        # Structural key of the pointwise functions the current DM was built with
+        self._pointwise_key = None
+        self._pending_pointwise_key = None
+
+        # Reuse of the assembled Jacobian / preconditioner between solves
+        self._reuse_operator = False
+        self._lag_jacobian = None
+        self._operator_state = None
+        self._operator_snes = None
+        self._operator_lag_set = False
+        self._operator_dependencies_for = None
+        self._operator_dependencies_cache = None
+        self.reset_operator_stats()
+
         self.Unknowns = self._Unknowns(self)
 
         self._order = 0
@@ -431,6 +447,18 @@ class SolverBaseClass(uw_object):
             f"  to investigate.\n"
         )
 
+    def _add_null_boundary(self):
+        # This is a workaround for some problem in the PETSc machinery
+        # where we need a surface integral term somewhere on every process
+        # if we have a contribution from anywhere. We add a fake one here
+        # which just integrates nothing over a bunch of points. It's enough
+        # to let the rest of the machinery work.
+
+        if len(self.natural_bcs) > 0:
+            if not any(bc.boundary == "Null_Boundary" for bc in self.natural_bcs):
+                bc = (0,)*self.Unknowns.u.shape[1]
+                self.add_natural_bc(bc, "Null_Boundary")
+
     @timing.routine_timer_decorator
     def _build(self,
                     verbose: bool = False,
@@ -438,7 +466,24 @@ class SolverBaseClass(uw_object):
                     debug_name: str = None,
                     ):
 
+        self._add_null_boundary()
+
         if (not self.is_setup):
+            # A structurally identical rebuild (e.g. only a constant's value
+            # changed) keeps the DM, SNES and compiled functions. solve()
+            # refreshes the constants via PetscDSSetConstants.
+            key = self._pointwise_memo_key()
+            if self.dm is not None and key is not None and key == self._pointwise_key:
+                if verbose and uw.mpi.rank == 0:
+                    print(f"{self.name}: pointwise functions unchanged - keeping solver DM", flush=True)
+
+                self.is_setup = True
+                if self._constitutive_model is not None:
+                    self._constitutive_model._solver_is_setup = True
+                return
+
+            self._pending_pointwise_key = key
+
             if self.dm is not None:
                 if verbose and uw.mpi.rank == 0:
                     print(f"Destroy solver DM", flush=True)
@@ -448,17 +493,6 @@ class SolverBaseClass(uw_object):
                             # can insert new functions in template (surface integrals problematic in
                             # the current implementation )
 
-        # This is a workaround for some problem in the PETSc machinery
-        # where we need a surface integral term somewhere on every process
-        # if we have a contribution from anywhere. We add a fake one here
-        # which just integrates nothing over a bunch of points. It's enough
-        # to let the rest of the machinery work.
-
-        if len(self.natural_bcs) > 0:
-            if not any(bc.boundary == "Null_Boundary" for bc in self.natural_bcs):
-                bc = (0,)*self.Unknowns.u.shape[1]
-                self.add_natural_bc(bc, "Null_Boundary")
-
         if verbose:
             uw.pprint("Build pointwise functions")
         self._setup_pointwise_functions(verbose, debug=debug, debug_name=debug_name)
@@ -474,6 +508,121 @@ class SolverBaseClass(uw_object):
         return
 
 
+    ## Memoisation of the pointwise functions
+
+    # Attributes set by _setup_pointwise_functions (besides the compiled
+    # extension) that are restored on a memo hit. Subclasses extend this.
+    _pointwise_attributes = ()
+
+    def _pointwise_inputs(self):
+        """Symbolic inputs that fully determine the pointwise functions.
+
+        Subclasses return a tuple of sympy objects (residual terms, unknowns,
+        preconditioner terms); `None` disables memoisation for the solver.
+        Boundary conditions are added by `_pointwise_memo_key`.
+        """
+        return None
+
+    def _pointwise_memo_key(self):
+        """Structural key for the pointwise functions (see `pointwise_memo_key`)."""
+
+        try:
+            inputs = self._pointwise_inputs()
+            if inputs is None:
+                return None
+
+            essential = tuple(
+                (bc.f_id, tuple(int(c) for c in bc.components), bc.fn, bc.boundary)
+                for bc in self.essential_bcs
+            )
+            natural = tuple(
+                (bc.f_id, tuple(int(c) for c in bc.components), bc.fn_f, bc.boundary)
+                for bc in self.natural_bcs
+            )
+
+            return pointwise_memo_key(self.mesh, type(self).__name__, (inputs, essential, natural))
+        except Exception:
+            # Anything we cannot key reliably is simply rebuilt
+            return None
+
+    def _pointwise_state(self):
+        state = {name: getattr(self, name) for name in self._pointwise_attributes}
+        state["_fns_bd_residual"] = self._fns_bd_residual
+        state["_fns_bd_jacobian"] = self._fns_bd_jacobian
+        state["compiled_extensions"] = self.compiled_extensions
+        state["ext_dict"] = self.ext_dict
+        state["constants_manifest"] = self.constants_manifest
+        state["natural_bc_fns"] = [dict(bc.fns) for bc in self.natural_bcs]
+        return state
+
+    def _restore_pointwise_state(self, state):
+        for name, value in state.items():
+            if name != "natural_bc_fns":
+                setattr(self, name, value)
+
+        for bc, fns in zip(self.natural_bcs, state["natural_bc_fns"]):
+            bc.fns.clear()
+            bc.fns.update(fns)
+
+    def _pointwise_memo_begin(self, verbose=False, bypass=False):
+        """Look up memoised pointwise functions for the current inputs.
+
+        Returns the key (to be passed to `_pointwise_memo_end`) and whether
+        the solver state was restored from the memo. Debug builds `bypass`
+        the memo so that their sources are always generated.
+        """
+        key = self._pending_pointwise_key
+        self._pending_pointwise_key = None
+        if bypass:
+            return None, False
+        if key is None:
+            key = self._pointwise_memo_key()
+
+        state = pointwise_memo_lookup(key)
+        if state is None:
+            return key, False
+
+        # Stored by uw.jit.prepare while the module was still compiling
+        if isinstance(state["compiled_extensions"], PendingExtension) and not builds_deferred():
+            state["compiled_extensions"] = state["compiled_extensions"].resolve()
+
+        self._restore_pointwise_state(state)
+        self._pointwise_key = key
+
+        if verbose and uw.mpi.rank == 0:
+            print(f"{self.name}: pointwise functions restored from memo (no differentiation / JIT)", flush=True)
+
+        return key, True
+
+    def _pointwise_memo_end(self, key):
+        pointwise_memo_store(key, self._pointwise_state())
+        self._pointwise_key = key
+
+    def _jit_prepare(self, verbose=False):
+        """Derive the pointwise functions and submit their compilation.
+
+        Called by `underworld3.jit.prepare` inside `deferred_builds()`; the
+        next solve picks up the derived functions from the memo and waits
+        only for its own module. The solver DM is left untouched.
+        """
+        if self._constitutive_model is not None and not self._constitutive_model._solver_is_setup:
+            self.is_setup = False
+
+        if self.is_setup:
+            return
+
+        # The same natural BCs as _build, or the memo key would not match
+        self._add_null_boundary()
+
+        # The solver keeps the functions of its current DM; the prepared
+        # ones (and the pending module) live only in the memo
+        key = self._pointwise_key
+        state = self._pointwise_state()
+        self._setup_pointwise_functions(verbose)
+        self._restore_pointwise_state(state)
+        self._pointwise_key = key
+        self.is_setup = False
+
     def _set_constants_on_ds(self, ds):
         """Pack current constant values and call PetscDSSetConstants.
 
@@ -516,6 +665,200 @@ class SolverBaseClass(uw_object):
                 except Exception:
                     pass
 
+    ## Reuse of the assembled operator
+
+    @property
+    def reuse_operator(self):
+        """
+        Keep the assembled Jacobian and preconditioner while they are unchanged.
+
+        When True, a solve reassembles the operator (and rebuilds the
+        preconditioner, including any multigrid hierarchy) only if a constant
+        or a mesh variable that appears in the Jacobian has changed, or the
+        mesh has moved. Changes to the right-hand side alone (forcing terms,
+        boundary values, constants that only enter the residual) reuse the
+        previous operator. Problems whose Jacobian depends on the unknowns
+        are reassembled every solve - use `lag_jacobian` to lag them.
+        """
+        return self._reuse_operator
+
+    @reuse_operator.setter
+    def reuse_operator(self, value):
+        self._reuse_operator = bool(value)
+        self._operator_state = None
+
+    @property
+    def lag_jacobian(self):
+        """
+        Rebuild the Jacobian and preconditioner every `n` Newton iterations,
+        counted across solves (PETSc ``SNESSetLagJacobian`` with persistence).
+        ``-1`` never rebuilds after the first assembly; None (default) leaves
+        the PETSc settings alone. Takes precedence over `reuse_operator`.
+        """
+        return self._lag_jacobian
+
+    @lag_jacobian.setter
+    def lag_jacobian(self, value):
+        self._lag_jacobian = None if value is None else int(value)
+
+    def get_operator_stats(self):
+        """
+        Operator assembly statistics for this solver.
+
+        Returns
+        -------
+        dict with metrics:
+            - solves: Calls to solve()
+            - assembled: Solves that reassembled the operator
+            - reused: Solves that reused the previous operator
+            - lagged: Solves under `lag_jacobian` (PETSc decides per iteration)
+            - last: What the most recent solve did ("assembled", "reused",
+              "lagged" or "default")
+        """
+        return dict(self._operator_stats)
+
+    def reset_operator_stats(self):
+        """Reset the operator statistics (the operator itself is kept)."""
+        self._operator_stats = {
+            'solves': 0,
+            'assembled': 0,
+            'reused': 0,
+            'lagged': 0,
+            'last': None,
+        }
+
+    def _jacobian_fns(self):
+        """Jacobian pointwise functions (before unwrapping). Subclasses list theirs."""
+        return None
+
+    def _unknown_variables(self):
+        """Mesh variables solved for (primary fields of the pointwise functions)."""
+        return [self.u]
+
+    def _operator_dependencies(self):
+        """
+        What the assembled operator depends on, besides the mesh.
+
+        Returns the constants-manifest indices and the mesh variables that
+        appear in the Jacobian, or None if the Jacobian depends on the
+        unknowns (nonlinear) or cannot be analysed. Cached per compiled
+        extension (structurally identical rebuilds share the answer).
+        """
+        if self._operator_dependencies_for is self.compiled_extensions:
+            return self._operator_dependencies_cache
+
+        from underworld3.function._function import UnderworldAppliedFunction
+        from underworld3.function.expressions import unwrap
+        from underworld3.utilities._jitextension import _extract_constants
+
+        dependencies = None
+
+        try:
+            fns = [fn for fn in self._jacobian_fns() if fn is not None]
+
+            jacobian_constants, _ = _extract_constants(fns, self.mesh)
+            jacobian_constants = {expr for _, expr in jacobian_constants}
+            indices = [i for i, expr in self.constants_manifest if expr in jacobian_constants]
+
+            variables = {}
+            for fn in fns:
+                expanded = unwrap(fn, keep_constants=False, return_self=False)
+                for atom in expanded.atoms(UnderworldAppliedFunction):
+                    var = atom.meshvar()
+                    variables[id(getattr(var, "_base_var", var))] = var
+
+            unknowns = {id(getattr(var, "_base_var", var)) for var in self._unknown_variables()}
+            if not unknowns.intersection(variables):
+                dependencies = (indices, list(variables.values()))
+        except Exception:
+            dependencies = None
+
+        self._operator_dependencies_for = self.compiled_extensions
+        self._operator_dependencies_cache = dependencies
+
+        return dependencies
+
+    def _operator_fingerprint(self):
+        """Hash of everything the (linear) operator depends on, or None."""
+        dependencies = self._operator_dependencies()
+        if dependencies is None:
+            return None
+
+        import xxhash
+        import numpy as np
+        from underworld3.utilities._jitextension import _pack_constants
+
+        indices, variables = dependencies
+
+        xxh = xxhash.xxh64()
+        xxh.update(np.ascontiguousarray(np.asarray(_pack_constants(self.constants_manifest))[indices]))
+        for var in variables:
+            xxh.update(np.ascontiguousarray(var.vec.array))
+
+        return (getattr(self.mesh, "_mesh_version", None), xxh.intdigest())
+
+    def _set_operator_lag(self):
+        """
+        Decide whether this solve reassembles the Jacobian and preconditioner
+        (collective: all ranks must take the same decision).
+
+        Called after the constants are updated and before the first
+        `snes.solve` of a solve(). PETSc lag -2 rebuilds once and then
+        freezes the operator; -1 keeps the previous one.
+        """
+        from mpi4py import MPI
+
+        stats = self._operator_stats
+        stats['solves'] += 1
+
+        if self._lag_jacobian is not None:
+            self.snes.setLagJacobian(self._lag_jacobian)
+            self.snes.setLagPreconditioner(self._lag_jacobian)
+            self.snes.setLagJacobianPersists(True)
+            self.snes.setLagPreconditionerPersists(True)
+            self._operator_lag_set = True
+            self._operator_state = None
+            stats['lagged'] += 1
+            stats['last'] = "lagged"
+            return
+
+        if not self._reuse_operator:
+            if self._operator_lag_set:
+                # Back to the PETSc defaults
+                self.snes.setLagJacobian(1)
+                self.snes.setLagPreconditioner(1)
+                self.snes.setLagJacobianPersists(False)
+                self.snes.setLagPreconditionerPersists(False)
+                self._operator_lag_set = False
+            self._operator_state = None
+            stats['last'] = "default"
+            return
+
+        state = self._operator_fingerprint()
+        reuse = (
+            state is not None
+            and state == self._operator_state
+            and self._operator_snes is self.snes
+        )
+        reuse = uw.mpi.comm.allreduce(reuse, op=MPI.LAND)
+
+        # A nonlinear operator is rebuilt at every Newton iteration
+        if state is None:
+            lag = 1
+        elif reuse:
+            lag = -1
+        else:
+            lag = -2
+
+        self.snes.setLagJacobian(lag)
+        self.snes.setLagPreconditioner(lag)
+        self._operator_lag_set = True
+        self._operator_state = state
+        self._operator_snes = self.snes
+
+        stats['reused' if reuse else 'assembled'] += 1
+        stats['last'] = "reused" if reuse else "assembled"
+
     # Deprecate in favour of properties for solver.F0, solver.F1
     @timing.routine_timer_decorator
     def _setup_problem_description(self):
@@ -1411,6 +1754,14 @@ class SNES_Scalar(SolverBaseClass):
 
         return
 
+    _pointwise_attributes = ("_u_f0", "_u_F1", "_G0", "_G1", "_G2", "_G3")
+
+    def _pointwise_inputs(self):
+        return (self.F0.sym, self.F1.sym, self.u.sym, self.Unknowns.L)
+
+    def _jacobian_fns(self):
+        return (self._G0, self._G1, self._G2, self._G3) + tuple(self._fns_bd_jacobian)
+
     @timing.routine_timer_decorator
     def _setup_pointwise_functions(self, verbose=False, debug=False, debug_name=None):
         import sympy
@@ -1424,6 +1775,10 @@ class SNES_Scalar(SolverBaseClass):
             if verbose and uw.mpi.rank == 0:
                 print(f"SNES_Scalar ({self.name}): Pointwise functions need to be built", flush=True)
 
+        memo_key, restored = self._pointwise_memo_begin(verbose, debug or debug_name is not None)
+        if restored:
+            return
+
 
 
         mesh = self.mesh
@@ -1550,6 +1905,8 @@ class SNES_Scalar(SolverBaseClass):
         self.ext_dict = _getext_result.fn_dicts
         self.constants_manifest = _getext_result.constants_manifest
 
+        self._pointwise_memo_end(memo_key)
+
         return
 
 
@@ -1717,6 +2074,9 @@ class SNES_Scalar(SolverBaseClass):
         if _force_setup or not self.constitutive_model._solver_is_setup:
             self.is_setup = False
 
+        if _force_setup:
+            self._pointwise_key = None  # a forced setup always rebuilds the DM
+
         self._build(verbose, debug, debug_name)
 
         gvec = self.dm.getGlobalVec()
@@ -1744,6 +2104,7 @@ class SNES_Scalar(SolverBaseClass):
 
         # Update constants (e.g. changed material params) before solve
         self._update_constants()
+        self._set_operator_lag()
 
         # solve
         self.snes.solve(None, gvec)
@@ -2154,6 +2515,14 @@ class SNES_Vector(SolverBaseClass):
     # can be ingested by the _setup_terms() function
 
 
+    _pointwise_attributes = ("_u_f0", "_u_F1", "_G0", "_G1", "_G2", "_G3")
+
+    def _pointwise_inputs(self):
+        return (self.F0.sym, self.F1.sym, self.u.sym, self.Unknowns.L)
+
+    def _jacobian_fns(self):
+        return (self._G0, self._G1, self._G2, self._G3) + tuple(self._fns_bd_jacobian)
+
     @timing.routine_timer_decorator
     def _setup_pointwise_functions(self, verbose=False, debug=False, debug_name=None):
         import sympy
@@ -2167,6 +2536,10 @@ class SNES_Vector(SolverBaseClass):
             if verbose and uw.mpi.rank == 0:
                 print(f"SNES_Vector ({self.name}): Pointwise functions need to be built", flush=True)
 
+        memo_key, restored = self._pointwise_memo_begin(verbose, debug or debug_name is not None)
+        if restored:
+            return
+
         N = self.mesh.N
         dim = self.mesh.dim
         cdim = self.mesh.cdim
@@ -2299,7 +2672,7 @@ class SNES_Vector(SolverBaseClass):
         self.ext_dict = _getext_result.fn_dicts
         self.constants_manifest = _getext_result.constants_manifest
 
-        cdef PtrContainer ext = self.compiled_extensions
+        self._pointwise_memo_end(memo_key)
 
         return
 
@@ -2462,6 +2835,9 @@ class SNES_Vector(SolverBaseClass):
         if _force_setup or not self.constitutive_model._solver_is_setup:
             self.is_setup = False
 
+        if _force_setup:
+            self._pointwise_key = None  # a forced setup always rebuilds the DM
+
         self._build(verbose, debug, debug_name)
 
         # if (not self.is_setup):
@@ -2516,6 +2892,7 @@ class SNES_Vector(SolverBaseClass):
 
         # Update constants (e.g. changed material params) before solve
         self._update_constants()
+        self._set_operator_lag()
 
         # solve
         self.snes.solve(None,gvec)
@@ -3205,6 +3582,31 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
 
         return
 
+    _pointwise_attributes = (
+        "_u_F0", "_u_F1", "_p_F0",
+        "_uu_G0", "_uu_G1", "_uu_G2", "_uu_G3",
+        "_up_G0", "_up_G1", "_up_G2", "_up_G3",
+        "_pu_G0", "_pu_G1", "_pp_G0",
+    )
+
+    def _jacobian_fns(self):
+        return (
+            self._uu_G0, self._uu_G1, self._uu_G2, self._uu_G3,
+            self._up_G0, self._up_G1, self._up_G2, self._up_G3,
+            self._pu_G0, self._pu_G1, self._pp_G0,
+        ) + tuple(self._fns_bd_jacobian)
+
+    def _unknown_variables(self):
+        return [self.u, self.p]
+
+    def _pointwise_inputs(self):
+        return (
+            self.F0.sym, self.F1.sym, self.PF0.sym,
+            self.u.sym, self.p.sym, self.Unknowns.L, self._G,
+            self.saddle_preconditioner,
+            self.constitutive_model.K,
+        )
+
     @timing.routine_timer_decorator
     def _setup_pointwise_functions(self, verbose=False, debug=False, debug_name=None):
         import sympy
@@ -3218,6 +3620,10 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
             if verbose and uw.mpi.rank == 0:
                 print(f"SNES_Stokes_SaddlePt ({self.name}): Pointwise functions need to be built", flush=True)
 
+        memo_key, restored = self._pointwise_memo_begin(verbose, debug or debug_name is not None)
+        if restored:
+            return
+
         dim  = self.mesh.dim
         cdim = self.mesh.cdim
         N = self.mesh.N
@@ -3416,6 +3822,8 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
         self.ext_dict = _getext_result.fn_dicts
         self.constants_manifest = _getext_result.constants_manifest
 
+        self._pointwise_memo_end(memo_key)
+
         self.is_setup = False
 
         return
@@ -3821,6 +4229,9 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
         if _force_setup or not self.constitutive_model._solver_is_setup:
             self.is_setup = False
 
+        if _force_setup:
+            self._pointwise_key = None  # a forced setup always rebuilds the DM
+
         self._build(verbose, debug, debug_name)
 
         # Keep a record of these set-up parameters
@@ -3833,6 +4244,7 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
 
         # Update constants (e.g. changed material params) before solve
         self._update_constants()
+        self._set_operator_lag()
 
         gvec = self.dm.getGlobalVec()
         gvec.setArray(0.0)
@@ -3842,11 +4254,14 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
             if verbose and uw.mpi.rank == 0:
                 print(f"SNES pre-solve - non-zero initial guess", flush=True)
 
-
-            self.petsc_options.setValue("snes_max_it", 0)
-            self.snes.setType("nrichardson")
-            self.snes.setFromOptions()
-            self.snes.solve(None, gvec)
+            # The tolerance is relative to the residual of a zero guess (as
+            # for a cold start). One function evaluation gives it - the SNES
+            # type and options are left alone, so the Newton solver (and any
+            # lagged Jacobian / preconditioner) is not rebuilt.
+            fvec = gvec.duplicate()
+            self.snes.computeFunction(gvec, fvec)
+            self.atol = fvec.norm() * self.tolerance
+            fvec.destroy()
 
             # with self.mesh.access():
             for name,var in self.fields.items():
@@ -3855,8 +4270,6 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
                 subdm.localToGlobal(var.vec,sgvec)                 # Copy variable data into gvec
                 gvec.restoreSubVector(self._subdict[name][0], sgvec)
 
-            self.atol = self.snes.getFunctionNorm() * self.tolerance
-
         else:
             self.atol = 0.0
 
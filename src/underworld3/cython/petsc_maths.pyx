@@ -51,6 +51,10 @@ class Integral:
         self.fn = sympy.sympify(fn)
         super().__init__()
 
+    def _jit_prepare(self, verbose=False):
+        """Submit the integrand for compilation (see `underworld3.jit.prepare`)."""
+        getext(self.mesh, [self.fn,], [], [], [], [], self.mesh.vars.values(), verbose=verbose)
+
     @timing.routine_timer_decorator
     def evaluate(self, verbose=False):
         """
@@ -360,6 +364,10 @@ class BdIntegral:
 
         super().__init__()
 
+    def _jit_prepare(self, verbose=False):
+        """Submit the integrand for compilation (see `underworld3.jit.prepare`)."""
+        getext(self.mesh, [], [], [], [self.fn,], [], self.mesh.vars.values(), verbose=verbose)
+
     @timing.routine_timer_decorator
     def evaluate(self, verbose=False):
         """
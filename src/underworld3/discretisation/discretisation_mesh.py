@@ -286,6 +286,8 @@ class Mesh(Stateful, uw_object):
 
         # Mesh coordinate version tracking for swarm coordination
         self._mesh_version = 0
+        self._global_extents = None
+        self._neighbour_domains = None
         self._registered_swarms = weakref.WeakSet()
         self._registered_surfaces = weakref.WeakSet()  # Surfaces using this mesh
         self._mesh_update_lock = threading.RLock()
@@ -1164,6 +1166,8 @@ class Mesh(Stateful, uw_object):
                 flush=True,
             )
 
+        self._cell_connectivity = None
+        self._cell_walk_tables = None
         self._index = None
         self._build_kd_tree_index()
 
@@ -1180,6 +1184,12 @@ class Mesh(Stateful, uw_object):
             self._search_lengths,
         ) = self._get_mesh_sizes()
 
+        # Global radii / bounds / domain centroids are computed here, where all
+        # ranks are known to participate, so that the queries are not collective
+        self._global_extents = None
+        self._neighbour_domains = None
+        self._get_global_extents()
+
         self.dm.copyDS(self.dm_hierarchy[-1])
 
         if verbose and uw.mpi.rank == 0:
@@ -2147,85 +2157,88 @@ class Mesh(Stateful, uw_object):
 
         return
 
-    def _build_kd_tree_index(self):
+    def _get_cell_connectivity(self):
+        """
+        Local cell-to-vertex, cell-to-face, face-to-vertex and face-to-cell
+        tables (see `petsc_dmplex_get_connectivity`). Extracted once per DM
+        and shared by the geometric tables below, which are then built with
+        array operations rather than per-cell DMPlex queries.
+        """
 
-        if hasattr(self, "_index") and self._index is not None:
-            return
+        if getattr(self, "_cell_connectivity", None) is not None:
+            return self._cell_connectivity
 
-        dim = self.dim
-        # def mesh_face_skeleton_kdtree(mesh):
+        from underworld3.cython.petsc_discretisation import petsc_dmplex_get_connectivity
 
-        cStart, cEnd = self.dm.getHeightStratum(0)
-        fStart, fEnd = self.dm.getHeightStratum(1)
-        pStart, pEnd = self.dm.getDepthStratum(0)
-        cell_num_faces = self.element.entities[1]
         cell_num_points = self.element.entities[self.dim]
         face_num_points = self.element.face_entities[self.dim]
 
-        control_points_list = []
-        control_points_cell_list = []
-
-        for cell, cell_id in enumerate(range(cStart, cEnd)):
-
-            cell_faces = self.dm.getCone(cell_id)
-            points = self.dm.getTransitiveClosure(cell_id)[0][-cell_num_points:]
-            # Use raw internal array for KD-tree construction (avoid unit-aware wrapping)
-            cell_point_coords = self._coords[points - pStart]
-            cell_centroid = cell_point_coords.mean(axis=0)
-
-            # for face in range(cell_num_faces):
+        self._cell_connectivity = petsc_dmplex_get_connectivity(
+            self.dm, cell_num_points, face_num_points
+        )
 
-            #     points = self.dm.getTransitiveClosure(cell_faces[face])[0][
-            #         -face_num_points:
-            #     ]
-            #     point_coords = self.data[points - pStart]
+        return self._cell_connectivity
 
-            #     face_centroid = point_coords.mean(axis=0)
-            #     cell_centroid = cell_point_coords.mean(axis=0)
+    def _face_normals(self, face_coords, reference_points):
+        """
+        Unit normals of faces (vertex coordinates `face_coords`, shape
+        (..., face_num_points, dim)) oriented away from `reference_points`.
+        Returns (normals, face_centroids).
+        """
 
-            #     # 2D case
-            #     if self.dim == 2:
-            #         vector = point_coords[1] - point_coords[0]
-            #         normal = numpy.array((-vector[1], vector[0]))
+        face_centroids = face_coords.mean(axis=-2)
 
-            #     # 3D simplex case (probably also OK for hexes)
-            #     else:
-            #         normal = numpy.cross(
-            #             (point_coords[1] - point_coords[0]),
-            #             (point_coords[2] - point_coords[0]),
-            #         )
+        # 2D case
+        if self.dim == 2:
+            vector = face_coords[..., 1, :] - face_coords[..., 0, :]
+            normals = numpy.stack((-vector[..., 1], vector[..., 0]), axis=-1)
 
-            #     inward_outward = numpy.sign(normal.dot(face_centroid - cell_centroid))
-            #     normal *= inward_outward / numpy.sqrt(normal.dot(normal))
+        # 3D simplex case (probably also OK for hexes)
+        else:
+            normals = numpy.cross(
+                face_coords[..., 1, :] - face_coords[..., 0, :],
+                face_coords[..., 2, :] - face_coords[..., 0, :],
+            )
 
-            #     inside_control_point = -1e-3 * normal + face_centroid
+        inward_outward = numpy.sign(
+            numpy.einsum("...i,...i->...", normals, face_centroids - reference_points)
+        )
+        normals *= (inward_outward / numpy.sqrt((normals**2).sum(axis=-1)))[..., numpy.newaxis]
 
-            #     control_points_list.append(inside_control_point)
-            #     control_points_cell_list.append(cell_id)
-            #     control_points_list.append(cell_centroid)
-            #     control_points_cell_list.append(cell_id)
+        return normals, face_centroids
 
-            # Add points near the cell vertices
+    def _build_kd_tree_index(self):
 
-            for i in range(cell_point_coords.shape[0]):
-                control_points_list.append(0.99 * cell_point_coords[i] + 0.01 * cell_centroid)
-                control_points_cell_list.append(cell_id)
+        if hasattr(self, "_index") and self._index is not None:
+            return
 
-            # Add centroid
-            control_points_list.append(cell_centroid)
-            control_points_cell_list.append(cell_id)
+        cStart, cEnd = self.dm.getHeightStratum(0)
+        cell_vertices, _, _, _ = self._get_cell_connectivity()
+
+        # Use raw internal array for KD-tree construction (avoid unit-aware wrapping)
+        cell_point_coords = self._coords[cell_vertices]
+        cell_centroids = cell_point_coords.mean(axis=1)
+
+        # Points near the cell vertices, then the centroid, for each cell
+        control_points = numpy.concatenate(
+            (
+                0.99 * cell_point_coords + 0.01 * cell_centroids[:, numpy.newaxis, :],
+                cell_centroids[:, numpy.newaxis, :],
+            ),
+            axis=1,
+        )
 
-        self._indexCoords = numpy.array(control_points_list)
+        self._indexCoords = control_points.reshape(-1, control_points.shape[-1])
         self._index = uw.kdtree.KDTree(self._indexCoords)
-        # self._index.build_index()
-        self._indexMap = numpy.array(control_points_cell_list, dtype=numpy.int64)
+        self._indexMap = numpy.repeat(
+            numpy.arange(cStart, cEnd, dtype=numpy.int64), control_points.shape[1]
+        )
 
         # We don't need an indexMap for this one because there is only one point per cell
         # and the returned kdtree value IS the index.
         # Note: self._centroids is not yet defined:
 
         self._centroid_index = uw.kdtree.KDTree(self._get_coords_for_basis(0, False))
-        # self._centroid_index.build_index()
 
         return
 
@@ -2315,66 +2328,25 @@ class Mesh(Stateful, uw_object):
         ):
             return
 
-        dim = self.dim
-        # def mesh_face_skeleton_kdtree(mesh):
+        cell_vertices, cell_faces, face_vertices, _ = self._get_cell_connectivity()
 
-        cStart, cEnd = self.dm.getHeightStratum(0)
-        fStart, fEnd = self.dm.getHeightStratum(1)
-        pStart, pEnd = self.dm.getDepthStratum(0)
-        num_local_cells = self.dm.getHeightStratum(0)[1]
-        cell_num_faces = self.element.entities[1]
-        cell_num_points = self.element.entities[self.dim]
-        face_num_points = self.element.face_entities[self.dim]
+        # Use raw internal array for internal mesh operations (avoid unit-aware wrapping)
+        cell_centroids = self._coords[cell_vertices].mean(axis=1)
 
-        # All elements in our mesh are a single type
+        # (cell, face, face point, dim)
+        face_coords = self._coords[face_vertices[cell_faces]]
+        normals, face_centroids = self._face_normals(
+            face_coords, cell_centroids[:, numpy.newaxis, :]
+        )
 
-        mesh_cell_outer_control_points = numpy.ndarray(
-            shape=(cell_num_faces, num_local_cells, self.dim)
+        # All elements in our mesh are a single type: (face, cell, dim) tables
+        mesh_cell_outer_control_points = numpy.ascontiguousarray(
+            (1e-3 * normals + face_centroids).transpose(1, 0, 2)
         )
-        mesh_cell_inner_control_points = numpy.ndarray(
-            shape=(cell_num_faces, num_local_cells, self.dim)
+        mesh_cell_inner_control_points = numpy.ascontiguousarray(
+            (-1e-3 * normals + face_centroids).transpose(1, 0, 2)
         )
 
-        for cell, cell_id in enumerate(range(cStart, cEnd)):
-            cell_faces = self.dm.getCone(cell_id)
-            points = self.dm.getTransitiveClosure(cell_id)[0][-cell_num_points:]
-            # Use raw internal array for internal mesh operations (avoid unit-aware wrapping)
-            cell_point_coords = self._coords[points - pStart]
-
-            for face in range(cell_num_faces):
-
-                points = self.dm.getTransitiveClosure(cell_faces[face])[0][-face_num_points:]
-                # Use raw internal array for internal mesh operations (avoid unit-aware wrapping)
-                point_coords = self._coords[points - pStart]
-
-                face_centroid = point_coords.mean(axis=0)
-                cell_centroid = cell_point_coords.mean(axis=0)
-
-                # Compute face normal from point coordinates (already plain numpy arrays)
-                point_data = point_coords
-
-                # 2D case
-                if self.dim == 2:
-                    vector = point_data[1] - point_data[0]
-                    normal = numpy.array((-vector[1], vector[0]))
-
-                # 3D simplex case (probably also OK for hexes)
-                else:
-                    normal = numpy.cross(
-                        (point_data[1] - point_data[0]),
-                        (point_data[2] - point_data[0]),
-                    )
-
-                inward_outward = numpy.sign(normal.dot(face_centroid - cell_centroid))
-                normal *= inward_outward / numpy.sqrt(normal.dot(normal))
-
-                # Compute control points (all arrays are already plain numpy, no units)
-                outside_control_point = 1e-3 * normal + face_centroid
-                inside_control_point = -1e-3 * normal + face_centroid
-
-                mesh_cell_outer_control_points[face, cell, :] = outside_control_point
-                mesh_cell_inner_control_points[face, cell, :] = inside_control_point
-
         self.faces_inner_control_points = mesh_cell_inner_control_points
         self.faces_outer_control_points = mesh_cell_outer_control_points
 
@@ -2419,6 +2391,89 @@ class Mesh(Stateful, uw_object):
 
         return numpy.all(insiders, axis=1)
 
+    def _get_cell_walk_tables(self):
+        """
+        Face planes (centroids and unit outward normals, each shaped
+        (n_cells, n_faces, dim)) and the neighbouring cell across each face
+        ((n_cells, n_faces), -1 on the local boundary) used to walk points to
+        the cell that contains them.
+        """
+
+        if getattr(self, "_cell_walk_tables", None) is not None:
+            return self._cell_walk_tables
+
+        cell_vertices, cell_faces, face_vertices, face_cells = self._get_cell_connectivity()
+
+        # Use raw internal array for internal mesh operations (avoid unit-aware wrapping)
+        cell_centroids = self._coords[cell_vertices].mean(axis=1)
+        normals, face_centroids = self._face_normals(
+            self._coords[face_vertices[cell_faces]], cell_centroids[:, numpy.newaxis, :]
+        )
+
+        supports = face_cells[cell_faces]
+        this_cell = numpy.arange(cell_faces.shape[0])[:, numpy.newaxis]
+        neighbours = numpy.where(supports[..., 0] == this_cell, supports[..., 1], supports[..., 0])
+
+        self._cell_walk_tables = (face_centroids, normals, neighbours)
+
+        return self._cell_walk_tables
+
+    def _walk_to_cells_internal(self, coords, cells, max_steps=None):
+        """
+        Walk each point from its starting cell towards the cell that contains
+        it, crossing the face whose plane the point is furthest outside of.
+
+        All points advance together, one cell per step. A point whose walk
+        leaves the local mesh (crosses a boundary face) or does not arrive
+        within `max_steps` is returned with cell -1; starting cells of -1
+        are not walked. Exact for linear meshes with convex cells.
+
+        Parameters
+        ----------
+        coords : numpy.ndarray
+            (n_points, dim) model coordinates.
+        cells : numpy.ndarray
+            (n_points,) starting (local) cells, e.g. the previous cells of
+            moving points.
+        max_steps : int, optional
+            Default is a few times the number of cells across the local mesh.
+
+        Returns
+        -------
+        cells : numpy.ndarray
+            (n_points,) containing cells, or -1.
+        """
+
+        face_centroids, normals, neighbours = self._get_cell_walk_tables()
+
+        cells = numpy.array(cells, dtype=numpy.int64).reshape(-1)
+        assert coords.shape[0] == cells.shape[0]
+
+        if max_steps is None:
+            num_local_cells = face_centroids.shape[0]
+            max_steps = 2 * int(numpy.ceil(num_local_cells ** (1.0 / self.dim))) + 10
+
+        walking = numpy.where(cells >= 0)[0]
+
+        for step in range(max_steps + 1):
+            if walking.shape[0] == 0:
+                break
+
+            c = cells[walking]
+            distance = numpy.einsum(
+                "pfi,pfi->pf", coords[walking, numpy.newaxis, :] - face_centroids[c], normals[c]
+            )
+            exit_face = distance.argmax(axis=1)
+            arrived = distance[numpy.arange(c.shape[0]), exit_face] <= 0.0
+
+            walking = walking[~arrived]
+            cells[walking] = neighbours[c[~arrived], exit_face[~arrived]]
+            walking = walking[cells[walking] >= 0]
+
+        cells[walking] = -1
+
+        return cells
+
     def _mark_local_boundary_faces_inside_and_out(self):
         """
         Create a collection of control point pairs that are slightly inside
@@ -2435,76 +2490,39 @@ class Mesh(Stateful, uw_object):
         ):
             return
 
-        cStart, cEnd = self.dm.getHeightStratum(0)
-        fStart, fEnd = self.dm.getHeightStratum(1)
-        pStart, pEnd = self.dm.getDepthStratum(0)
-        cell_num_faces = self.element.entities[1]
-        cell_num_points = self.element.entities[self.dim]
-        face_num_points = self.element.face_entities[self.dim]
-
-        boundary_faces = []
-        for face in range(fStart, fEnd):
-            if self.dm.getJoin(face).shape[0] == 1:
-                boundary_faces.append(face)
-
-        boundary_faces = numpy.array(boundary_faces)
-
-        control_points_list = []
-        control_point_sign_list = []
-
-        for face in boundary_faces:
-            cell = self.dm.getJoin(face)[0]
-            points = self.dm.getTransitiveClosure(face)[0][-face_num_points:]
-            point_coords = self._coords[points - pStart]  # Use raw array for internal calculations
-            face_centroid = point_coords.mean(axis=0)
-            cell_centroid = self._centroids[cell - cStart]
-
-            # 2D case
-            if self.dim == 2:
-                vector = point_coords[1] - point_coords[0]
-                normal = numpy.array((-vector[1], vector[0]))
-
-            else:
-                # 3D simplex case (probably also OK for hexes)
-                normal = numpy.cross(
-                    (point_coords[1] - point_coords[0]),
-                    (point_coords[2] - point_coords[0]),
-                )
+        _, _, face_vertices, face_cells = self._get_cell_connectivity()
 
-            inward_outward = numpy.sign(normal.dot(face_centroid - cell_centroid))
-            normal *= inward_outward / numpy.sqrt(normal.dot(normal))
+        # Faces with a single supporting cell
+        boundary_faces = numpy.where(face_cells[:, 1] == -1)[0]
 
-            # Control points near centroid
+        point_coords = self._coords[face_vertices[boundary_faces]]  # Use raw array for internal calculations
+        cell_centroids = self._centroids[face_cells[boundary_faces, 0]]
 
-            outside_control_point = 1e-8 * normal + face_centroid
-            control_points_list.append(outside_control_point)
-            control_point_sign_list.append(-1)
+        normals, face_centroids = self._face_normals(point_coords, cell_centroids)
 
-            inside_control_point = -1e-8 * normal + face_centroid
-            control_points_list.append(inside_control_point)
-            control_point_sign_list.append(1)
+        # Control points near the face centroid, then closer to each face node;
+        # each as an (outside, inside) pair
 
-            # Control points closer to face nodes
-
-            for pt in range(0, face_num_points):
-
-                outside_control_point = 1e-8 * normal + 0.8 * point_coords[pt] + 0.2 * face_centroid
-                control_points_list.append(outside_control_point)
-                control_point_sign_list.append(-1)
+        anchors = numpy.concatenate(
+            (
+                face_centroids[:, numpy.newaxis, :],
+                0.8 * point_coords + 0.2 * face_centroids[:, numpy.newaxis, :],
+            ),
+            axis=1,
+        )
+        offsets = 1e-8 * normals[:, numpy.newaxis, :]
 
-                inside_control_point = -1e-8 * normal + 0.8 * point_coords[pt] + 0.2 * face_centroid
-                control_points_list.append(inside_control_point)
-                control_point_sign_list.append(1)
+        control_points = numpy.stack((anchors + offsets, anchors - offsets), axis=2)
 
-        control_point_kdtree = uw.kdtree.KDTree(numpy.array(control_points_list))
-        control_point_sign = numpy.array(control_point_sign_list)
+        control_point_kdtree = uw.kdtree.KDTree(control_points.reshape(-1, control_points.shape[-1]))
+        control_point_sign = numpy.tile(numpy.array((-1, 1)), anchors.shape[0] * anchors.shape[1])
 
         self.boundary_face_control_points_kdtree = control_point_kdtree
         self.boundary_face_control_points_sign = control_point_sign
 
         return
 
-    def points_in_domain(self, points, strict_validation=True):
+    def points_in_domain(self, points, strict_validation=True, cell_hint=None, return_cells=False):
         """
         Determine if the given points lie in this domain.
         Uses a mesh-boundary skeletonization array to determine whether the point is
@@ -2518,6 +2536,13 @@ class Mesh(Stateful, uw_object):
             Plain numbers are assumed to be in model coordinates.
         strict_validation : bool
             Whether to perform strict validation near boundaries
+        cell_hint : array-like, optional
+            Previous local cell of each point (-1 where unknown). Points that
+            are walked to a local cell from their hint are inside without
+            further checks; only the others go through the full test.
+        return_cells : bool
+            Also return the local cell of each point inside the domain (-1
+            for points outside).
 
         """
         # Convert points to model coordinates using the unified conversion function
@@ -2534,8 +2559,32 @@ class Mesh(Stateful, uw_object):
         max_radius = self.get_max_radius()
 
         if model_points.shape[0] == 0:
+            if return_cells:
+                return numpy.array([], dtype=bool), numpy.array([], dtype=numpy.int64)
             return numpy.array([], dtype=bool)
 
+        if cell_hint is not None:
+            cStart, cEnd = self.dm.getHeightStratum(0)
+            cell_hint = numpy.array(cell_hint, dtype=numpy.int64).reshape(-1)
+            cell_hint[(cell_hint < 0) | (cell_hint >= cEnd - cStart)] = -1
+
+            cells = self._walk_to_cells_internal(model_points, cell_hint)
+            in_or_not = cells >= 0
+
+            unresolved = numpy.where(~in_or_not)[0]
+            if unresolved.shape[0] > 0:
+                in_or_not[unresolved], cells[unresolved] = self.points_in_domain(
+                    model_points[unresolved],
+                    strict_validation=strict_validation,
+                    return_cells=True,
+                )
+
+            if return_cells:
+                return in_or_not, cells
+            return in_or_not
+
+        cells = numpy.full(model_points.shape[0], -1, dtype=numpy.int64)
+
         dist2, closest_control_points_ext = self.boundary_face_control_points_kdtree.query(
             model_points, k=1, sqr_dists=True
         )
@@ -2546,14 +2595,20 @@ class Mesh(Stateful, uw_object):
         near_boundary = numpy.where(dist2 < 2 * max_radius**2)[0]
         near_boundary_points = model_points[near_boundary]
 
-        in_or_not[near_boundary] = (
-            self._get_closest_local_cells_internal(near_boundary_points) != -1
-        )
+        cells[near_boundary] = self._get_closest_local_cells_internal(near_boundary_points)
+        in_or_not[near_boundary] = cells[near_boundary] != -1
 
-        if strict_validation:
-            chosen_ones = numpy.where(in_or_not == True)[0]
+        if strict_validation or return_cells:
+            chosen_ones = numpy.where((in_or_not == True) & (cells == -1))[0]
             chosen_points = model_points[chosen_ones]
-            in_or_not[chosen_ones] = self._get_closest_local_cells_internal(chosen_points) != -1
+            cells[chosen_ones] = self._get_closest_local_cells_internal(chosen_points)
+
+        if strict_validation:
+            in_or_not[chosen_ones] = cells[chosen_ones] != -1
+
+        if return_cells:
+            cells[~in_or_not] = -1
+            return in_or_not, cells
 
         return in_or_not
 
@@ -2602,7 +2657,9 @@ class Mesh(Stateful, uw_object):
             # CRITICAL: Must return 1D array, not 2D, for Cython buffer compatibility
             return numpy.array([], dtype=numpy.int64)
 
-    def _get_closest_local_cells_internal(self, coords: numpy.ndarray) -> numpy.ndarray:
+    def _get_closest_local_cells_internal(
+        self, coords: numpy.ndarray, cell_hint: numpy.ndarray = None
+    ) -> numpy.ndarray:
         """
         This method uses a kd-tree algorithm to find the closest
         cells to the provided coords. For a regular mesh, this should
@@ -2617,6 +2674,11 @@ class Mesh(Stateful, uw_object):
             closest cells. This should be a 2-dimensional array of
             shape (n_coords,dim) in any physical unit system (will be auto-converted).
 
+        cell_hint:
+            Optional (n_coords) array of cells to start the search from (e.g.
+            the cells the points occupied before they moved). Negative or
+            out-of-range entries fall back to the kd-tree guess.
+
         Returns:
         --------
         closest_cells:
@@ -2647,11 +2709,23 @@ class Mesh(Stateful, uw_object):
         cells = self._indexMap[closest_points]
         cStart, cEnd = self.dm.getHeightStratum(0)
 
-        inside = self._test_if_points_in_cells_internal(coords, cells)
-        cells[~inside] = -1
-        lost_points = np.where(inside == False)[0]
+        if cell_hint is not None:
+            cell_hint = np.asarray(cell_hint).reshape(-1)
+            hinted = (cell_hint >= 0) & (cell_hint < cEnd - cStart)
+            cells[hinted] = cell_hint[hinted]
+
+        # Part 1 - walk from the starting cell to the one containing the point
+        # (a starting cell that contains the point is returned immediately)
 
-        # Part 2 - try to find the lost points by walking nearby cells
+        cells = self._walk_to_cells_internal(coords, cells)
+        lost_points = np.where(cells == -1)[0]
+
+        # Part 2 - try to find the remaining lost points (outside the local
+        # domain, or on a walk blocked by a non-convex partition boundary)
+        # by testing nearby cells
+
+        if lost_points.shape[0] == 0:
+            return cells
 
         num_local_cells = self._centroids.shape[0]
         num_testable_neighbours = min(num_local_cells, 50)
@@ -2747,6 +2821,57 @@ class Mesh(Stateful, uw_object):
         # Call internal implementation
         return self._get_closest_local_cells_internal(model_coords)
 
+    def locate_points(self, coords: numpy.ndarray, cell_hint: numpy.ndarray = None):
+        """
+        Find the local cell containing each point and the point's coordinates
+        in the reference cell of that element.
+
+        Points are walked through the cell adjacency from a starting cell:
+        the cell given in `cell_hint` (for example, where a particle was
+        before it was advected) or otherwise the kd-tree guess. Points that
+        move less than a cell between calls are located in one or two steps.
+
+        Parameters
+        ----------
+        coords : array-like
+            (n_points, dim) coordinates in any physical unit system
+            (will be auto-converted).
+        cell_hint : array-like, optional
+            (n_points,) previous local cells, -1 where unknown.
+
+        Returns
+        -------
+        cells : numpy.ndarray
+            (n_points,) local cell indices, -1 for points outside the local
+            mesh.
+        reference_coords : numpy.ndarray
+            (n_points, dim) coordinates in the PETSc reference cell
+            ([-1, 1] in each direction), NaN for points not located.
+        """
+        import underworld3 as uw
+        from underworld3.cython.petsc_discretisation import petsc_dmplex_coordinates_to_reference
+
+        model = uw.get_default_model()
+        model_quantity = model.to_model_units(coords)
+
+        # Extract numerical values for internal mesh operations
+        if hasattr(model_quantity, "_pint_qty"):
+            model_coords = model_quantity._pint_qty.magnitude
+        else:
+            model_coords = model_quantity
+
+        model_coords = numpy.ascontiguousarray(model_coords, dtype=numpy.double).reshape(
+            -1, self.cdim
+        )
+
+        if model_coords.shape[0] == 0:
+            return numpy.zeros((0,), dtype=numpy.int64), numpy.zeros((0, self.dim))
+
+        cells = self._get_closest_local_cells_internal(model_coords, cell_hint=cell_hint)
+        reference_coords = petsc_dmplex_coordinates_to_reference(self.dm, cells, model_coords)
+
+        return cells, reference_coords
+
     def _get_mesh_sizes(self, verbose=False):
         """
         Obtain the (local) mesh radii and centroids using kdtree distances
@@ -2758,23 +2883,17 @@ class Mesh(Stateful, uw_object):
 
         import numpy as np
 
-        cStart, cEnd = self.dm.getHeightStratum(0)
-        pStart, pEnd = self.dm.getDepthStratum(0)
-        cell_length = np.empty(centroids.shape[0])
-        cell_min_r = np.empty(centroids.shape[0])
-        cell_r = np.empty(centroids.shape[0])
-
-        for cell in range(cEnd - cStart):
-            cell_num_points = self.dm.getConeSize(cell)
-            cell_points = self.dm.getTransitiveClosure(cell)[0][-cell_num_points:]
-            # Use raw internal array for internal mesh operations (avoid unit-aware wrapping)
-            cell_coords = self._coords[cell_points - pStart]
+        cell_vertices, _, _, _ = self._get_cell_connectivity()
 
-            distsq, _ = centroids_kd_tree.query(cell_coords, k=1, sqr_dists=True)
+        # Distance from every cell vertex to its nearest centroid
+        # Use raw internal array for internal mesh operations (avoid unit-aware wrapping)
+        cell_coords = self._coords[cell_vertices.reshape(-1)]
+        distsq, _ = centroids_kd_tree.query(cell_coords, k=1, sqr_dists=True)
+        distsq = np.asarray(distsq).reshape(cell_vertices.shape)
 
-            cell_length[cell] = np.sqrt(distsq.max())
-            cell_r[cell] = np.sqrt(distsq.mean())
-            cell_min_r[cell] = np.sqrt(distsq.min())
+        cell_length = np.sqrt(distsq.max(axis=1))
+        cell_r = np.sqrt(distsq.mean(axis=1))
+        cell_min_r = np.sqrt(distsq.min(axis=1))
 
         return cell_min_r, cell_r, centroids, cell_length
 
@@ -2800,13 +2919,103 @@ class Mesh(Stateful, uw_object):
 
         return centroids
 
-    def _get_domain_centroids(self):
+    def _get_global_extents(self):
+        """
+        Global mesh radii, bounding box and per-rank domain centroids.
+
+        These change only when the mesh coordinates do, so they are cached
+        (the first call is COLLECTIVE) and invalidated when the mesh is
+        rebuilt or `_increment_mesh_version` is called.
+        """
+
+        if self._global_extents is not None:
+            return self._global_extents
 
         import numpy as np
+        from mpi4py import MPI
+
+        # Use raw internal array (avoid unit-aware wrapping)
+        coords = numpy.asarray(self._coords).reshape(-1, self.cdim)
+
+        # Both bounds in one allreduce (the minima negated)
+        bounds = numpy.concatenate((-coords.min(axis=0), coords.max(axis=0)))
+        uw.mpi.comm.Allreduce(MPI.IN_PLACE, bounds, op=MPI.MAX)
+        min_coords = -bounds[: self.cdim]
+        max_coords = bounds[self.cdim :]
+
+        # One centroid per rank, in rank order
+        domain_centroid = numpy.ascontiguousarray(self._centroids.mean(axis=0), dtype=numpy.double)
+        all_centroids = numpy.empty((uw.mpi.size, domain_centroid.shape[0]), dtype=numpy.double)
+        uw.mpi.comm.Allgather(domain_centroid, all_centroids)
+
+        self._global_extents = {
+            "min_radius": gather_data(self._radii.min(), op="min"),
+            "max_radius": gather_data(self._radii.max(), op="max"),
+            "min_coords": min_coords,
+            "max_coords": max_coords,
+            "domain_centroids": all_centroids,
+        }
+
+        return self._global_extents
+
+    def _get_domain_centroids(self):
+
+        return self._get_global_extents()["domain_centroids"]
+
+    def _get_neighbour_ranks(self):
+        """
+        Ranks whose partitions share at least one mesh point with this one.
+
+        Read from the point SF (the ranks owning our shared points) and made
+        symmetric with one all-to-all of flags, so the owners of shared
+        points also know who shares them. COLLECTIVE.
+        """
+
+        if uw.mpi.size == 1:
+            return numpy.zeros(0, dtype=numpy.int64)
 
-        domain_centroid = self._centroids.mean(axis=0)
-        all_centroids = gather_data(domain_centroid, bcast=True).reshape(-1, self.dim)
-        return all_centroids
+        _, _, remote = self.dm.getPointSF().getGraph()
+        remote = numpy.asarray(remote).reshape(-1, 2)
+
+        shares = numpy.zeros(uw.mpi.size, dtype=bool)
+        shares[remote[:, 0]] = True
+        shared_with_me = numpy.empty_like(shares)
+        uw.mpi.comm.Alltoall(shares, shared_with_me)
+
+        neighbours = numpy.where(shares | shared_with_me)[0]
+        return neighbours[neighbours != uw.mpi.rank].astype(numpy.int64)
+
+    def _get_neighbour_domains(self):
+        """
+        Neighbouring ranks and their (local) bounding boxes.
+
+        Only particle migration needs these, so they are computed on first use
+        (COLLECTIVE) and cached with the global extents.
+
+        Returns
+        -------
+        ranks : numpy.ndarray of int, shape (n,)
+        min_coords, max_coords : numpy.ndarray, shape (n, cdim)
+        """
+
+        if self._neighbour_domains is not None:
+            return self._neighbour_domains
+
+        ranks = self._get_neighbour_ranks()
+
+        # Local bounding box of every rank
+        coords = numpy.asarray(self._coords).reshape(-1, self.cdim)
+        local_box = numpy.concatenate((coords.min(axis=0), coords.max(axis=0)))
+        all_boxes = numpy.empty((uw.mpi.size, local_box.shape[0]), dtype=numpy.double)
+        uw.mpi.comm.Allgather(local_box, all_boxes)
+
+        self._neighbour_domains = (
+            ranks,
+            all_boxes[ranks, : self.cdim],
+            all_boxes[ranks, self.cdim :],
+        )
+
+        return self._neighbour_domains
 
     def get_min_radius_old(self) -> float:
         """
@@ -2835,11 +3044,7 @@ class Mesh(Stateful, uw_object):
         ## Note: The petsc4py version of DMPlexComputeGeometryFVM does not compute all cells and
         ## does not obtain the minimum radius for the mesh.
 
-        import numpy as np
-
-        all_min_radii = uw.utilities.gather_data(np.array((self._radii.min(),)), bcast=True)
-
-        return all_min_radii.min()
+        return self._get_global_extents()["min_radius"]
 
     def get_max_radius(self) -> float:
         """
@@ -2849,11 +3054,7 @@ class Mesh(Stateful, uw_object):
         ## Note: The petsc4py version of DMPlexComputeGeometryFVM does not compute all cells and
         ## does not obtain the minimum radius for the mesh.
 
-        import numpy as np
-
-        all_max_radii = uw.utilities.gather_data(np.array((self._radii.max(),)), bcast=True)
-
-        return all_max_radii.max()
+        return self._get_global_extents()["max_radius"]
 
     # This should be deprecated in favour of using integrals
     def stats(self, uw_function, uw_meshVariable, basis=None):
@@ -2943,6 +3144,8 @@ class Mesh(Stateful, uw_object):
         """
         with self._mesh_update_lock:
             self._mesh_version += 1
+            self._global_extents = None
+            self._neighbour_domains = None
             print(f"Mesh version manually incremented to {self._mesh_version}")
 
     @timing.routine_timer_decorator
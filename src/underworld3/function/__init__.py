@@ -9,8 +9,12 @@ numerical evaluation.
 
 **evaluate** -- Evaluate expressions at mesh/swarm points.
 
+**evaluate_many** -- Evaluate several expressions at the same points in one pass.
+
 **global_evaluate** -- Parallel-safe evaluation gathering results across MPI ranks.
 
+**EvaluationPlan** -- Reusable point ownership for repeated ``global_evaluate`` calls.
+
 **UnderworldFunction** -- Core function evaluation machinery.
 
 **convert_quantity_units**, **make_dimensionless**, **add_units** --
@@ -32,6 +36,7 @@ from ._function import (
     UnderworldFunction,
     global_evaluate_nd as _global_evaluate_nd,
     evaluate_nd as _evaluate_nd,
+    evaluate_many_nd as _evaluate_many_nd,
     dm_swarm_get_migrate_type,
     dm_swarm_set_migrate_type,
     _dmswarm_get_migrate_type,
@@ -59,9 +64,12 @@ from .unit_conversion import (
 # Import clean unit-aware wrapper functions
 from .functions_unit_system import (
     evaluate,
+    evaluate_many,
     global_evaluate,
 )
 
+from .evaluation_plan import EvaluationPlan
+
 
 from .expressions import UWexpression as expression
 from .expressions import UWDerivativeExpression as _derivative_expression
@@ -189,6 +189,56 @@ cdef class CachedDMInterpolationInfo:
         self.use_count += 1
         return outarray
 
+    def evaluate_on(self, DM dm_obj, Vec lvec_obj, np.ndarray[double, ndim=2] outarray):
+        """
+        Evaluate the fields of another DM using this cached structure.
+
+        Used for selective interpolation: `dm_obj` is a sub-DM of the mesh
+        holding only some of its fields (it shares the mesh topology, so the
+        cells located at setup remain valid) and `lvec_obj` is the matching
+        local vector, e.g. a single mesh variable's.
+
+        Parameters
+        ----------
+        dm_obj : DM
+            Sub-DM of the mesh DM
+        lvec_obj : Vec
+            Local vector on `dm_obj`
+        outarray : ndarray (n_points, n_components of dm_obj)
+            Output array to fill with interpolated values
+
+        Returns
+        -------
+        outarray : ndarray
+            Same array, now filled with values
+        """
+        if not self.is_valid:
+            raise RuntimeError("Cannot evaluate with invalid DMInterpolationInfo")
+
+        cdef PetscErrorCode ierr
+        cdef PetscDM dm = dm_obj.dm
+        cdef PetscVec pyfieldvec = lvec_obj.vec
+
+        from petsc4py import PETSc as PyPETSc
+        outvec_py = PyPETSc.Vec().createWithArray(outarray.ravel(), comm=PyPETSc.COMM_SELF)
+        cdef Vec outvec_obj = outvec_py
+        cdef PetscVec outvec = outvec_obj.vec
+
+        # The point location does not depend on the dof count, which only
+        # sizes the output: evaluate with the sub-DM's count, then restore.
+        ierr = DMInterpolationSetDof(self._ipInfo, outarray.shape[1])
+        if ierr == 0:
+            ierr = DMInterpolationEvaluate_UW(self._ipInfo, dm, pyfieldvec, outvec)
+        DMInterpolationSetDof(self._ipInfo, self.dofcount)
+
+        outvec_py.destroy()
+
+        if ierr != 0:
+            raise RuntimeError(f"DMInterpolationEvaluate_UW failed with error {ierr}")
+
+        self.use_count += 1
+        return outarray
+
     def __dealloc__(self):
         """
         Cleanup when Python GC destroys this object.
@@ -219,35 +219,86 @@ class UnderworldFunction(sympy.Function):
 # Shared helper functions for evaluation paths
 # =============================================================================
 
-def _collect_mesh_varfns(mesh):
+def _collect_mesh_varfns(mesh, expr=None):
     """
-    Collect all mesh variable function symbols from a mesh.
+    Collect mesh variable function symbols from a mesh.
 
     Parameters
     ----------
     mesh : Mesh
         The mesh containing variables
+    expr : sympy expression, optional
+        If given, only the functions that appear in `expr` are collected
+        (derivative functions are not included).
 
     Returns
     -------
     set
-        Set of UnderworldAppliedFunction symbols for all mesh variables
+        Set of UnderworldAppliedFunction symbols for the mesh variables
     """
     varfns = set()
-    if mesh is not None and mesh.vars is not None:
-        for v in mesh.vars.values():
-            for sub in v.sym:
-                varfns.add(sub)
+    if mesh is None or mesh.vars is None:
+        return varfns
+
+    if expr is not None:
+        for atom in expr.atoms(UnderworldAppliedFunction):
+            if isinstance(atom, UnderworldAppliedFunctionDeriv):
+                continue
+            if atom.meshvar().mesh is mesh:
+                varfns.add(atom)
+        return varfns
+
+    for v in mesh.vars.values():
+        for sub in v.sym:
+            varfns.add(sub)
     return varfns
 
 
-def _lambdify_and_evaluate(expr, coords, interpolated_results, coord_sys=None, mesh=None):
+def _evaluation_form(expr, mesh=None):
+    """
+    Unwrap an expression for evaluation, keeping constants symbolic.
+
+    Constant UWexpressions (see `_jitextension._extract_constants`) are
+    replaced by the symbols ``uw_const_0, uw_const_1, ...`` and passed to the
+    evaluation kernel as arguments, so that the kernel for a given expression
+    structure can be reused when only the values of constants change.
+
+    Parameters
+    ----------
+    expr : sympy expression
+        Expression to evaluate (may contain UWexpressions)
+    mesh : Mesh, optional
+        Supporting mesh
+
+    Returns
+    -------
+    (sympy expression, ndarray)
+        The unwrapped expression and the current (non-dimensional) values
+        of its constants.
+    """
+    from underworld3.utilities._jitextension import _extract_constants, _pack_constants
+
+    manifest, _ = _extract_constants((expr,), mesh)
+    if manifest:
+        placeholders = {uw_expr: sympy.Symbol(f"uw_const_{idx}") for idx, uw_expr in manifest}
+        expr = expr.xreplace(placeholders)
+
+    ## NOTE: We use _unwrap_expressions directly (not fn_substitute_expressions) to avoid
+    ## applying scaling transformations which would cause double-scaling since PETSc
+    ## already stores non-dimensional values
+    expr = uw.function.expressions._unwrap_expressions(expr, keep_constants=False)
+
+    return expr, _pack_constants(manifest)
+
+
+def _lambdify_and_evaluate(expr, coords, interpolated_results, coord_sys=None, mesh=None, constants=()):
     """
     Substitute interpolated values and evaluate expression via lambdify.
 
     This is the shared final step for both PETSc and RBF evaluation paths.
-    It replaces mesh variable symbols with placeholder symbols, creates a
-    lambdified function, and evaluates it with the interpolated values.
+    The lambdified kernel is cached (see `evaluation_kernel_cache`), keyed by
+    the expression, the set of mesh variable functions and the number of
+    constants, so repeated evaluations only call the kernel.
 
     Parameters
     ----------
@@ -261,26 +312,17 @@ def _lambdify_and_evaluate(expr, coords, interpolated_results, coord_sys=None, m
         Coordinate system to use
     mesh : Mesh, optional
         Mesh for coordinate system fallback
+    constants : sequence of float, optional
+        Values of the ``uw_const_i`` symbols (see `_evaluation_form`)
 
     Returns
     -------
     ndarray
         Evaluated results, shape (n_points, *expr_shape)
     """
-    import string
-    import random
-    from sympy import lambdify
     from sympy.vector import CoordSys3D
+    from underworld3.function.evaluation_kernel_cache import evaluation_kernel_cache
 
-    # 1. Replace mesh variables with random symbol placeholders
-    varfns_symbols = {}
-    for varfn in interpolated_results.keys():
-        randstr = ''.join(random.choices(string.ascii_uppercase, k=5))
-        varfns_symbols[varfn] = sympy.Symbol(randstr)
-
-    subbedexpr = expr.subs(varfns_symbols)
-
-    # 2. Set up coordinate system
     dim = coords.shape[1]
 
     if coord_sys is not None:
@@ -290,9 +332,64 @@ def _lambdify_and_evaluate(expr, coords, interpolated_results, coord_sys=None, m
     else:
         N = mesh.N
 
-    r = N.base_scalars()[0:dim]
+    key = evaluation_kernel_cache.make_key(expr, interpolated_results.keys(), len(constants), dim, N)
+    cached = evaluation_kernel_cache.get_kernel(key)
+
+    if cached is None:
+        lambfn, ordered_varfns = _build_evaluation_kernel(expr, interpolated_results.keys(), len(constants), dim, N)
+        evaluation_kernel_cache.store_kernel(key, lambfn, ordered_varfns)
+    else:
+        lambfn, ordered_varfns = cached
+
+    coords_list = [coords[:, i] for i in range(dim)]
+    results = lambfn(
+        coords_list,
+        [interpolated_results[varfn] for varfn in ordered_varfns],
+        list(constants),
+    )
+
+    # Handle result shape
+    try:
+        shape = expr.shape
+    except AttributeError:
+        shape = (1, 1)
+
+    try:
+        results_shape = results.shape
+    except AttributeError:
+        results_shape = (1, 1)
+
+    # Broadcast constant results to span all coordinates
+    if shape == results_shape:
+        results_new = np.zeros((coords.shape[0], *shape))
+        results_new[...] = results
+        results = results_new
+    else:
+        results = np.moveaxis(results, -1, 0)
 
-    # 2b. Canonicalize coordinate symbols for lambdify.
+    return results.reshape(-1, *shape)
+
+
+def _build_evaluation_kernel(expr, varfns, n_constants, dim, N):
+    """
+    Lambdify `expr` as a function of (coordinates, varfn values, constants).
+
+    Returns
+    -------
+    (callable, tuple)
+        The kernel and the order in which it expects the varfn arrays.
+    """
+    from sympy import lambdify
+
+    # 1. Replace mesh variables with placeholder symbols
+    ordered_varfns = tuple(sorted(varfns, key=str))
+    varfns_symbols = {
+        varfn: sympy.Symbol(f"uw_var_{i}") for i, varfn in enumerate(ordered_varfns)
+    }
+
+    subbedexpr = expr.subs(varfns_symbols)
+
+    # 2. Canonicalize coordinate symbols for lambdify.
     # The expression may contain UWCoordinate objects (from mesh.X or
     # mesh.CoordinateSystem.unit_e_0) alongside BaseScalar objects. Since
     # lambdify uses object identity to map arguments to generated code,
@@ -311,7 +408,6 @@ def _lambdify_and_evaluate(expr, coords, interpolated_results, coord_sys=None, m
                 coord_subs[sym] = coord_dummies[idx]
     if coord_subs:
         subbedexpr = subbedexpr.xreplace(coord_subs)
-    r = coord_dummies
 
     # 3. Handle vector/dyadic expressions
     if isinstance(subbedexpr, sympy.vector.Vector):
@@ -319,39 +415,22 @@ def _lambdify_and_evaluate(expr, coords, interpolated_results, coord_sys=None, m
     elif isinstance(subbedexpr, sympy.vector.Dyadic):
         subbedexpr = subbedexpr.to_matrix(N)[0:dim, 0:dim]
 
-    # 4. Create lambdified function and evaluate
-    lambfn = lambdify((r, varfns_symbols.values()), subbedexpr, docstring_limit=0)
-
-    coords_list = [coords[:, i] for i in range(dim)]
-    results = lambfn(coords_list, interpolated_results.values())
-
-    # 5. Handle result shape
-    try:
-        shape = expr.shape
-    except AttributeError:
-        shape = (1, 1)
-
-    try:
-        results_shape = results.shape
-    except AttributeError:
-        results_shape = (1, 1)
-
-    # Broadcast constant results to span all coordinates
-    if shape == results_shape:
-        results_new = np.zeros((coords.shape[0], *shape))
-        results_new[...] = results
-        results = results_new
-    else:
-        results = np.moveaxis(results, -1, 0)
+    # 4. Create lambdified function
+    constant_symbols = [sympy.Symbol(f"uw_const_{i}") for i in range(n_constants)]
+    lambfn = lambdify(
+        (coord_dummies, list(varfns_symbols.values()), constant_symbols),
+        subbedexpr,
+        docstring_limit=0,
+    )
 
-    return results.reshape(-1, *shape)
+    return lambfn, ordered_varfns
 
 
 def global_evaluate_nd(   expr,
                 coords=None,
                 coord_sys=None,
                 other_arguments=None,
-                simplify=True,
+                simplify=False,
                 verbose=False,
                 evalf=False,
                 rbf=False,
@@ -359,6 +438,7 @@ def global_evaluate_nd(   expr,
                 check_extrapolated=False,
                 force_l2=False,
                 smoothing=1e-6,
+                plan=None,
             ):
 
     """
@@ -392,6 +472,10 @@ def global_evaluate_nd(   expr,
     other_arguments: dict
         Dictionary of other arguments necessary to evaluate function.
         Not yet implemented.
+    plan: underworld3.function.EvaluationPlan, optional
+        Reusable point ownership and communication pattern. The plan is moved
+        to `coords` (only points that changed are re-located) and kept for
+        the next call. Ignored if the expression has no mesh variables.
 
     """
 
@@ -419,108 +503,26 @@ def global_evaluate_nd(   expr,
             smoothing=smoothing,
         )
 
-    # If in parallel, define a swarm, migrate, evaluate, migrate back
-    # (this is the routine used in advection - see ddt.c / SemiLagrangian)
-
-    # Set up a swarm, add a variable to represent the result of the computation and an 'original_rank' variable
-    # so that we can recover the information. We should add a local-index variable so we know how to reorder the
-    # values when the particles come back.
-
-    index = np.array(range(0, coords_array.shape[0])).reshape(-1,1,1)
-
-    evaluation_swarm = uw.swarm.Swarm(mesh)
-
-    original_rank = uw.swarm.SwarmVariable(
-        "rank",
-        evaluation_swarm,
-        vtype=uw.VarType.SCALAR,
-        dtype=int,
-        _proxy=False,
-        varsymbol=r"\cal{R}_o",
-    )
-
-    original_index = uw.swarm.SwarmVariable(
-        "index",
-        evaluation_swarm,
-        vtype=uw.VarType.SCALAR,
-        dtype=int,
-        _proxy=False,
-        varsymbol=r"\cal{I}",
-    )
-
-    is_extrapolated = uw.swarm.SwarmVariable(
-        "is_extrapolated",
-        evaluation_swarm,
-        vtype=uw.VarType.SCALAR,
-        dtype=int,
-        _proxy=False,
-        varsymbol=r"\cal{X}",
-    )
-
-
-    try:
-        expr.shape
-    except AttributeError:
-        expr = sympy.Matrix(((expr,),))
-
-    expr_shape = expr.shape
-
-    data_container = uw.swarm.SwarmVariable(
-        "data",
-        evaluation_swarm,
-        vtype=uw.VarType.MATRIX,
-        size=expr.shape,
-        dtype=float,
-        _proxy=False,
-        varsymbol=r"\cal{D}",
-    )
-
-    # Populate with particles
-
-    points = evaluation_swarm.add_particles_with_global_coordinates(coords_array, migrate=False)
-
-    original_rank.array[...] = uw.mpi.rank
-    original_index.array[...] = index[...]
-
-    index = original_index.array[:,0,0]
-    ranks = original_rank.array[:,0,0]
-
-    evaluation_swarm.migrate(remove_sent_points=True, delete_lost_points=False)
-    local_coords = evaluation_swarm._particle_coordinates.array[...].reshape(-1,evaluation_swarm.dim)
-    values, extrapolated = evaluate_nd(expr, local_coords, rbf=rbf, evalf=evalf, verbose=verbose, check_extrapolated=True,)
+    # Send the points to the ranks that own them, evaluate there, and bring
+    # the values back (this is the routine used in advection - see
+    # ddt.SemiLagrangian, which keeps its plans between timesteps)
 
-    data_container.array[...] = values[...]
-    is_extrapolated.array[:,0,0] = extrapolated[:]
+    from underworld3.function.evaluation_plan import EvaluationPlan
 
-    # set rank to old values and migrate back
-    evaluation_swarm._rank_var.array[...] = original_rank.array[...]
-
-    # Bare bones migration - just move particles, no validation at all
-    # in the BASIC swarm, dm.migrate does not care about whether points
-    # lie inside the domain or not.
-
-    evaluation_swarm.dm.migrate(remove_sent_points=True)
-    uw.mpi.barrier()
-
-    # Invalidate cached data after bare-bones dm.migrate —
-    # particle count and values changed but Swarm.migrate() was bypassed.
-    evaluation_swarm._particle_coordinates._canonical_data = None
-    for var in evaluation_swarm._vars.values():
-        if hasattr(var, "_canonical_data"):
-            var._canonical_data = None
-
-    index = original_index.array[:,0,0]
-
-    return_value = np.empty_like(data_container.array[...])
-    return_value[index,:,:] =  data_container.array[:,:,:]
-
-    return_mask = np.empty_like(is_extrapolated.array[...], dtype=bool)
-    return_mask[index] =  is_extrapolated.array[:]
-
-    if not check_extrapolated:
-        return return_value
+    if plan is None:
+        plan = EvaluationPlan(mesh, coords_array)
+    elif plan.mesh is not mesh:
+        raise ValueError("EvaluationPlan was built for a different mesh than the expression uses.")
     else:
-        return return_value, return_mask
+        plan.update(coords_array)
+
+    return plan.evaluate(
+        expr,
+        rbf=rbf,
+        evalf=evalf,
+        verbose=verbose,
+        check_extrapolated=check_extrapolated,
+    )
 
 
 def _project_to_work_variable(expr, mesh, smoothing=1e-6):
@@ -645,7 +647,7 @@ def _clement_to_work_variable(expr, mesh, derivfns):
     n_nodes = node_coords.shape[0]
 
     # Collect all mesh variable functions in expression
-    varfns = _collect_mesh_varfns(mesh)
+    varfns = _collect_mesh_varfns(mesh, expr)
 
     # Build dictionary of values at nodes for each varfn
     nodal_values = {}
@@ -731,14 +733,17 @@ def evaluate_nd(   expr,
                 coords=None,
                 coord_sys=None,
                 other_arguments=None,
-                simplify=True,
+                simplify=False,
                 verbose=False,
                 evalf=False,
                 rbf=False,
                 data_layout=None,
                 check_extrapolated=False,
                 force_l2=False,
-                smoothing=1e-6):
+                smoothing=1e-6,
+                chunk_size=None,
+                out=None,
+                cell_hint=None):
     """
     Internal: Evaluate expression at coordinates (Cython implementation).
 
@@ -770,6 +775,15 @@ def evaluate_nd(   expr,
     other_arguments: dict
         Dictionary of other arguments necessary to evaluate function.
         Not yet implemented.
+    chunk_size: int, optional
+        Evaluate the points in blocks of this many, so that working memory
+        scales with the block rather than with the number of points.
+    out: numpy.ndarray, optional
+        Array (or ``numpy.memmap``) of shape (n_points, ...) that receives the
+        results block by block. Allocated if not given.
+    cell_hint: numpy.ndarray, optional
+        (n_points,) local cells of the points from an earlier location, -1
+        where unknown. Used as the starting point of the cell search.
     """
 
     # NOTE: Coordinates should be non-dimensional [0-1] at this point
@@ -824,6 +838,12 @@ def evaluate_nd(   expr,
         expr = work_var.sym
         mesh, varfns, _ = uw.function.fn_mesh_vars_in_expression(expr)
 
+    # Streaming: derivatives are resolved (once) above, now evaluate by blocks
+    if (chunk_size is not None or out is not None) and coords_array.shape[0] > 0:
+        return _evaluate_nd_chunked(expr, coords_array, mesh, chunk_size, out,
+                                    coord_sys, simplify, verbose, evalf, rbf,
+                                    data_layout, check_extrapolated, cell_hint)
+
     # If there are no mesh variables, then we have no need of a mesh to
     # help us to evaluate the expression. The evalf / rbf flag will force rbf_evaluation and
     # does not need mesh information either.
@@ -839,13 +859,21 @@ def evaluate_nd(   expr,
                             )
 
     else:
-        in_or_not = mesh.points_in_domain(coords_array, strict_validation=False)
+        if cell_hint is None:
+            in_or_not = mesh.points_in_domain(coords_array, strict_validation=False)
+            interior_cells = None
+        else:
+            in_or_not, cells = mesh.points_in_domain(coords_array, strict_validation=False,
+                                                     cell_hint=cell_hint, return_cells=True)
+            interior_cells = cells[in_or_not]
+
         evaluation_interior = petsc_interpolate( expr,
                                     coords_array[in_or_not],
                                     coord_sys,
                                     mesh,
                                     simplify=simplify,
-                                    verbose=verbose, )
+                                    verbose=verbose,
+                                    cells=interior_cells, )
 
         evaluation_interior = np.atleast_1d(evaluation_interior) # handle case where there is only 1 interior point
 
@@ -903,13 +931,65 @@ def evaluate_nd(   expr,
             return evaluation_1d
 
 
+def _evaluate_nd_chunked(expr, coords_array, mesh, chunk_size, out,
+                         coord_sys, simplify, verbose, evalf, rbf,
+                         data_layout, check_extrapolated, cell_hint=None):
+    """
+    Block-by-block `evaluate_nd` writing into `out`.
+
+    Interpolation structures are built and released per block rather than
+    kept in the mesh DMInterpolation cache (which would otherwise hold one
+    structure per block); the evaluation kernel is shared by all blocks.
+    """
+
+    n_points = coords_array.shape[0]
+    if chunk_size is None:
+        chunk_size = n_points
+    chunk_size = max(1, int(chunk_size))
+
+    if out is not None and out.shape[0] != n_points:
+        raise ValueError(f"`out` has {out.shape[0]} rows but {n_points} points are being evaluated.")
+
+    extrapolated = np.empty(n_points, dtype=bool) if check_extrapolated else None
+
+    cache_enabled = getattr(mesh, "enable_dminterpolation_cache", True)
+    if mesh is not None:
+        mesh.enable_dminterpolation_cache = False
+
+    try:
+        for start in range(0, n_points, chunk_size):
+            stop = min(start + chunk_size, n_points)
+
+            values, chunk_extrapolated = evaluate_nd(expr, coords_array[start:stop], coord_sys,
+                                                     simplify=simplify, verbose=verbose,
+                                                     evalf=evalf, rbf=rbf, data_layout=data_layout,
+                                                     check_extrapolated=True,
+                                                     cell_hint=None if cell_hint is None else cell_hint[start:stop])
+
+            if out is None:
+                out = np.empty((n_points,) + tuple(values.shape[1:]), dtype=np.double)
+
+            out[start:stop, ...] = values
+            if check_extrapolated:
+                extrapolated[start:stop] = chunk_extrapolated
+    finally:
+        if mesh is not None:
+            mesh.enable_dminterpolation_cache = cache_enabled
+
+    if check_extrapolated:
+        return out, extrapolated
+    else:
+        return out
+
+
 def petsc_interpolate(   expr,
                 np.ndarray coords=None,
                 coord_sys=None,
                 mesh=None,
                 other_arguments=None,
-                simplify=True,
-                verbose=False, ):
+                simplify=False,
+                verbose=False,
+                cells=None, ):
     """
     Evaluate a given expression at a list of coordinates.
 
@@ -928,6 +1008,9 @@ def petsc_interpolate(   expr,
     other_arguments: dict
         Dictionary of other arguments necessary to evaluate function.
         Not yet implemented.
+    cells: numpy.ndarray
+        Local cells of `mesh` containing the coordinates (-1 where unknown),
+        passed to the interpolation set-up in place of the kd-tree guesses.
 
     Notes
     -----
@@ -957,8 +1040,6 @@ def petsc_interpolate(   expr,
     if not (isinstance( expr, sympy.Basic ) or isinstance( expr, sympy.Matrix ) ):
         raise RuntimeError("`evaluate()` function parameter `expr` does not appear to be a sympy expression.")
 
-    sympy.core.cache.clear_cache()
-
     if uw.function.fn_is_constant_expr(expr):
 
         constant_value = uw.function.expressions.unwrap(expr, keep_constants=False)
@@ -993,10 +1074,8 @@ def petsc_interpolate(   expr,
             return np.empty([0], dtype=np.double)
 
     ## Substitute any UWExpressions for their values before calculation
-    ## NOTE: We use _unwrap_expressions directly (not fn_substitute_expressions) to avoid
-    ## applying scaling transformations which would cause double-scaling since PETSc
-    ## already stores non-dimensional values
-    expr = uw.function.expressions._unwrap_expressions(expr, keep_constants=False)
+    ## (constants stay symbolic so that the evaluation kernel can be reused)
+    expr, constants = _evaluation_form(expr, mesh)
 
     if simplify:
         expr = sympy.simplify(expr)
@@ -1027,7 +1106,8 @@ def petsc_interpolate(   expr,
     # Usually there will only be a single mesh, but this allows for the
     # more general situation.
 
-    varfns = _collect_mesh_varfns(mesh)
+    # Only the variables the expression refers to are interpolated
+    varfns = _collect_mesh_varfns(mesh, expr)
 
     from collections import defaultdict
     interpolant_varfns = defaultdict(lambda : [])
@@ -1038,10 +1118,11 @@ def petsc_interpolate(   expr,
         interpolant_varfns[varfn.meshvar().mesh].append(varfn)
 
 
-    # 2. Evaluate all mesh variables - there is no real
-    # computational benefit in interpolating a subset.
+    # 2. Interpolate the referenced mesh variables. Each variable is
+    # evaluated from its own local vector through a single-field sub-DM, so
+    # neither the other fields on the mesh nor the mesh-wide lvec are touched.
 
-    def interpolate_vars_on_mesh( varfns, np.ndarray coords ):
+    def interpolate_vars_on_mesh( varfns, np.ndarray coords, known_cells=None ):
         """
         This function performs the interpolation for the given variables
         on a single mesh.
@@ -1073,17 +1154,12 @@ def petsc_interpolate(   expr,
                 mesh._evaluation_interpolated_results = None
 
 
-        # For now, eval over all vars
-        vars = mesh.vars.values()
-
-        cdef DM dm = mesh.dm
+        # The variables referenced by varfns, in field order
+        vars = sorted({varfn.meshvar() for varfn in varfns}, key=lambda v: v.field_id)
+        fields = tuple(var.field_id for var in vars)
 
-        # Get and set total count of dofs
-        dofcount = 0
-        var_start_index = {}
-        for var in vars:
-            var_start_index[var] = dofcount
-            dofcount += var.num_components
+        # Total count of interpolated dofs
+        dofcount = sum(var.num_components for var in vars)
 
         # Make coords contiguous for caching and C access
         coords = np.ascontiguousarray(coords)
@@ -1091,8 +1167,7 @@ def petsc_interpolate(   expr,
         # Early return for empty coordinate arrays
         # CRITICAL: Avoid DMInterpolation setup with zero points
         if len(coords) == 0:
-            # Return empty array with correct shape: (0, dofcount)
-            return np.empty([0, dofcount], dtype=np.double)
+            return {varfn: np.empty([0], dtype=np.double) for varfn in varfns}
 
         # === DMInterpolation CACHING ===
         # Declare variables at function scope (Cython requirement)
@@ -1102,23 +1177,22 @@ def petsc_interpolate(   expr,
         from underworld3.function._dminterp_wrapper import CachedDMInterpolationInfo
 
         # coords is already np.ndarray type in petsc_interpolate function signature
-        cached_info = mesh._dminterpolation_cache.get_structure(coords, dofcount)
-
-        # Create output array
-        cdef np.ndarray outarray = np.empty([len(coords), dofcount], dtype=np.double)
-
-        if cached_info is not None:
-            # CACHE HIT - Fast path. Evaluate using cached structure
-            mesh.update_lvec()  # Ensure fresh values
-            cached_info.evaluate(mesh, outarray)
+        cached_info = mesh._dminterpolation_cache.get_structure(coords, dofcount, fields)
 
-        else:
+        if cached_info is None:
             # CACHE MISS - Create structure and cache it
             cached_info = CachedDMInterpolationInfo()
 
             # Get cell hints
             # coords is already np.ndarray type (function signature ensures this)
-            cells = mesh.get_closest_cells(coords)
+            # (only points without a known cell go through the kd-tree)
+            if known_cells is None:
+                cells = mesh.get_closest_cells(coords)
+            else:
+                cells = np.array(known_cells, dtype=np.int64)
+                unknown = cells < 0
+                if np.any(unknown):
+                    cells[unknown] = mesh.get_closest_cells(coords[unknown])
 
             # Create and set up DMInterpolation structure (EXPENSIVE)
             try:
@@ -1134,11 +1208,18 @@ def petsc_interpolate(   expr,
 
             # Store in cache for reuse
             # coords is already np.ndarray type (function signature ensures this)
-            mesh._dminterpolation_cache.store_structure(coords, dofcount, cached_info)
+            mesh._dminterpolation_cache.store_structure(coords, dofcount, cached_info, fields)
 
-            # Evaluate
-            mesh.update_lvec()
-            cached_info.evaluate(mesh, outarray)
+        # Evaluate each variable from its own local vector (fresh values)
+        var_arrays = {}
+        for var in vars:
+            # Create the local vector if needed, leaving the access state alone
+            if var._lvec is None:
+                var._set_vec(available=var._available)
+            subdm = mesh._dminterpolation_cache.get_field_dm(var.field_id)
+            var_out = np.empty([len(coords), var.num_components], dtype=np.double)
+            cached_info.evaluate_on(subdm, var._lvec, var_out)
+            var_arrays[var] = var_out
         # === END CACHING ===
 
         # Create map between array slices and variable functions
@@ -1147,8 +1228,7 @@ def petsc_interpolate(   expr,
         for varfn in varfns:
             var  = varfn.meshvar()
             comp = varfn.component
-            var_start = var_start_index[var]
-            arr = np.ascontiguousarray(outarray[:,var_start+comp])
+            arr = np.ascontiguousarray(var_arrays[var][:, comp])
             varfns_arrays[varfn] = arr
 
         # Cache these results
@@ -1164,7 +1244,9 @@ def petsc_interpolate(   expr,
     # Get map of all variable functions
     interpolated_results = {}
     for key, vals in interpolant_varfns.items():
-        interpolated_var_values = interpolate_vars_on_mesh(vals, coords)
+        # Cell hints refer to the local cells of `mesh` only
+        known_cells = np.asarray(cells, dtype=np.int64) if (cells is not None and key is mesh) else None
+        interpolated_var_values = interpolate_vars_on_mesh(vals, coords, known_cells)
         interpolated_results.update(interpolated_var_values)
 
     # NOTE: Derivative handling is done in evaluate_nd before this function is called.
@@ -1174,13 +1256,89 @@ def petsc_interpolate(   expr,
     #   - gradient_evaluation.compute_clement_gradient_at_nodes(var)
 
     # Symbol substitution, lambdify, and evaluate (shared with rbf_evaluate)
-    return _lambdify_and_evaluate(expr, coords, interpolated_results, coord_sys, mesh)
+    return _lambdify_and_evaluate(expr, coords, interpolated_results, coord_sys, mesh, constants)
 
 # Go ahead and substitute for the timed version.
 # Note that we don't use the @decorator sugar here so that
 # we can pass in the `class_name` parameter.
 evaluate_nd = timing.routine_timer_decorator(routine=evaluate_nd, class_name="Function")
 
+
+def evaluate_many_nd(   exprs,
+                coords=None,
+                coord_sys=None,
+                simplify=False,
+                verbose=False,
+                evalf=False,
+                rbf=False,
+                force_l2=False,
+                smoothing=1e-6):
+    """
+    Internal: Evaluate several expressions at the same coordinates.
+
+    Users should typically use :func:`underworld3.function.evaluate_many`.
+
+    Expressions on the same mesh are stacked into one row matrix and passed
+    through `evaluate_nd` once, so domain classification, interpolation of
+    the (union of) mesh variables and the evaluation kernel are shared.
+    Expressions with derivatives, or all expressions if `force_l2` is set,
+    are projected individually as `evaluate_nd` would.
+
+    Parameters
+    ----------
+    exprs: list of sympy.Basic
+        Expressions requiring evaluation.
+    coords: numpy.ndarray
+        Non-dimensional coordinates (shape: n_points x n_dims).
+
+    Returns
+    -------
+    list of numpy.ndarray
+        One array of shape (n_points, rows, cols) per expression.
+    """
+
+    coords_array = np.array(coords, dtype=np.double, copy=False).view(np.ndarray)
+
+    results = [None] * len(exprs)
+    batches = {}  # mesh -> [(index, Matrix expression)]
+
+    for i, expr in enumerate(exprs):
+        try:
+            expr.shape
+        except AttributeError:
+            expr = sympy.Matrix(((expr,),))
+
+        mesh, varfns, derivfns = uw.function.fn_mesh_vars_in_expression(expr)
+
+        if (derivfns and mesh is not None) or force_l2:
+            results[i] = evaluate_nd(expr, coords_array, coord_sys,
+                                     simplify=simplify, verbose=verbose, evalf=evalf, rbf=rbf,
+                                     force_l2=force_l2, smoothing=smoothing)
+        else:
+            batches.setdefault(mesh, []).append((i, sympy.Matrix(expr)))
+
+    # Expressions without mesh variables can ride along with any mesh
+    if None in batches and len(batches) > 1:
+        unbound = batches.pop(None)
+        batches[next(iter(batches))].extend(unbound)
+
+    for mesh, members in batches.items():
+        stacked = sympy.Matrix([[component for _, expr in members for component in expr]])
+
+        values = evaluate_nd(stacked, coords_array, coord_sys,
+                             simplify=simplify, verbose=verbose, evalf=evalf, rbf=rbf)
+        values = values.reshape(coords_array.shape[0], stacked.shape[1])
+
+        start = 0
+        for i, expr in members:
+            size = expr.shape[0] * expr.shape[1]
+            results[i] = values[:, start:start + size].reshape((coords_array.shape[0],) + expr.shape)
+            start += size
+
+    return results
+
+evaluate_many_nd = timing.routine_timer_decorator(routine=evaluate_many_nd, class_name="Function")
+
 ### ------------------------------
 
 def rbf_evaluate(  expr,
@@ -1189,7 +1347,7 @@ def rbf_evaluate(  expr,
             mesh=None,
             other_arguments=None,
             verbose=False,
-            simplify=True,):
+            simplify=False,):
     """
     Evaluate a given expression at a list of coordinates.
 
@@ -1239,8 +1397,6 @@ def rbf_evaluate(  expr,
     if not (isinstance( expr, sympy.Basic ) or isinstance( expr, sympy.Matrix ) ):
         raise RuntimeError("`evaluate()` function parameter `expr` does not appear to be a sympy expression.")
 
-    sympy.core.cache.clear_cache()
-
     if uw.function.fn_is_constant_expr(expr):
         constant_value = uw.function.expressions.unwrap(expr, keep_constants=False)
         return np.multiply.outer(np.ones(coords.shape[0]), np.array(constant_value, dtype=float))
@@ -1263,9 +1419,8 @@ def rbf_evaluate(  expr,
 
 
     ## Substitute any uw_expressions for their values before calculation
-    ## NOTE: Use _unwrap_expressions (not fn_substitute_expressions) to avoid
-    ## double-scaling - same fix as petsc_interpolate
-    expr = uw.function.expressions._unwrap_expressions(expr, keep_constants=False)
+    ## (constants stay symbolic - same as petsc_interpolate)
+    expr, constants = _evaluation_form(expr, mesh)
 
     if simplify:
         expr = sympy.simplify(expr)
@@ -1282,8 +1437,8 @@ def rbf_evaluate(  expr,
             pass
 
 
-    # 2. Collect and evaluate all mesh variables via RBF interpolation
-    varfns = _collect_mesh_varfns(mesh)
+    # 2. Collect and evaluate the referenced mesh variables via RBF interpolation
+    varfns = _collect_mesh_varfns(mesh, expr)
 
     interpolated_results = {}
     for varfn in varfns:
@@ -1294,7 +1449,7 @@ def rbf_evaluate(  expr,
             print(f"{varfn} = {parent.name}[{component}]")
 
     # 3. Symbol substitution, lambdify, and evaluate (shared with petsc_interpolate)
-    return _lambdify_and_evaluate(expr, coords, interpolated_results, coord_sys, mesh)
+    return _lambdify_and_evaluate(expr, coords, interpolated_results, coord_sys, mesh, constants)
 
 
 # Go ahead and substitute for the timed version.
@@ -5,10 +5,13 @@ Caches DMInterpolation structures to avoid repeated expensive setup operations.
 
 Key insight: DMInterpolation structure depends on:
 - Coordinates (where to interpolate)
-- DOF count (how many variables)
+- DOF count and field selection (which variables are interpolated)
 
 Does NOT depend on variable values! Those are fetched fresh each time.
 
+Evaluation only interpolates the fields an expression references, each from
+its own single-field sub-DM; those sub-DMs are cached here as well.
+
 Control caching via mesh flag:
     mesh.enable_dminterpolation_cache = False  # Disable for this mesh
 
@@ -25,16 +28,20 @@ class DMInterpolationCache:
     """
     Per-mesh cache for DMInterpolation structures.
 
-    Cache key: (coord_hash, dofcount)
+    Cache key: (coord_hash, dofcount, fields)
     Cache value: CachedDMInterpolationInfo object (Cython wrapper)
 
+    `fields` is the tuple of PETSc field ids being interpolated (None for
+    all fields of the mesh DM).
+
     Automatically tracks hits, misses, and invalidations.
     """
 
     def __init__(self, mesh, name: str = "default"):
         self.mesh = mesh
         self.name = name
-        self._cache: Dict[Tuple[int, int], object] = {}  # Stores CachedDMInterpolationInfo
+        self._cache: Dict[Tuple[int, int, Optional[tuple]], object] = {}  # Stores CachedDMInterpolationInfo
+        self._field_dms: Dict[int, tuple] = {}  # field_id -> (IS, sub-DM)
 
         # Statistics
         self._stats = {
@@ -50,7 +57,7 @@ class DMInterpolationCache:
         # Check mesh flag (default: True)
         return getattr(self.mesh, 'enable_dminterpolation_cache', True)
 
-    def get_structure(self, coords: np.ndarray, dofcount: int):
+    def get_structure(self, coords: np.ndarray, dofcount: int, fields: Optional[tuple] = None):
         """
         Get cached CachedDMInterpolationInfo or None.
 
@@ -59,7 +66,9 @@ class DMInterpolationCache:
         coords : ndarray
             Evaluation coordinates
         dofcount : int
-            Total DOF count for current variables
+            Total DOF count for the interpolated variables
+        fields : tuple of int, optional
+            Field ids being interpolated (None: all fields)
 
         Returns
         -------
@@ -71,7 +80,7 @@ class DMInterpolationCache:
 
         # Compute cache key
         coords_hash = self._hash_coords(coords)
-        key = (coords_hash, dofcount)
+        key = (coords_hash, dofcount, fields)
 
         # Check cache
         if key in self._cache:
@@ -85,7 +94,7 @@ class DMInterpolationCache:
             self._stats['misses'] += 1
             return None
 
-    def store_structure(self, coords: np.ndarray, dofcount: int, cached_info):
+    def store_structure(self, coords: np.ndarray, dofcount: int, cached_info, fields: Optional[tuple] = None):
         """
         Store CachedDMInterpolationInfo in cache.
 
@@ -97,12 +106,14 @@ class DMInterpolationCache:
             Total DOF count
         cached_info : CachedDMInterpolationInfo
             Cython wrapper object containing DMInterpolation structure
+        fields : tuple of int, optional
+            Field ids being interpolated (None: all fields)
         """
         if not self._is_enabled():
             return  # Don't cache if disabled
 
         coords_hash = self._hash_coords(coords)
-        key = (coords_hash, dofcount)
+        key = (coords_hash, dofcount, fields)
 
         self._cache[key] = cached_info  # Python GC keeps it alive
 
@@ -117,6 +128,21 @@ class DMInterpolationCache:
         xxh.update(np.ascontiguousarray(coords))
         return xxh.intdigest()
 
+    def get_field_dm(self, field_id: int):
+        """
+        Single-field sub-DM of the mesh DM for selective interpolation.
+
+        Created on first use and kept until the mesh DM is rebuilt
+        (see `invalidate_all`).
+        """
+        entry = self._field_dms.get(field_id)
+        if entry is None:
+            iset, subdm = self.mesh.dm.createSubDM(field_id)
+            entry = (iset, subdm)
+            self._field_dms[field_id] = entry
+
+        return entry[1]
+
     def invalidate_all(self, reason: str = "manual"):
         """
         Clear entire cache and destroy all DMInterpolation structures.
@@ -130,11 +156,17 @@ class DMInterpolationCache:
 
         self._cache.clear()
 
+        # Sub-DMs refer to the old mesh DM
+        for iset, subdm in self._field_dms.values():
+            iset.destroy()
+            subdm.destroy()
+        self._field_dms.clear()
+
     def invalidate_coords(self, coords: np.ndarray):
         """Invalidate all cache entries for specific coordinates."""
         coords_hash = self._hash_coords(coords)
 
-        # Remove all entries with this coord hash (different dofcounts)
+        # Remove all entries with this coord hash (different dofcounts / fields)
         keys_to_remove = [k for k in self._cache.keys() if k[0] == coords_hash]
 
         for key in keys_to_remove:
@@ -0,0 +1,128 @@
+"""
+Evaluation Kernel Caching System
+
+Caches the lambdified kernels used by ``uw.function.evaluate`` so that
+repeated evaluation of the same expression (e.g. the velocity at swarm
+points every timestep) does not repeat the symbolic work.
+
+Key insight: the generated kernel depends on:
+- The structural form of the expression (constants replaced by symbols)
+- The set of mesh-variable functions that are passed in as arrays
+- The coordinate system and dimension
+
+Does NOT depend on the values of constants or mesh variables! Those are
+passed to the kernel as arguments on each call.
+
+The cache is process-wide and bounded (least recently used kernels are
+dropped first).
+"""
+
+from collections import OrderedDict
+
+import sympy
+
+
+class EvaluationKernelCache:
+    """
+    Process-wide cache of lambdified evaluation kernels.
+
+    Cache key: (expression, frozenset(varfns), n_constants, dim, coord_sys)
+    Cache value: (kernel, ordered varfns)
+
+    Automatically tracks hits, misses and evictions.
+    """
+
+    def __init__(self, name: str = "evaluate", max_entries: int = 256):
+        self.name = name
+        self.max_entries = max_entries
+        self.enabled = True
+        self._cache = OrderedDict()
+        self.reset_stats()
+
+    @staticmethod
+    def make_key(expr, varfns, n_constants, dim, coord_sys):
+        # Mutable matrices are not hashable
+        if isinstance(expr, sympy.MatrixBase):
+            expr = sympy.ImmutableMatrix(expr)
+        return (expr, frozenset(varfns), n_constants, dim, coord_sys)
+
+    def get_kernel(self, key):
+        """
+        Get the cached (kernel, ordered varfns) for `key`, or None.
+        """
+        if not self.enabled:
+            return None
+
+        entry = self._cache.get(key)
+        if entry is None:
+            self._stats['misses'] += 1
+            return None
+
+        self._cache.move_to_end(key)
+        self._stats['hits'] += 1
+        return entry
+
+    def store_kernel(self, key, kernel, ordered_varfns):
+        """Store a kernel and the order in which it expects the varfn arrays."""
+        if not self.enabled:
+            return
+
+        self._cache[key] = (kernel, ordered_varfns)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def clear(self):
+        """Drop all cached kernels."""
+        self._cache.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Get cache performance statistics.
+
+        Returns
+        -------
+        dict with metrics:
+            - requests: Total lookups
+            - hits: Cache hits
+            - misses: Cache misses (a kernel was generated)
+            - hit_rate: Fraction of hits
+            - entries: Current cache size
+            - evictions: Kernels dropped to respect max_entries
+        """
+        total_requests = self._stats['hits'] + self._stats['misses']
+
+        return {
+            'requests': total_requests,
+            'hits': self._stats['hits'],
+            'misses': self._stats['misses'],
+            'hit_rate': self._stats['hits'] / total_requests if total_requests > 0 else 0.0,
+            'entries': len(self._cache),
+            'evictions': self._stats['evictions'],
+        }
+
+    def print_stats(self):
+        """Print cache statistics (user-facing)."""
+        stats = self.get_stats()
+
+        print(f"\n{'=' * 60}")
+        print(f"Evaluation Kernel Cache Statistics: {self.name}")
+        print(f"{'=' * 60}")
+        print(f"Requests:      {stats['requests']:>10,}")
+        print(f"  Hits:        {stats['hits']:>10,}  ({stats['hit_rate']*100:>5.1f}%)")
+        print(f"  Misses:      {stats['misses']:>10,}")
+        print(f"Cache entries: {stats['entries']:>10,}")
+        print(f"Evictions:     {stats['evictions']:>10,}")
+        print(f"{'=' * 60}\n")
+
+    def reset_stats(self):
+        """Reset statistics (but keep cached kernels)."""
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+        }
+
+
+evaluation_kernel_cache = EvaluationKernelCache()
@@ -0,0 +1,331 @@
+"""
+Persistent Parallel Evaluation Plans
+
+An ``EvaluationPlan`` remembers which MPI rank owns each of a set of
+evaluation points, and the permutation used to send the points to their
+owners and the results back. ``global_evaluate`` builds a throw-away plan on
+every call; code that evaluates repeatedly at the same (or slowly moving)
+points, such as the semi-Lagrangian history update, keeps one and passes it
+in so that each evaluation is a single scatter-evaluate-gather.
+
+Key insight: ownership depends only on the coordinates and the mesh
+decomposition, not on the expression or on field values. Therefore:
+
+- Same coordinates: no point location at all; the owners also see the same
+  local coordinates, so their DMInterpolation structure is a cache hit.
+- Moved coordinates: only the moved points are re-checked, by their current
+  owner. Points that left their owner's domain are located again. Owners
+  find the new cells by walking from the cells of the previous evaluation.
+- Mesh changed (``mesh._mesh_version``): everything is located again.
+
+Points that no rank claims are evaluated (extrapolated) on the rank that
+supplied them, as the swarm-based migration did.
+
+Usage:
+    plan = EvaluationPlan(mesh)
+    values = uw.function.global_evaluate(expr, coords, plan=plan)
+
+Note: all plan operations are COLLECTIVE - every rank must call them.
+"""
+
+import numpy as np
+import sympy
+from mpi4py import MPI
+
+import underworld3 as uw
+
+
+class EvaluationPlan:
+    """
+    Cached ownership and communication pattern for parallel evaluation.
+
+    Coordinates are non-dimensional (the contract of ``global_evaluate_nd``).
+
+    Parameters
+    ----------
+    mesh : Mesh
+        The mesh whose decomposition decides point ownership.
+    coords : numpy.ndarray, optional
+        Initial evaluation points, shape (n_points, dim).
+    max_its : int
+        Number of nearest domain centroids tried when locating a point.
+    """
+
+    def __init__(self, mesh, coords=None, max_its: int = 10):
+        self.mesh = mesh
+        self.max_its = max_its
+
+        self._coords = None
+        self._mesh_version = None
+        self._owner = None  # owning rank of each local point
+        self._order = None  # local points sorted by owner
+        self._send_counts = None
+        self._recv_counts = None
+        self._owned_coords = None  # points this rank evaluates
+        self._owned_cells = None  # their local cells (-1 outside the domain)
+        self._owned_cells_current = False
+
+        self.reset_stats()
+
+        if coords is not None:
+            self.update(coords)
+
+    @property
+    def n_points(self) -> int:
+        """Number of evaluation points supplied by this rank."""
+        return 0 if self._coords is None else self._coords.shape[0]
+
+    @property
+    def owned_coords(self) -> np.ndarray:
+        """Points (from all ranks) that this rank evaluates."""
+        return self._owned_coords
+
+    def update(self, coords):
+        """
+        Move the plan to new coordinates (collective).
+
+        If the number of points is unchanged, only points whose coordinates
+        changed are re-checked; otherwise the plan is rebuilt.
+        """
+        coords = np.ascontiguousarray(coords, dtype=np.double).reshape(-1, self.mesh.dim)
+        mesh_version = getattr(self.mesh, "_mesh_version", None)
+
+        # Collective decision: all ranks must take the same branch
+        rebuild = (
+            self._coords is None
+            or coords.shape[0] != self._coords.shape[0]
+            or mesh_version != self._mesh_version
+        )
+        rebuild = uw.mpi.comm.allreduce(rebuild, op=MPI.LOR)
+
+        if rebuild:
+            self._coords = coords.copy()
+            self._mesh_version = mesh_version
+            self._owner = np.full(coords.shape[0], uw.mpi.rank, dtype=np.int64)
+            self._owned_cells = None
+            self._locate(np.arange(coords.shape[0]))
+            self._stats['rebuilds'] += 1
+        else:
+            moved = np.where(np.any(coords != self._coords, axis=1))[0]
+            if not uw.mpi.comm.allreduce(moved.shape[0], op=MPI.SUM):
+                self._stats['reuses'] += 1
+                return
+
+            self._coords[moved] = coords[moved]
+            claimed = self._claim(moved, self._owner[moved])
+            self._locate(moved[~claimed])
+            self._stats['updates'] += 1
+
+        self._build_exchange()
+
+    def evaluate(self, expr, rbf=False, evalf=False, verbose=False, check_extrapolated=False):
+        """
+        Evaluate `expr` at the plan's points (collective).
+
+        Returns
+        -------
+        values : numpy.ndarray
+            Shape (n_points, rows, cols), in the order the points were given.
+        extrapolated : numpy.ndarray of bool
+            Only if `check_extrapolated` is set.
+        """
+        from ._function import evaluate_nd
+
+        if self._coords is None:
+            raise RuntimeError("EvaluationPlan has no coordinates - call update(coords) first.")
+
+        if getattr(self.mesh, "_mesh_version", None) != self._mesh_version:
+            coords = self._coords
+            self._coords = None
+            self.update(coords)
+
+        try:
+            expr.shape
+        except AttributeError:
+            expr = sympy.Matrix(((expr,),))
+
+        values, extrapolated = evaluate_nd(
+            expr,
+            self._owned_coords,
+            rbf=rbf,
+            evalf=evalf,
+            verbose=verbose,
+            check_extrapolated=True,
+            cell_hint=None if (rbf or evalf) else self._get_owned_cells(),
+        )
+
+        # Values and extrapolation flags travel back together
+        n_owned = self._owned_coords.shape[0]
+        width = expr.shape[0] * expr.shape[1]
+        payload = np.empty((n_owned, width + 1), dtype=np.double)
+        payload[:, :-1] = np.asarray(values, dtype=np.double).reshape(n_owned, width)
+        payload[:, -1] = np.asarray(extrapolated).reshape(n_owned)
+
+        returned = self._exchange(payload, self._recv_counts, self._send_counts)
+
+        result = np.empty((self.n_points, width + 1), dtype=np.double)
+        result[self._order] = returned
+
+        self._stats['evaluations'] += 1
+
+        return_value = result[:, :-1].reshape(self.n_points, *expr.shape)
+        if not check_extrapolated:
+            return return_value
+        else:
+            return return_value, result[:, -1] != 0.0
+
+    def _get_owned_cells(self):
+        """Local cells of the owned points, located once per set of coordinates."""
+        if not self._owned_cells_current:
+            _, self._owned_cells = self.mesh.points_in_domain(
+                self._owned_coords,
+                strict_validation=False,
+                cell_hint=self._owned_cells,
+                return_cells=True,
+            )
+            self._owned_cells_current = True
+            self._stats['cell_updates'] += 1
+
+        return self._owned_cells
+
+    def _claim(self, indices, ranks):
+        """
+        Ask `ranks` whether they own the local points `indices`.
+
+        Returns a boolean array: True where the asked rank claimed the point.
+        """
+        claimed = np.zeros(indices.shape[0], dtype=bool)
+
+        mine = ranks == uw.mpi.rank
+        if np.any(mine):
+            claimed[mine] = self.mesh.points_in_domain(self._coords[indices[mine]])
+
+        if uw.mpi.size == 1:
+            return claimed
+
+        others = np.where(~mine)[0]
+        order = others[np.argsort(ranks[others], kind="stable")]
+        send_counts = np.bincount(ranks[order], minlength=uw.mpi.size)
+        recv_counts = np.array(uw.mpi.comm.alltoall(send_counts.tolist()), dtype=np.int64)
+
+        queries = self._exchange(self._coords[indices[order]], send_counts, recv_counts)
+        answers = np.zeros((queries.shape[0], 1), dtype=np.double)
+        if queries.shape[0] > 0:
+            answers[:, 0] = self.mesh.points_in_domain(queries)
+
+        replies = self._exchange(answers, recv_counts, send_counts)
+        claimed[order] = replies[:, 0] != 0.0
+
+        return claimed
+
+    def _locate(self, indices):
+        """Find owners for the local points `indices` (collective)."""
+        unclaimed = indices
+        if unclaimed.shape[0] > 0:
+            in_domain = self.mesh.points_in_domain(self._coords[unclaimed])
+            self._owner[unclaimed[in_domain]] = uw.mpi.rank
+            unclaimed = unclaimed[~in_domain]
+
+        if uw.mpi.size > 1:
+            centroids = self.mesh._get_domain_centroids()
+            mesh_domain_kdtree = uw.kdtree.KDTree(centroids)
+
+            # Try the closest domains first, as Swarm.migrate does
+            for it in range(0, min(self.max_its, uw.mpi.size)):
+                if not uw.mpi.comm.allreduce(unclaimed.shape[0], op=MPI.SUM):
+                    break
+
+                candidates = np.empty(unclaimed.shape[0], dtype=np.int64)
+                if unclaimed.shape[0] > 0:
+                    dist, rank = mesh_domain_kdtree.query(
+                        self._coords[unclaimed], k=it + 1, sqr_dists=False
+                    )
+                    candidates[:] = rank.reshape(-1, it + 1)[:, it]
+
+                # This rank has already answered for its own domain
+                ask = candidates != uw.mpi.rank
+                claimed = np.zeros(unclaimed.shape[0], dtype=bool)
+                claimed[ask] = self._claim(unclaimed[ask], candidates[ask])
+
+                self._owner[unclaimed[claimed]] = candidates[claimed]
+                unclaimed = unclaimed[~claimed]
+
+        # Lost points are extrapolated by the rank that supplied them
+        self._owner[unclaimed] = uw.mpi.rank
+        self._stats['located'] += indices.shape[0]
+        self._stats['lost'] += unclaimed.shape[0]
+
+    def _build_exchange(self):
+        """Send permutation, counts, and the coordinates each owner evaluates."""
+        self._order = np.argsort(self._owner, kind="stable")
+        self._send_counts = np.bincount(self._owner, minlength=uw.mpi.size)
+
+        if uw.mpi.size == 1:
+            self._recv_counts = self._send_counts.copy()
+        else:
+            self._recv_counts = np.array(
+                uw.mpi.comm.alltoall(self._send_counts.tolist()), dtype=np.int64
+            )
+
+        self._owned_coords = self._exchange(
+            self._coords[self._order], self._send_counts, self._recv_counts
+        )
+
+        # The previous cells stay as hints (stale or -1 entries are harmless)
+        if self._owned_cells is not None and self._owned_cells.shape[0] != self._owned_coords.shape[0]:
+            self._owned_cells = None
+        self._owned_cells_current = False
+
+    @staticmethod
+    def _exchange(data, send_counts, recv_counts):
+        """All-to-all of the rows of `data` (grouped by destination rank)."""
+        data = np.ascontiguousarray(data, dtype=np.double)
+        width = data.shape[1]
+
+        if uw.mpi.size == 1:
+            return data.copy()
+
+        send_counts = np.asarray(send_counts, dtype=np.int64) * width
+        recv_counts = np.asarray(recv_counts, dtype=np.int64) * width
+        send_displs = np.concatenate(([0], np.cumsum(send_counts)[:-1]))
+        recv_displs = np.concatenate(([0], np.cumsum(recv_counts)[:-1]))
+
+        received = np.empty((recv_counts.sum() // width, width), dtype=np.double)
+        uw.mpi.comm.Alltoallv(
+            [data, (send_counts, send_displs), MPI.DOUBLE],
+            [received, (recv_counts, recv_displs), MPI.DOUBLE],
+        )
+
+        return received
+
+    def get_stats(self) -> dict:
+        """
+        Get plan statistics for this rank.
+
+        Returns
+        -------
+        dict with metrics:
+            - rebuilds: Full ownership computations
+            - updates: Incremental updates (some points moved)
+            - reuses: Updates with unchanged coordinates
+            - evaluations: Scatter-evaluate-gather passes
+            - located: Points run through the full location search
+            - lost: Points no rank claimed (extrapolated locally)
+            - cell_updates: Cell searches for the owned points
+            - owned: Points this rank currently evaluates
+        """
+        stats = dict(self._stats)
+        stats['owned'] = 0 if self._owned_coords is None else self._owned_coords.shape[0]
+        return stats
+
+    def reset_stats(self):
+        """Reset statistics (but keep the plan)."""
+        self._stats = {
+            'rebuilds': 0,
+            'updates': 0,
+            'reuses': 0,
+            'evaluations': 0,
+            'located': 0,
+            'lost': 0,
+            'cell_updates': 0,
+        }
@@ -11,7 +11,7 @@ Architecture:
   - Contract: Expects plain numpy arrays in [0-1] space, returns [0-1] results
 
 - Python wrapper layer (this module): Handles ALL unit conversions
-  - Functions: evaluate(), global_evaluate()
+  - Functions: evaluate(), evaluate_many(), global_evaluate()
   - Responsibilities:
     1) Convert dimensional coords → non-dimensional [0-1]
     2) Call Cython functions with plain arrays
@@ -35,7 +35,7 @@ def evaluate(
     coords,
     coord_sys=None,
     other_arguments=None,
-    simplify=True,
+    simplify=False,
     verbose=False,
     evalf=False,
     mode="default",
@@ -45,6 +45,9 @@ def evaluate(
     # Expert overrides (override mode settings)
     rbf=None,
     force_l2=None,
+    chunk_size=None,
+    out=None,
+    cell_hint=None,
 ):
     """
     Evaluate expression at coordinates with automatic unit handling.
@@ -66,7 +69,9 @@ def evaluate(
     other_arguments : dict, optional
         Additional arguments for evaluation (default: None)
     simplify : bool, optional
-        Whether to simplify expression (default: True)
+        Whether to run ``sympy.simplify`` on the expression before evaluation
+        (default: False). Evaluation kernels are cached, so this is rarely
+        worth its cost.
     verbose : bool, optional
         Verbose output (default: False)
     evalf : bool, optional
@@ -88,6 +93,19 @@ def evaluate(
         Expert override: Force RBF interpolation everywhere. Overrides mode.
     force_l2 : bool, optional
         Expert override: Force L2 projection path. Overrides mode.
+    chunk_size : int, optional
+        Streaming mode: evaluate the points in blocks of this many. Working
+        memory then scales with the block size rather than the number of
+        points (derivative projections are still done once, up front).
+    out : ndarray, optional
+        Array of shape (n_points, rows, cols) - for example a
+        ``numpy.lib.format.open_memmap`` file - that receives the results
+        block by block (implies streaming). It is returned, viewed as a
+        UnitAwareArray if the expression has units.
+    cell_hint : ndarray, optional
+        Local mesh cell of each point from an earlier location (for example
+        a swarm's particle cells). Points are located by walking from these
+        cells instead of searching the whole mesh; -1 marks unknown cells.
 
     Returns
     -------
@@ -125,23 +143,7 @@ def evaluate(
     from .expressions import UWexpression
 
     # Map mode to internal flags (rbf, force_l2)
-    # Expert overrides take precedence when explicitly provided
-    if rbf is None and force_l2 is None:
-        # Use mode settings
-        if mode == "fast":
-            rbf_flag, force_l2_flag = True, False
-        elif mode == "projection":
-            rbf_flag, force_l2_flag = False, True
-        elif mode == "default":
-            rbf_flag, force_l2_flag = False, False
-        else:
-            raise ValueError(
-                f"Unknown mode: '{mode}'. Use 'default', 'fast', or 'projection'."
-            )
-    else:
-        # Expert overrides - use provided values or defaults
-        rbf_flag = rbf if rbf is not None else False
-        force_l2_flag = force_l2 if force_l2 is not None else False
+    rbf_flag, force_l2_flag = _mode_flags(mode, rbf, force_l2)
 
     # Step 1: UNWRAP to canonical form (preprocessing/compiler IR)
     # This converts ALL expressions to a standardized form:
@@ -175,7 +177,10 @@ def evaluate(
     # If so, use fast lambdified evaluation instead of full RBF machinery
     is_pure_sympy, free_symbols, symbol_type = is_pure_sympy_expression(expr_unwrapped)
 
-    if is_pure_sympy:
+    # (the fast path evaluates all points at once, so it is not used when streaming)
+    streaming = chunk_size is not None or out is not None
+
+    if is_pure_sympy and not streaming:
         # Pure sympy expression - use optimized lambdify path
         # Note: expr_unwrapped is already in canonical form (base SI units)
 
@@ -272,31 +277,8 @@ def evaluate(
     # Internal mesh KDTrees are built with non-dimensional [0-1] coordinates from PETSc
     # User-facing var.coords properties may have dimensional units (meters)
 
-    # Handle different coordinate input types
-    # IMPORTANT: Check for UnitAwareArray BEFORE np.ndarray since it inherits from ndarray
-    if isinstance(coords, UnitAwareArray):
-        # Unit-aware array - need to non-dimensionalise
-        coords_nondim = uw.non_dimensionalise(coords)
-        coords_for_eval = np.asarray(coords_nondim, dtype=np.double)
-    elif isinstance(coords, UWQuantity):
-        # UWQuantity from arithmetic operations (e.g., coords - dt * velocity)
-        coords_nondim = uw.non_dimensionalise(coords)
-        if hasattr(coords_nondim, 'value'):
-            coords_for_eval = np.asarray(coords_nondim.value, dtype=np.double)
-        else:
-            coords_for_eval = np.asarray(coords_nondim, dtype=np.double)
-    elif isinstance(coords, np.ndarray):
-        # Plain numpy array - assume it's already [0-1] non-dimensional
-        coords_for_eval = np.asarray(coords, dtype=np.double)
-    else:
-        # Other type - try to non-dimensionalise
-        coords_nondim = uw.non_dimensionalise(coords)
-        coords_for_eval = np.asarray(coords_nondim, dtype=np.double)
-
-    # Ensure coordinates are 2D: shape (N, ndim) not (ndim,)
-    # This handles single coordinate evaluation: coords[60] -> shape (2,) -> (1, 2)
-    if coords_for_eval.ndim == 1:
-        coords_for_eval = np.atleast_2d(coords_for_eval)
+    # (a single coordinate is promoted to shape (1, ndim))
+    coords_for_eval = _coords_for_evaluation(coords)
 
     # Step 3: Call Cython implementation with plain non-dimensional arrays
     # NOTE: Returns NON-DIMENSIONAL values [0-1] since we queried
@@ -314,6 +296,9 @@ def evaluate(
         check_extrapolated=check_extrapolated,
         force_l2=force_l2_flag,
         smoothing=smoothing,
+        chunk_size=chunk_size,
+        out=out,
+        cell_hint=cell_hint,
     )
 
     # Step 4: Unpack extrapolation flag if needed
@@ -323,39 +308,212 @@ def evaluate(
         raw_values = raw_result_nondim
         extrapolated = None
 
+    # Streaming into a caller's array: re-dimensionalise in place, block by block
+    if out is not None:
+        out = _dimensionalise_in_place(expr, raw_values, result_dimensionality, chunk_size)
+        if check_extrapolated:
+            return out, extrapolated
+        else:
+            return out
+
     # Step 5: Re-dimensionalize and wrap with units
     # GATEWAY PRINCIPLE: evaluate() ALWAYS returns dimensional values when units are known
     # The user sees dimensional results; non-dimensional is for internal solver use only
 
+    result = _dimensionalise_result(expr, raw_values, result_dimensionality)
+
+    if check_extrapolated:
+        return result, extrapolated
+    else:
+        return result
+
+
+def _dimensionalise_in_place(expr, values, result_dimensionality, chunk_size=None):
+    """Scale non-dimensional `values` to dimensional form without a full-size copy."""
+    from underworld3.units import get_units
+    from ..utilities.unit_aware_array import UnitAwareArray
+
+    result_units = get_units(expr)
+    if not result_dimensionality or result_units is None:
+        return values
+
+    # Same scale as uw.dimensionalise; without reference quantities the
+    # values are only labelled with units (as evaluate does)
+    try:
+        scale = uw.get_default_model().get_scale_for_dimensionality(result_dimensionality)
+    except Exception:
+        return UnitAwareArray(values, units=result_units)
+
+    n_points = values.shape[0]
+    step = n_points if chunk_size is None else max(1, int(chunk_size))
+    for start in range(0, n_points, step):
+        values[start:start + step] *= scale.magnitude
+
+    return UnitAwareArray(values, units=scale.units)
+
+
+@uw.timing.routine_timer_decorator
+def evaluate_many(
+    exprs,
+    coords,
+    coord_sys=None,
+    simplify=False,
+    verbose=False,
+    evalf=False,
+    mode="default",
+    smoothing=1e-6,
+    # Expert overrides (override mode settings)
+    rbf=None,
+    force_l2=None,
+):
+    """
+    Evaluate several expressions at the same coordinates in one pass.
+
+    Equivalent to calling :func:`evaluate` for each expression, but the
+    domain classification of the points, the interpolation of the mesh
+    variables (all variables used by any expression, once each) and the
+    evaluation kernel are shared.
+
+    Parameters
+    ----------
+    exprs : list, tuple or dict of expressions
+        Expressions to evaluate. A dict maps names to expressions.
+    coords : array-like
+        Coordinates at which to evaluate (as for :func:`evaluate`).
+    mode, rbf, force_l2, smoothing, simplify, evalf, verbose, coord_sys
+        As for :func:`evaluate`, applied to every expression.
+
+    Returns
+    -------
+    tuple or dict
+        One result per expression, in the same container type (a dict with
+        the same keys if `exprs` is a dict, otherwise a tuple). Each result is
+        what :func:`evaluate` would return for that expression.
+
+    Examples
+    --------
+    >>> v, p = uw.function.evaluate_many([v_soln.sym, p_soln.sym], swarm.data)
+    >>> out = uw.function.evaluate_many({"T": T.sym, "q": -k * T.sym.diff(x)}, coords)
+    """
+    from ._function import evaluate_many_nd as _evaluate_many_nd
+    from .expressions import unwrap_for_evaluate
+    from .pure_sympy_evaluator import is_pure_sympy_expression
+
+    if isinstance(exprs, dict):
+        keys = list(exprs.keys())
+        expr_list = [exprs[key] for key in keys]
+    else:
+        keys = None
+        expr_list = list(exprs)
+
+    rbf_flag, force_l2_flag = _mode_flags(mode, rbf, force_l2)
+
+    options = dict(
+        coord_sys=coord_sys,
+        simplify=simplify,
+        verbose=verbose,
+        evalf=evalf,
+        smoothing=smoothing,
+        rbf=rbf_flag,
+        force_l2=force_l2_flag,
+    )
+
+    results = [None] * len(expr_list)
+    batched = []  # (index, unwrapped expression, dimensionality)
+
+    scaling_is_active = uw.is_nondimensional_scaling_active()
+    for i, expr in enumerate(expr_list):
+        expr_unwrapped, result_dimensionality = unwrap_for_evaluate(
+            expr, scaling_active=scaling_is_active
+        )
+
+        if is_pure_sympy_expression(expr_unwrapped)[0]:
+            # No mesh data to share - evaluate() has a dedicated fast path
+            results[i] = evaluate(expr, coords, **options)
+        else:
+            batched.append((i, expr_unwrapped, result_dimensionality))
+
+    if batched:
+        coords_for_eval = _coords_for_evaluation(coords)
+
+        raw_results = _evaluate_many_nd(
+            [expr_unwrapped for _, expr_unwrapped, _ in batched],
+            coords_for_eval,
+            **options,
+        )
+
+        for (i, _, result_dimensionality), raw_values in zip(batched, raw_results):
+            results[i] = _dimensionalise_result(expr_list[i], raw_values, result_dimensionality)
+
+    if keys is not None:
+        return dict(zip(keys, results))
+    else:
+        return tuple(results)
+
+
+def _mode_flags(mode, rbf, force_l2):
+    """Internal (rbf, force_l2) flags for an evaluation `mode`.
+
+    Expert overrides take precedence when explicitly provided.
+    """
+    if rbf is None and force_l2 is None:
+        if mode == "fast":
+            return True, False
+        elif mode == "projection":
+            return False, True
+        elif mode == "default":
+            return False, False
+        else:
+            raise ValueError(
+                f"Unknown mode: '{mode}'. Use 'default', 'fast', or 'projection'."
+            )
+
+    return (rbf if rbf is not None else False), (force_l2 if force_l2 is not None else False)
+
+
+def _coords_for_evaluation(coords):
+    """Plain, 2D, non-dimensional array of evaluation coordinates."""
+    from .quantities import UWQuantity
+    from ..utilities.unit_aware_array import UnitAwareArray
+
+    # IMPORTANT: Check for UnitAwareArray BEFORE np.ndarray since it inherits from ndarray
+    if isinstance(coords, UnitAwareArray):
+        coords_for_eval = np.asarray(uw.non_dimensionalise(coords), dtype=np.double)
+    elif isinstance(coords, UWQuantity):
+        coords_nondim = uw.non_dimensionalise(coords)
+        if hasattr(coords_nondim, 'value'):
+            coords_for_eval = np.asarray(coords_nondim.value, dtype=np.double)
+        else:
+            coords_for_eval = np.asarray(coords_nondim, dtype=np.double)
+    elif isinstance(coords, np.ndarray):
+        coords_for_eval = np.asarray(coords, dtype=np.double)
+    else:
+        coords_for_eval = np.asarray(uw.non_dimensionalise(coords), dtype=np.double)
+
+    if coords_for_eval.ndim == 1:
+        coords_for_eval = np.atleast_2d(coords_for_eval)
+
+    return coords_for_eval
+
+
+def _dimensionalise_result(expr, raw_values, result_dimensionality):
+    """Re-dimensionalise non-dimensional results and attach units (as evaluate does)."""
+    from underworld3.units import get_units
+    from .quantities import quantity
+    from ..utilities.unit_aware_array import UnitAwareArray
+
     if result_dimensionality is not None:
-        # We have unit information - re-dimensionalize and wrap the result
         result_units = get_units(expr)
         if result_units is not None:
             try:
-                # Re-dimensionalize: ND value → dimensional value
-                dimensional_result = uw.dimensionalise(raw_values, target_dimensionality=result_dimensionality)
-
-                if check_extrapolated:
-                    return dimensional_result, extrapolated
-                else:
-                    return dimensional_result
+                return uw.dimensionalise(raw_values, target_dimensionality=result_dimensionality)
             except Exception:
-                # If dimensionalise fails, wrap raw values with units
                 if np.isscalar(raw_values):
-                    result_with_units = quantity(float(raw_values), result_units)
+                    return quantity(float(raw_values), result_units)
                 else:
-                    result_with_units = UnitAwareArray(raw_values, units=result_units)
+                    return UnitAwareArray(raw_values, units=result_units)
 
-                if check_extrapolated:
-                    return result_with_units, extrapolated
-                else:
-                    return result_with_units
-
-    # No dimensionality info - return plain array (no units)
-    if check_extrapolated:
-        return raw_values, extrapolated
-    else:
-        return raw_values
+    return raw_values
 
 
 @uw.timing.routine_timer_decorator
@@ -364,7 +522,7 @@ def global_evaluate(
     coords=None,
     coord_sys=None,
     other_arguments=None,
-    simplify=True,
+    simplify=False,
     verbose=False,
     evalf=False,
     mode="default",
@@ -374,6 +532,7 @@ def global_evaluate(
     # Expert overrides (override mode settings)
     rbf=None,
     force_l2=None,
+    plan=None,
 ):
     """
     Global evaluate with automatic unit-aware results.
@@ -392,7 +551,9 @@ def global_evaluate(
     other_arguments : dict, optional
         Additional arguments for evaluation (default: None)
     simplify : bool, optional
-        Whether to simplify expression (default: True)
+        Whether to run ``sympy.simplify`` on the expression before evaluation
+        (default: False). Evaluation kernels are cached, so this is rarely
+        worth its cost.
     verbose : bool, optional
         Verbose output (default: False)
     evalf : bool, optional
@@ -414,6 +575,10 @@ def global_evaluate(
         Expert override: Force RBF interpolation everywhere. Overrides mode.
     force_l2 : bool, optional
         Expert override: Force L2 projection path. Overrides mode.
+    plan : EvaluationPlan, optional
+        Keep the rank ownership of the points between calls. Pass the same
+        plan when evaluating repeatedly at the same or slowly moving points
+        (see :class:`underworld3.function.EvaluationPlan`).
 
     Returns
     -------
@@ -540,6 +705,7 @@ def global_evaluate(
         check_extrapolated=check_extrapolated,
         force_l2=force_l2_flag,
         smoothing=smoothing,
+        plan=plan,
     )
 
     # Step 2: Re-dimensionalize and wrap with units (GATEWAY PRINCIPLE)
@@ -0,0 +1,256 @@
+r"""
+Control of the just-in-time (JIT) compilation of pointwise functions.
+
+Solvers, integrals and projections generate C kernels from their symbolic
+expressions and compile them into small extension modules. Compiled modules
+are kept in memory for the lifetime of the process and, additionally, in a
+persistent on-disk cache so that new processes (restarts, batch jobs, test
+workers) can reuse them without invoking the compiler.
+
+Functions
+---------
+cache_stats, print_cache_stats
+    Hit/miss statistics and contents of the on-disk cache.
+configure_cache
+    Change the cache location, size bound, or disable it.
+clear_cache
+    Remove every module from the on-disk cache.
+configure_collective
+    Compile once per job and distribute the module to all MPI ranks.
+configure_codegen
+    Code-generation options (common-subexpression elimination).
+memo_stats, configure_memo
+    In-memory reuse of derived Jacobians across solver rebuilds.
+prepare, wait, configure_workers
+    Compile the modules of several solvers concurrently in the background.
+
+Environment Variables
+---------------------
+UW_JIT_CACHE
+    Set to ``0`` to disable the on-disk cache.
+UW_JIT_CACHE_DIR
+    Cache location (default ``~/.cache/underworld3/jit``).
+UW_JIT_CACHE_SIZE_MB
+    Size bound used for least-recently-used eviction (default 1024).
+UW_JIT_COLLECTIVE
+    Set to ``0`` to have every MPI rank compile independently.
+UW_JIT_NODE_DIR
+    Node-local directory for distributed modules (default: system temp dir).
+UW_JIT_CSE
+    Set to ``1`` to enable common-subexpression elimination by default.
+UW_JIT_MEMO
+    Set to ``0`` to re-derive pointwise functions on every solver rebuild.
+UW_JIT_WORKERS
+    Number of concurrent background compilations (default: CPU count, max 8).
+
+Examples
+--------
+>>> import underworld3 as uw
+>>> uw.jit.configure_cache(directory="/scratch/me/uw_jit", max_size_mb=4096)
+>>> stokes.solve()
+>>> uw.jit.cache_stats()["hits"]
+
+>>> uw.jit.prepare([stokes, adv_diff])   # compile both concurrently
+>>> stokes.solve()                       # waits for the Stokes module only
+"""
+
+from underworld3.utilities._jitcache import get_jit_cache, configure_jit_cache
+
+
+def cache_stats() -> dict:
+    """Statistics of the on-disk JIT cache for this process.
+
+    See :meth:`underworld3.utilities._jitcache.JITCache.get_stats`.
+    """
+    return get_jit_cache().get_stats()
+
+
+def print_cache_stats():
+    """Print statistics of the on-disk JIT cache."""
+    get_jit_cache().print_stats()
+
+
+def configure_cache(directory=None, max_size_mb=None, enabled=None):
+    """Configure the on-disk JIT cache.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Cache location. Should be on storage visible to all processes that
+        are expected to share compiled modules.
+    max_size_mb : float, optional
+        Size bound; least recently used modules are evicted beyond this.
+    enabled : bool, optional
+        Enable or disable the on-disk cache (the in-memory cache is
+        always active).
+
+    Returns
+    -------
+    JITCache
+        The newly configured cache object.
+    """
+    return configure_jit_cache(directory=directory, max_size_mb=max_size_mb, enabled=enabled)
+
+
+def clear_cache():
+    """Remove every compiled module from the on-disk JIT cache.
+
+    Modules already loaded into this process remain usable. Other files in
+    the cache directory are left alone.
+    """
+    get_jit_cache().clear()
+
+
+def configure_collective(enabled=None, node_dir=None):
+    """Configure collective (MPI) JIT compilation.
+
+    In collective mode (the default when running on more than one rank),
+    rank 0 compiles each module, the shared object is broadcast to one rank
+    per node and written to node-local storage, and every rank loads it from
+    there. If compilation fails, all ranks raise the same error.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Enable or disable collective compilation.
+    node_dir : str, optional
+        Node-local directory for the distributed modules. Should not be on a
+        shared filesystem.
+    """
+    from underworld3.utilities import _jitextension
+
+    if enabled is not None:
+        _jitextension._collective_settings["enabled"] = bool(enabled)
+    if node_dir is not None:
+        _jitextension._collective_settings["node_dir"] = node_dir
+
+
+def configure_codegen(cse=None):
+    """Configure code generation for JIT kernels.
+
+    Parameters
+    ----------
+    cse : bool, optional
+        Run ``sympy.cse`` across all residual, Jacobian and boundary
+        functions of a solver, so that subexpressions shared between output
+        components (e.g. a nonlinear viscosity appearing in F1 and every G3
+        entry) are evaluated once per kernel. This makes code generation
+        slower but assembly of nonlinear problems faster. With
+        ``verbose=True`` solvers report the operation count saved.
+    """
+    from underworld3.utilities import _jitextension
+
+    if cse is not None:
+        _jitextension._codegen_settings["cse"] = bool(cse)
+
+
+def memo_stats() -> dict:
+    """Hits and misses of the pointwise-function memo for this process.
+
+    A hit means a solver rebuild found its residual and Jacobian blocks
+    already derived and compiled for a structurally identical problem
+    (typically only the value of a constant changed).
+    """
+    from underworld3.utilities import _jitextension
+
+    stats = dict(_jitextension._pointwise_memo_stats)
+    stats["entries"] = len(_jitextension._pointwise_memo)
+    stats["enabled"] = _jitextension._pointwise_memo_settings["enabled"]
+    return stats
+
+
+def configure_memo(enabled=None, max_entries=None):
+    """Configure the pointwise-function memo.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Enable or disable reuse of derived pointwise functions. Disabling
+        also empties the memo.
+    max_entries : int, optional
+        Number of distinct solver configurations remembered (least recently
+        used are dropped first).
+    """
+    from underworld3.utilities import _jitextension
+
+    if enabled is not None:
+        _jitextension._pointwise_memo_settings["enabled"] = bool(enabled)
+        if not enabled:
+            _jitextension._pointwise_memo.clear()
+    if max_entries is not None:
+        _jitextension._pointwise_memo_settings["max_entries"] = int(max_entries)
+
+
+def prepare(objects, verbose=False):
+    """Derive and submit JIT modules for compilation without waiting.
+
+    Symbolic derivation runs here, one object after another; the compilers
+    then run concurrently in a background pool. The first solve (or
+    evaluate) of each object waits only for its own module.
+
+    Parameters
+    ----------
+    objects : object or list
+        Solvers, `ddt.Eulerian` / `ddt.SemiLagrangian` history terms,
+        `maths.Integral` or `maths.BdIntegral` objects.
+    verbose : bool
+        Report each submitted module.
+
+    Returns
+    -------
+    list of concurrent.futures.Future
+        One future per module submitted for compilation (modules already
+        loaded or found in the disk cache need none). With collective MPI
+        compilation active, builds are not deferred and the list is empty.
+
+    Raises
+    ------
+    TypeError
+        If an object has no JIT-compiled functions to prepare.
+    """
+    from underworld3.utilities import _jitextension
+
+    if not isinstance(objects, (list, tuple)):
+        objects = [objects]
+
+    for obj in objects:
+        if not hasattr(obj, "_jit_prepare"):
+            raise TypeError(f"Cannot prepare JIT modules for object of type {type(obj).__name__}")
+
+    with _jitextension._pending_lock:
+        already_pending = set(_jitextension._pending_builds.keys())
+
+    with _jitextension.deferred_builds():
+        for obj in objects:
+            obj._jit_prepare(verbose)
+
+    with _jitextension._pending_lock:
+        return [
+            pending.future
+            for name, pending in _jitextension._pending_builds.items()
+            if name not in already_pending
+        ]
+
+
+def wait():
+    """Wait for every background compilation and load the modules.
+
+    Raises
+    ------
+    RuntimeError
+        If any module failed to build.
+    """
+    from underworld3.utilities import _jitextension
+
+    _jitextension.wait_for_all_extensions()
+
+
+def configure_workers(max_workers):
+    """Set the number of concurrent background compilations.
+
+    Running builds are allowed to finish before the pool is resized.
+    """
+    from underworld3.utilities import _jitextension
+
+    _jitextension._shutdown_compile_pool()
+    _jitextension._compile_pool_settings["max_workers"] = max(1, int(max_workers))
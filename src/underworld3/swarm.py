@@ -70,6 +70,149 @@ class SwarmType(Enum):
 # SwarmPICLayout has been moved to pic_swarm.py
 
 
+class AdvectionIntegrator:
+    r"""
+    Explicit Runge-Kutta scheme for particle advection (Butcher tableau).
+
+    .. math::
+
+        k_s = v\left(x_n + h \sum_{j<s} a_{sj} k_j\right), \qquad
+        x_{n+1} = x_n + h \sum_s b_s k_s
+
+    Schemes with an embedded solution (``b_embedded``) estimate their own
+    error and are used with adaptive substepping in `Swarm.advection`.
+
+    Parameters
+    ----------
+    name : str
+        Name of the scheme (key in `advection_integrators`).
+    a : list of lists
+        Stage coefficients; row `s` has `s` entries.
+    b : list
+        Weights of the stages in the solution.
+    order : int
+        Order of accuracy of the solution.
+    b_embedded : list, optional
+        Weights of the embedded lower-order solution.
+
+    Examples
+    --------
+    >>> heun = uw.swarm.AdvectionIntegrator("heun", [[], [1.0]], [0.5, 0.5], order=2)
+    >>> swarm.advection(v.sym, delta_t, order=heun)
+    """
+
+    def __init__(self, name, a, b, order, b_embedded=None):
+        self.name = name
+        self.a = [np.asarray(row, dtype=float) for row in a]
+        self.b = np.asarray(b, dtype=float)
+        self.order = order
+        self.b_embedded = None if b_embedded is None else np.asarray(b_embedded, dtype=float)
+
+        if len(self.a) != self.b.shape[0] or any(
+            row.shape[0] != s for s, row in enumerate(self.a)
+        ):
+            raise ValueError(f"Inconsistent Butcher tableau for advection integrator '{name}'")
+
+    @property
+    def stages(self) -> int:
+        return self.b.shape[0]
+
+    @property
+    def adaptive(self) -> bool:
+        return self.b_embedded is not None
+
+    def __repr__(self):
+        return f"AdvectionIntegrator({self.name!r}, stages={self.stages}, order={self.order})"
+
+
+advection_integrators = {
+    "euler": AdvectionIntegrator("euler", [[]], [1.0], order=1),
+    "midpoint": AdvectionIntegrator("midpoint", [[], [0.5]], [0.0, 1.0], order=2),
+    "rk4": AdvectionIntegrator(
+        "rk4",
+        [[], [0.5], [0.0, 0.5], [0.0, 0.0, 1.0]],
+        [1 / 6, 1 / 3, 1 / 3, 1 / 6],
+        order=4,
+    ),
+    # Dormand-Prince 5(4)
+    "rk45": AdvectionIntegrator(
+        "rk45",
+        [
+            [],
+            [1 / 5],
+            [3 / 40, 9 / 40],
+            [44 / 45, -56 / 15, 32 / 9],
+            [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+            [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+            [35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+        ],
+        [35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0],
+        order=5,
+        b_embedded=[
+            5179 / 57600,
+            0.0,
+            7571 / 16695,
+            393 / 640,
+            -92097 / 339200,
+            187 / 2100,
+            1 / 40,
+        ],
+    ),
+}
+"""Registered advection schemes; `Swarm.advection(order=...)` accepts these
+names, an `AdvectionIntegrator`, or the integers 1, 2 and 4."""
+
+_advection_integrators_by_order = {1: "euler", 2: "midpoint", 4: "rk4"}
+
+
+def _hilbert_keys(coords, min_coords, max_coords, bits=None):
+    """
+    Position of each point along a Hilbert curve through the bounding box.
+
+    Vectorised form of Skilling's transpose algorithm ("Programming the
+    Hilbert curve", AIP Conf. Proc. 707, 2004).
+    """
+    coords = np.asarray(coords, dtype=float)
+    n_points, dim = coords.shape
+    if bits is None:
+        bits = 63 // dim
+
+    span = np.maximum(np.asarray(max_coords) - np.asarray(min_coords), 1.0e-300)
+    scaled = (coords - np.asarray(min_coords)) / span
+    X = np.clip((scaled * (1 << bits)).astype(np.int64), 0, (1 << bits) - 1)
+
+    # Inverse undo
+    Q = 1 << (bits - 1)
+    while Q > 1:
+        P = Q - 1
+        for i in range(dim):
+            flip = (X[:, i] & Q) != 0
+            X[flip, 0] ^= P
+            t = (X[:, 0] ^ X[:, i]) & P
+            t[flip] = 0
+            X[:, 0] ^= t
+            X[:, i] ^= t
+        Q >>= 1
+
+    # Gray encode
+    for i in range(1, dim):
+        X[:, i] ^= X[:, i - 1]
+    t = np.zeros(n_points, dtype=np.int64)
+    Q = 1 << (bits - 1)
+    while Q > 1:
+        t[(X[:, dim - 1] & Q) != 0] ^= Q - 1
+        Q >>= 1
+    X ^= t[:, np.newaxis]
+
+    # Interleave the transposed bits into one key
+    keys = np.zeros(n_points, dtype=np.int64)
+    for q in range(bits - 1, -1, -1):
+        for i in range(dim):
+            keys = (keys << 1) | ((X[:, i] >> q) & 1)
+
+    return keys
+
+
 # Note - much of the setup is necessarily the same as the MeshVariable
 # and the duplication should be removed.
 
@@ -296,6 +439,7 @@ class SwarmVariable(DimensionalityMixin, MathematicalMixin, Stateful, uw_object)
                 )
 
             self.swarm.dm.registerField(self.clean_name, self.num_components, dtype=petsc_type)
+            self.swarm._dm_field_names.append(self.clean_name)
 
         self._data = None
         self._cached_data = None
@@ -1106,14 +1250,21 @@ class SwarmVariable(DimensionalityMixin, MathematicalMixin, Stateful, uw_object)
         with self.swarm.access():
             d, n = kd.query(self.swarm.data, k=1, sqr_dists=False)  # need actual distances
 
-            node_values = np.zeros((meshVar.coords.shape[0], self.num_components))
-            w = np.zeros(meshVar.coords.shape[0])
+            n_nodes = meshVar.coords.shape[0]
+            node_values = np.zeros((n_nodes, self.num_components))
+            w = np.zeros(n_nodes)
 
             if not self._nn_proxy:
-                for i in range(self.local_size):
-                    # if b[i]:
-                    node_values[n[i], :] += self.data[i, :] / (1.0e-24 + d[i])
-                    w[n[i]] += 1.0 / (1.0e-24 + d[i])
+                n = np.asarray(n).reshape(-1)
+                inv_d = 1.0 / (1.0e-24 + np.asarray(d).reshape(-1))
+
+                # Scatter-add of the weighted particle values onto their nodes
+                w[...] = np.bincount(n, weights=inv_d, minlength=n_nodes)
+                particle_values = np.asarray(self.data).reshape(-1, self.num_components)
+                for c in range(self.num_components):
+                    node_values[:, c] = np.bincount(
+                        n, weights=particle_values[:, c] * inv_d, minlength=n_nodes
+                    )
 
                 node_values[np.where(w > 0.0)[0], :] /= w[np.where(w > 0.0)[0]].reshape(-1, 1)
 
@@ -1414,15 +1565,17 @@ class SwarmVariable(DimensionalityMixin, MathematicalMixin, Stateful, uw_object)
             D = raw_data[not_remeshed].copy()
 
             kdt = uw.kdtree.KDTree(self.swarm._particle_coordinates.data[not_remeshed, :])
-        else:
-            D = raw_data.copy()
-            kdt = uw.kdtree.KDTree(self.swarm._particle_coordinates.data[:, :])
-
-            # kdt.build_index()
-
             values = kdt.rbf_interpolator_local(new_coords, D, nnn, 2, verbose)
 
             del kdt
+        else:
+            # The swarm's tree and neighbour table are shared by all variables
+            closest_n, n_weights = self.swarm._get_rbf_table(new_coords, nnn)
+
+            if nnn == 1:
+                values = raw_data[closest_n]
+            else:
+                values = np.einsum("sdc,sd->sc", raw_data[closest_n], n_weights)
 
         return values
 
@@ -1946,6 +2099,52 @@ class SwarmVariable(DimensionalityMixin, MathematicalMixin, Stateful, uw_object)
         return
 
 
+def _scatter_index_weights(nodes, particles, weights, index, n_indices, n_nodes):
+    """
+    Weighted level-set values of every material index, in one pass.
+
+    Each (node, particle, weight) contribution adds `weight` to the node's
+    total and to the node's entry for the particle's index (if the index
+    is, within np.isclose, one of 0 ... n_indices-1).
+
+    Returns
+    -------
+    node_values : numpy.ndarray, shape (n_nodes, n_indices)
+        Normalised by the total weight where that is non-zero.
+    w : numpy.ndarray, shape (n_nodes,)
+        Total weight on each node.
+    """
+    index = np.asarray(index, dtype=float)
+    nearest_index = np.rint(index)
+    valid = np.isclose(index, nearest_index) & (nearest_index >= 0) & (nearest_index < n_indices)
+    nearest_index = np.where(valid, nearest_index, 0).astype(np.int64)
+
+    w = np.bincount(nodes, weights=weights, minlength=n_nodes)
+    node_values = np.bincount(
+        nodes * n_indices + nearest_index[particles],
+        weights=weights * valid[particles],
+        minlength=n_nodes * n_indices,
+    ).reshape(n_nodes, n_indices)
+
+    node_values[w > 0.0] /= w[w > 0.0].reshape(-1, 1)
+
+    return node_values, w
+
+
+def _mark_nearest_index(node_values, nodes, neighbours, index, n_indices):
+    """
+    Set node_values[node, i] = 1 wherever one of the node's `neighbours`
+    (particles, shape (len(nodes), k)) has index exactly i.
+    """
+    index = np.asarray(index).reshape(-1)
+    neighbour_index = index[neighbours]
+    found = (neighbour_index == np.rint(neighbour_index)) & (neighbour_index >= 0)
+    found &= neighbour_index < n_indices
+
+    rows = np.broadcast_to(np.asarray(nodes).reshape(-1, 1), neighbour_index.shape)
+    node_values[rows[found], neighbour_index[found].astype(np.int64)] = 1.0
+
+
 class IndexSwarmVariable(SwarmVariable):
     """
     Integer-valued swarm variable for material tracking.
@@ -2250,74 +2449,73 @@ class IndexSwarmVariable(SwarmVariable):
             # n, d, b = kd_swarm.find_closest_point(self._meshLevelSetVars[0].coords)
             d, n = kd_swarm.query(self._meshLevelSetVars[0].coords, k=1, sqr_dists=False)
 
+            n_nodes = self._meshLevelSetVars[0].coords.shape[0]
+            n_distance = np.asarray(n_distance).reshape(-1, self.nnn)
+            n_indices = np.asarray(n_indices).reshape(-1, self.nnn)
+
+            # Each particle contributes to its nearest node(s) (ties within
+            # np.isclose) that are closer than radius_s
+            used = np.isclose(n_distance, n_distance[:, 0:1]) & (n_distance < self.radius_s)
+            particle = np.broadcast_to(np.arange(n_distance.shape[0])[:, np.newaxis], used.shape)
+
+            node_values, w = _scatter_index_weights(
+                n_indices[used],
+                particle[used],
+                1.0 / (1.0e-16 + n_distance[used]),
+                np.asarray(self.data).reshape(-1),
+                self.indices,
+                n_nodes,
+            )
+
+            # if there is no material found,
+            # impose a near-neighbour hunt for a valid material and set that one
+            ind_w0 = np.where(w == 0.0)[0]
+            _mark_nearest_index(
+                node_values, ind_w0, np.asarray(n).reshape(-1, 1)[ind_w0], self.data, self.indices
+            )
+
             for ii in range(self.indices):
                 meshVar = self._meshLevelSetVars[ii]
-
                 with self.swarm.mesh.access(meshVar), self.swarm.access():
-                    node_values = np.zeros((meshVar.data.shape[0],))
-                    w = np.zeros((meshVar.data.shape[0],))
-
-                    for i in range(self.swarm.local_size):
-                        tem = np.isclose(n_distance[i, :], n_distance[i, 0])
-                        dist = n_distance[i, tem]
-                        indices = n_indices[i, tem]
-                        tem = dist < self.radius_s
-                        dist = dist[tem]
-                        indices = indices[tem]
-                        for j, ind in enumerate(indices):
-                            node_values[ind] += (
-                                np.isclose(self.data[i], ii) / (1.0e-16 + dist[j])
-                            )[0]
-                            w[ind] += 1.0 / (1.0e-16 + dist[j])
-
-                    node_values[np.where(w > 0.0)[0]] /= w[np.where(w > 0.0)[0]]
-                    meshVar.data[:, 0] = node_values[...]
-
-                    # if there is no material found,
-                    # impose a near-neighbour hunt for a valid material and set that one
-                    ind_w0 = np.where(w == 0.0)[0]
-                    if len(ind_w0) > 0:
-                        ind_ = np.where(self.data[n[ind_w0]] == ii)[0]
-                        if len(ind_) > 0:
-                            meshVar.data[ind_w0[ind_]] = 1.0
+                    meshVar.data[:, 0] = node_values[:, ii]
+
         elif self.update_type == 1:
             kd = uw.kdtree.KDTree(self.swarm._particle_coordinates.data)
             n_distance, n_indices = kd.query(
                 self._meshLevelSetVars[0].coords, k=self.nnn, sqr_dists=False
             )
 
+            n_nodes = self._meshLevelSetVars[0].coords.shape[0]
+            n_distance = np.asarray(n_distance).reshape(-1, self.nnn)
+            n_indices = np.asarray(n_indices).reshape(-1, self.nnn)
+
+            # Nodes listed in ind_bc only use their nnn_bc nearest particles
+            n_used = np.full(n_nodes, self.nnn)
+            if self.ind_bc is not None:
+                n_used[np.asarray(self.ind_bc, dtype=int)] = self.nnn_bc
+
+            used = (n_distance < self.radius_s) & (
+                np.arange(self.nnn)[np.newaxis, :] < n_used[:, np.newaxis]
+            )
+            node = np.broadcast_to(np.arange(n_nodes)[:, np.newaxis], used.shape)
+
+            node_values, w = _scatter_index_weights(
+                node[used],
+                n_indices[used],
+                1.0 / (n_distance[used] + 1.0e-16),
+                np.asarray(self.data).reshape(-1),
+                self.indices,
+                n_nodes,
+            )
+
+            # if there is no material found,
+            # impose a near-neighbour hunt for a valid material and set that one
+            ind_w0 = np.where(w == 0.0)[0]
+            _mark_nearest_index(node_values, ind_w0, n_indices[ind_w0], self.data, self.indices)
+
             for ii in range(self.indices):
-                meshVar = self._meshLevelSetVars[ii]
-                node_values = np.zeros((meshVar.data.shape[0],))
-                w = np.zeros((meshVar.data.shape[0],))
-                for i in range(meshVar.data.shape[0]):
-                    if i not in self.ind_bc:
-                        ind = np.where(n_distance[i, :] < self.radius_s)
-                        a = 1.0 / (n_distance[i, ind] + 1.0e-16)
-                        w[i] = np.sum(a)
-                        b = np.isclose(self.data[n_indices[i, ind]], ii)
-                        node_values[i] = np.sum(np.dot(a, b))
-                        if ind[0].size == 0:
-                            w[i] = 0
-                    else:
-                        ind = np.where(n_distance[i, : self.nnn_bc] < self.radius_s)
-                        a = 1.0 / (n_distance[i, : self.nnn_bc][ind] + 1.0e-16)
-                        w[i] = np.sum(a)
-                        b = np.isclose(self.data[n_indices[i, : self.nnn_bc][ind]], ii)
-                        node_values[i] = np.sum(np.dot(a, b))
-                        if ind[0].size == 0:
-                            w[i] = 0
-
-                node_values[np.where(w > 0.0)[0]] /= w[np.where(w > 0.0)[0]]
-                meshVar.data[:, 0] = node_values[...]
-
-                # if there is no material found,
-                # impose a near-neighbour hunt for a valid material and set that one
-                ind_w0 = np.where(w == 0.0)[0]
-                if len(ind_w0) > 0:
-                    ind_ = np.where(self.data[n_indices[ind_w0]] == ii)[0]
-                    if len(ind_) > 0:
-                        meshVar.data[ind_w0[ind_]] = 1.0
+                self._meshLevelSetVars[ii].data[:, 0] = node_values[:, ii]
+
         return
 
 
@@ -2428,6 +2626,11 @@ class Swarm(Stateful, uw_object):
         self.dm.setType(SwarmType.DMSWARM_BASIC.value)
         self._data = None
 
+        # Names of the per-particle DM fields, which outlive the (weakly held)
+        # SwarmVariables. DMSwarm_pid is not accessible from petsc4py and is
+        # not used by underworld, so it is left out.
+        self._dm_field_names = ["DMSwarm_rank"]
+
         # Add data structure to hold point location information in
         # an array with a callback that resets the relevant parts of the
         # swarm variable stack when the data structure is modified.
@@ -2477,6 +2680,12 @@ class Swarm(Stateful, uw_object):
             rebuild_on_cycle=False,
         )
 
+        # add field to hold the last known (local) mesh cell of each particle.
+        # It is only ever used as the starting point of the cell search, so
+        # a stale or unset value costs time, not correctness.
+        self.dm.registerField("DMSwarm_cell", 1, dtype=PETSc.IntType)
+        self._dm_field_names.append("DMSwarm_cell")
+
         # This is for swarm streak management:
         # add variable to hold swarm origins
 
@@ -2494,7 +2703,17 @@ class Swarm(Stateful, uw_object):
 
         self._X0_uninitialised = True
         self._index = None
+        self._index_state = None
         self._nnmapdict = {}
+        self._rbf_tables = {}
+        self._particle_version = 0  # bumped when particles arrive / leave
+        self._advection_plans = {}
+
+        # Optional reordering of particles (see `sort`)
+        self.sort_interval = None
+        self.sort_order = "cell"
+        self.sort_permutation = None
+        self._migrations_since_sort = 0
         self._migration_disabled = False
 
         super().__init__()
@@ -3037,6 +3256,157 @@ class Swarm(Stateful, uw_object):
 
         return _MigrationControlContext(self, disable)
 
+    def _remove_particles(self, remove):
+        """
+        Remove particles from this rank in one pass.
+
+        Every DM field is compacted in place, keeping the order of the
+        remaining particles, and the swarm is resized once. This replaces
+        one `removePointAtIndex` call per particle.
+
+        Parameters
+        ----------
+        remove : numpy.ndarray
+            Boolean mask or indices of the local particles to remove.
+
+        Returns
+        -------
+        int : Number of particles removed.
+        """
+        n_local = self.dm.getLocalSize()
+
+        keep = np.ones(n_local, dtype=bool)
+        keep[remove] = False
+        n_keep = int(np.count_nonzero(keep))
+
+        if n_keep == n_local:
+            return 0
+
+        for name in self._dm_field_names:
+            field = self.dm.getField(name).reshape(n_local, -1)
+            field[:n_keep] = field[keep]
+            self.dm.restoreField(name)
+
+        self.dm.setLocalSizes(n_keep, -1)
+
+        # Cached arrays have the old size
+        self._invalidate_particle_caches()
+
+        return n_local - n_keep
+
+    def _invalidate_particle_caches(self):
+        """Particles arrived, left or were reordered: drop arrays and search structures."""
+        self._particle_version += 1
+        self._particle_coordinates._canonical_data = None
+        for var in self._vars.values():
+            if hasattr(var, "_canonical_data"):
+                var._canonical_data = None
+
+    def _permute_particles(self, permutation):
+        """Reorder the local particles: new particle i is old particle permutation[i]."""
+        n_local = self.dm.getLocalSize()
+
+        for name in self._dm_field_names:
+            field = self.dm.getField(name).reshape(n_local, -1)
+            field[...] = field[permutation]
+            self.dm.restoreField(name)
+
+        self._invalidate_particle_caches()
+
+    def sort(self, order="cell"):
+        """
+        Reorder the local particles so that neighbours in space are neighbours in memory.
+
+        Migration and `addNPoints` leave particles in no particular order, so
+        evaluation at the particles and proxy updates visit the mesh in random
+        order. After sorting, they sweep through it.
+
+        Parameters
+        ----------
+        order : str
+            ``"cell"``: by the (local) mesh cell containing each particle;
+            ``"hilbert"``: along a Hilbert curve through the mesh bounding box.
+
+        Returns
+        -------
+        numpy.ndarray
+            The permutation applied: particle ``i`` is now the particle that
+            was at ``permutation[i]``. It is also kept in `sort_permutation`.
+
+        Notes
+        -----
+        All particle fields are permuted together. Set `sort_interval` to N to
+        sort automatically (with `sort_order`) after every N migrations.
+        This is a local operation.
+        """
+        if order == "cell":
+            cells = self._get_particle_cells()
+            permutation = np.argsort(cells, kind="stable")
+        elif order == "hilbert":
+            extents = self.mesh._get_global_extents()
+            coords = self._particle_coordinates.data[:, :]
+            permutation = np.argsort(
+                _hilbert_keys(coords, extents["min_coords"], extents["max_coords"]),
+                kind="stable",
+            )
+        else:
+            raise ValueError(f"Unknown particle order '{order}' - use 'cell' or 'hilbert'")
+
+        self._permute_particles(permutation)
+        self.sort_permutation = permutation
+        self._migrations_since_sort = 0
+
+        return permutation
+
+    def _sort_if_due(self):
+        if self.sort_interval and self._migrations_since_sort >= self.sort_interval:
+            self.sort(self.sort_order)
+
+    def _neighbour_destinations(self, coords):
+        """
+        Destination rank for each of `coords` (points that left this rank).
+
+        The neighbouring partition whose bounding box contains the point,
+        choosing the closest domain centroid if several do; otherwise the rank
+        with the closest domain centroid overall.
+        """
+        centroids = self.mesh._get_domain_centroids()
+        _, destination = uw.kdtree.KDTree(centroids).query(coords, k=1, sqr_dists=True)
+        destination = np.asarray(destination, dtype=np.int64).reshape(-1)
+
+        ranks, box_min, box_max = self.mesh._get_neighbour_domains()
+        if ranks.shape[0] == 0:
+            return destination
+
+        extents = self.mesh._get_global_extents()
+        tolerance = 1.0e-8 * np.max(extents["max_coords"] - extents["min_coords"])
+
+        # (n_points, n_neighbours)
+        inside = np.all(
+            (coords[:, np.newaxis, :] >= box_min[np.newaxis, :, :] - tolerance)
+            & (coords[:, np.newaxis, :] <= box_max[np.newaxis, :, :] + tolerance),
+            axis=2,
+        )
+        distsq = ((coords[:, np.newaxis, :] - centroids[ranks][np.newaxis, :, :]) ** 2).sum(axis=2)
+        distsq[~inside] = np.inf
+
+        in_a_box = inside.any(axis=1)
+        destination[in_a_box] = ranks[np.argmin(distsq[in_a_box], axis=1)]
+
+        return destination
+
+    def _get_particle_cells(self):
+        """Last known local mesh cell of each particle (a copy; -1 if unknown)."""
+        cells = np.array(self.dm.getField("DMSwarm_cell"), dtype=np.int64).reshape(-1)
+        self.dm.restoreField("DMSwarm_cell")
+        return cells
+
+    def _set_particle_cells(self, cells, start=0):
+        """Record the local mesh cells of particles `start:`."""
+        field = self.dm.getField("DMSwarm_cell").reshape(-1)
+        field[start:] = cells
+        self.dm.restoreField("DMSwarm_cell")
+
     @timing.routine_timer_decorator
     @uw.collective_operation
     def populate(
@@ -3091,6 +3461,8 @@ class Swarm(Stateful, uw_object):
         self.dm.restoreField("DMSwarmPIC_coor")
         self.dm.restoreField("DMSwarm_rank")
 
+        self._set_particle_cells(newp_cells)
+
         if self.recycle_rate > 1:
             with self.access():
                 # This is a mesh-local quantity, so let's just
@@ -3126,6 +3498,7 @@ class Swarm(Stateful, uw_object):
             coords[...] = coord_data + perturbation
 
             self.dm.restoreField("DMSwarmPIC_coor")
+            self._set_particle_cells(np.tile(newp_cells, self.recycle_rate))
 
             ## Now set the cycle values
 
@@ -3147,10 +3520,19 @@ class Swarm(Stateful, uw_object):
         """
         Migrate swarm across processes after coordinates have been updated.
 
-        The algorithm uses a global kD-tree for the centroids of the domains to decide the particle mpi.rank (send to the closest)
-        If the particles are mis-assigned to a particular mpi.rank, the next choice is the second-closest and so on.
+        Particles that left this rank's domain are sent, in a single exchange,
+        to the neighbouring partition (one sharing mesh points with this rank, found
+        from the DMPlex point SF) whose bounding box contains them. If several
+        boxes contain a particle, the neighbour with the closest domain centroid wins.
+        Particles that are in no neighbour's box go straight to the rank with the
+        closest domain centroid.
+
+        Rare particles that are still unclaimed after this exchange (long-distance
+        movers) fall back to the global search: they are sent to the closest domain
+        centroid, then the second-closest, and so on, for up to `max_its` rounds.
+        Particles outside the global bounding box of the mesh are lost without any
+        search.
 
-        A few particles are still not found after this distribution process which probably means they are just outside the mesh.
         If some points remain lost, they will be deleted if `delete_lost_points` is set.
 
         Implementation note:
@@ -3163,115 +3545,117 @@ class Swarm(Stateful, uw_object):
         if self._migration_disabled:
             return
 
-        from time import time
+        from mpi4py import MPI
 
         if delete_lost_points is None:
             delete_lost_points = self.clip_to_mesh
 
-        centroids = self.mesh._get_domain_centroids()
-        mesh_domain_kdtree = uw.kdtree.KDTree(centroids)
+        extents = self.mesh._get_global_extents()
+        tolerance = 1.0e-8 * np.max(extents["max_coords"] - extents["min_coords"])
 
-        # This will only worry about particles that are not already claimed !
-        #
+        def locate_local_particles():
+            # Particles are walked from their previous cells: only those that
+            # have left their neighbourhood need a full search. Particles
+            # leaving this rank are sent with no cell (-1).
+            swarm_coord_array = self.dm.getField("DMSwarmPIC_coor").reshape((-1, self.dim)).copy()
+            self.dm.restoreField("DMSwarmPIC_coor")
 
-        swarm_coord_array = (self.dm.getField("DMSwarmPIC_coor").reshape((-1, self.dim))).copy()
-        self.dm.restoreField("DMSwarmPIC_coor")
+            in_or_not, cells = self.mesh.points_in_domain(
+                swarm_coord_array,
+                cell_hint=self._get_particle_cells(),
+                return_cells=True,
+            )
+            self._set_particle_cells(cells)
 
-        in_or_not = self.mesh.points_in_domain(
-            swarm_coord_array,
-        )
+            # Points outside the mesh bounding box cannot be claimed by any rank
+            in_box = np.all(
+                (swarm_coord_array >= extents["min_coords"] - tolerance)
+                & (swarm_coord_array <= extents["max_coords"] + tolerance),
+                axis=1,
+            )
 
-        num_points_in_domain = np.count_nonzero(in_or_not == True)
-        num_points_not_in_domain = np.count_nonzero(in_or_not == False)
-        not_my_points = np.where(in_or_not == False)[0]
+            not_my_points = np.where(in_or_not == False)[0]
+            searchable = not_my_points[in_box[not_my_points]]
 
-        uw.mpi.barrier()
+            # Global (claimed, unclaimed, searchable) counts in one reduction
+            global_counts = np.array(
+                [np.count_nonzero(in_or_not), not_my_points.shape[0], searchable.shape[0]],
+                dtype=np.int64,
+            )
+            uw.mpi.comm.Allreduce(MPI.IN_PLACE, global_counts, op=MPI.SUM)
 
-        global_unclaimed_points = int(
-            uw.utilities.gather_data(num_points_not_in_domain, bcast=True, dtype=int).sum()
-        )
+            return swarm_coord_array, not_my_points, searchable, global_counts
 
-        global_claimed_points = int(
-            uw.utilities.gather_data(num_points_in_domain, bcast=True, dtype=int).sum()
-        )
+        swarm_coord_array, not_my_points, searchable, global_counts = locate_local_particles()
+
+        self._migrations_since_sort += 1
 
-        # Unlikely, but we should check this
-        uw.mpi.barrier()
-        if global_unclaimed_points == 0:
+        if global_counts[1] == 0:
+            self._sort_if_due()
             return
 
         # Migrate particles between processes (if there are more than one of them)
 
-        if uw.mpi.size > 1:
-            for it in range(0, min(max_its, uw.mpi.size)):
+        if uw.mpi.size > 1 and global_counts[2] > 0:
+            # Collective on first use, so every rank builds the neighbour
+            # table here (not only ranks with particles to send)
+            self.mesh._get_neighbour_domains()
 
-                # Send unclaimed points to next processor in line
-
-                swarm_rank_array = self.dm.getField("DMSwarm_rank")
-                swarm_coord_array = self.dm.getField("DMSwarmPIC_coor").reshape(-1, self.dim)
+            # One sparse exchange with the neighbouring partitions
+            swarm_rank_array = self.dm.getField("DMSwarm_rank")
+            if searchable.shape[0] > 0:
+                swarm_rank_array[searchable, 0] = self._neighbour_destinations(
+                    swarm_coord_array[searchable]
+                )
+            self.dm.restoreField("DMSwarm_rank")
 
-                if not_my_points.shape[0] > 0:
-                    dist, rank = mesh_domain_kdtree.query(
-                        swarm_coord_array[not_my_points], k=it + 1, sqr_dists=False
-                    )
-                    swarm_rank_array[not_my_points, 0] = rank.reshape(-1, it + 1)[:, it]
+            self.dm.migrate(remove_sent_points=True)
 
-                self.dm.restoreField("DMSwarm_rank")
-                self.dm.restoreField("DMSwarmPIC_coor")
+            swarm_coord_array, not_my_points, searchable, global_counts = (
+                locate_local_particles()
+            )
 
-                # Now we send the points (basic migration)
-                self.dm.migrate(remove_sent_points=True)
-                uw.mpi.barrier()
+            # Global fallback for the particles that went further than a neighbour
+            if global_counts[2] > 0:
+                mesh_domain_kdtree = uw.kdtree.KDTree(self.mesh._get_domain_centroids())
 
-                swarm_coord_array = self.dm.getField("DMSwarmPIC_coor").reshape(-1, self.dim)
-                in_or_not = self.mesh.points_in_domain(swarm_coord_array)
-                self.dm.restoreField("DMSwarmPIC_coor")
+                for it in range(0, min(max_its, uw.mpi.size)):
 
-                num_points_in_domain = np.count_nonzero(in_or_not == True)
-                num_points_not_in_domain = np.count_nonzero(in_or_not == False)
-                not_my_points = np.where(in_or_not == False)[0]
+                    # Send unclaimed points to next processor in line
 
-                unclaimed_points_last_iteration = global_unclaimed_points
-                claimed_points_last_iteration = global_claimed_points
+                    swarm_rank_array = self.dm.getField("DMSwarm_rank")
+                    if searchable.shape[0] > 0:
+                        dist, rank = mesh_domain_kdtree.query(
+                            swarm_coord_array[searchable], k=it + 1, sqr_dists=False
+                        )
+                        swarm_rank_array[searchable, 0] = rank.reshape(-1, it + 1)[:, it]
+                    self.dm.restoreField("DMSwarm_rank")
 
-                uw.mpi.barrier()
+                    # Now we send the points (basic migration)
+                    self.dm.migrate(remove_sent_points=True)
 
-                global_unclaimed_points = int(
-                    uw.utilities.gather_data(
-                        num_points_not_in_domain,
-                        bcast=True,
-                        dtype=int,
-                    ).sum()
-                )
+                    counts_last_iteration = global_counts
 
-                global_claimed_points = int(
-                    uw.utilities.gather_data(num_points_in_domain, bcast=True, dtype=int).sum()
-                )
+                    swarm_coord_array, not_my_points, searchable, global_counts = (
+                        locate_local_particles()
+                    )
 
-                if global_unclaimed_points == 0:
-                    break
+                    if global_counts[2] == 0:
+                        break
 
-                if (
-                    global_unclaimed_points == unclaimed_points_last_iteration
-                    and global_claimed_points == claimed_points_last_iteration
-                ):
-                    break
+                    if np.all(global_counts == counts_last_iteration):
+                        break
 
         # Missing points for deletion if required
         if delete_lost_points:
-            uw.mpi.barrier()
-            if len(not_my_points) > 0:
-                indices = np.sort(not_my_points)[::-1]
-                for index in indices:
-                    self.dm.removePointAtIndex(index)
+            self._remove_particles(not_my_points)
 
         # Invalidate all cached data after migration.
         # Any particle movement (send, receive, or balanced swap) makes
         # cached arrays stale — both size and values may have changed.
-        self._particle_coordinates._canonical_data = None
-        for var in self._vars.values():
-            if hasattr(var, "_canonical_data"):
-                var._canonical_data = None
+        self._invalidate_particle_caches()
+
+        self._sort_if_due()
 
         return
 
@@ -3346,8 +3730,11 @@ class Swarm(Stateful, uw_object):
                 )
             )
 
-        valid = self.mesh.points_in_domain(coordinatesArray, strict_validation=True)
+        valid, valid_cells = self.mesh.points_in_domain(
+            coordinatesArray, strict_validation=True, return_cells=True
+        )
         valid_coordinates = coordinatesArray[valid]
+        valid_cells = valid_cells[valid]
         npoints = len(valid_coordinates)
         swarm_size = self.dm.getLocalSize()
 
@@ -3371,6 +3758,7 @@ class Swarm(Stateful, uw_object):
             ranks[swarm_size::] = uw.mpi.rank
             self.dm.restoreField("DMSwarm_rank")
             self.dm.restoreField("DMSwarmPIC_coor")
+            self._set_particle_cells(valid_cells, start=swarm_size)
 
         # Here we update the swarm cycle values as required
 
@@ -3457,6 +3845,7 @@ class Swarm(Stateful, uw_object):
         ranks[swarm_size::] = uw.mpi.rank
         self.dm.restoreField("DMSwarm_rank")
         self.dm.restoreField("DMSwarmPIC_coor")
+        self._set_particle_cells(-1, start=swarm_size)
 
         # Here we update the swarm cycle values as required
 
@@ -4106,9 +4495,8 @@ class Swarm(Stateful, uw_object):
     ## Check this - the interface to kdtree has changed, are we picking the correct field ?
     @timing.routine_timer_decorator
     def _get_map(self, var):
-        # generate tree if not avaiable
-        if not self._index:
-            self._index = uw.kdtree.KDTree(self.data)
+        # generate tree if not avaiable (or stale)
+        self._get_particle_kdtree()
 
         # get or generate map
         meshvar_coords = var._meshVar.coords
@@ -4125,6 +4513,53 @@ class Swarm(Stateful, uw_object):
             self._nnmapdict[digest] = self._index.query(meshvar_coords, k=1, sqr_dists=False)[1]
         return self._nnmapdict[digest]
 
+    def _get_particle_kdtree(self):
+        """
+        kd-tree of the local particle coordinates, shared by all variables.
+
+        It is built lazily and rebuilt only after the coordinates change or
+        particles arrive / leave, which also drops the neighbour tables
+        derived from it (`_get_rbf_table`, `_get_map`).
+        """
+        state = (
+            self._particle_version,
+            self._particle_coordinates._state,
+            self.dm.getLocalSize(),
+        )
+
+        if self._index is None or self._index_state != state:
+            self._index = uw.kdtree.KDTree(self._particle_coordinates.data[:, :])
+            self._index_state = state
+            self._nnmapdict = {}
+            self._rbf_tables = {}
+
+        return self._index
+
+    def _get_rbf_table(self, coords, nnn):
+        """
+        Neighbours and inverse-distance weights from the particles to `coords`.
+
+        Cached for each set of target coordinates (e.g. the nodes of a proxy
+        variable) and `nnn`, so refreshing several proxy variables costs one
+        kd-tree query and one weighted gather per variable.
+
+        Returns
+        -------
+        (closest_n, n_weights) as returned by `KDTree.rbf_weights`.
+        """
+        import xxhash
+
+        kdt = self._get_particle_kdtree()
+
+        h = xxhash.xxh64()
+        h.update(np.ascontiguousarray(coords))
+        key = (h.intdigest(), coords.shape, nnn)
+
+        if key not in self._rbf_tables:
+            self._rbf_tables[key] = kdt.rbf_weights(coords, nnn, 2)
+
+        return self._rbf_tables[key]
+
     @timing.routine_timer_decorator
     def advection(
         self,
@@ -4135,22 +4570,70 @@ class Swarm(Stateful, uw_object):
         restore_points_to_domain_func=None,
         evalf=False,
         step_limit=False,
+        tolerance=None,
     ):
+        """
+        Move the particles with the velocity `V_fn` for a time `delta_t`.
+
+        Parameters
+        ----------
+        V_fn : sympy.Matrix or vector expression
+            Velocity.
+        delta_t : float or quantity
+            Time interval (may be negative, e.g. for upstream sampling).
+        order : int, str or AdvectionIntegrator
+            Integration scheme: 1 (forward Euler), 2 (midpoint), 4 (classical
+            Runge-Kutta), a name in `uw.swarm.advection_integrators`
+            (``"euler"``, ``"midpoint"``, ``"rk4"``, ``"rk45"``) or an
+            `AdvectionIntegrator`. Schemes with an embedded error estimate
+            (``"rk45"``) choose their own substeps.
+        corrector : bool
+            Not used (kept for API compatibility).
+        restore_points_to_domain_func : callable, optional
+            Not used (``mesh.return_coords_to_bounds`` is applied instead).
+        evalf : bool
+            Evaluate the velocity with sympy evalf.
+        step_limit : bool
+            Split `delta_t` into substeps of about one cell crossing each
+            (see `estimate_dt`). For adaptive schemes this sets the first
+            substep only.
+        tolerance : float, optional
+            Adaptive schemes only: largest position error allowed in a
+            substep (non-dimensional). Default: 1.0e-3 * mesh.get_min_radius().
+
+        Note: This is a COLLECTIVE operation - all MPI ranks must call it.
+        """
         # Convert delta_t to model units if it has units
         # This ensures consistent arithmetic: velocity is in model units, so time must be too
         import underworld3 as uw
 
         delta_t_model = uw.scaling.non_dimensionalise(delta_t)
 
-        dt_limit = self.estimate_dt(V_fn)
-
-        if step_limit and dt_limit is not None:
-            substeps = int(max(1, round(abs(delta_t_model) / dt_limit)))
+        if isinstance(order, AdvectionIntegrator):
+            integrator = order
         else:
+            name = _advection_integrators_by_order.get(order, order)
+            if name not in advection_integrators:
+                raise ValueError(
+                    f"Unknown advection scheme {order!r} - use 1, 2, 4, an AdvectionIntegrator "
+                    f"or one of {list(advection_integrators)}"
+                )
+            integrator = advection_integrators[name]
+
+        # The CFL estimate is only needed to limit the step
+        dt_limit = self.estimate_dt(V_fn) if step_limit else None
+
+        if integrator.adaptive or dt_limit is None:
             substeps = 1
+        else:
+            substeps = int(max(1, round(abs(delta_t_model) / dt_limit)))
 
         if uw.mpi.rank == 0 and self.verbose:
-            print(f"Substepping {substeps} / {abs(delta_t) / dt_limit}, {delta_t} ")
+            print(
+                f"Advection ({integrator.name}): {substeps} substep(s), dt = {delta_t}, "
+                f"dt_limit = {dt_limit}",
+                flush=True,
+            )
 
         # X0 holds the particle location at the start of advection
         # This is needed because the particles may be migrated off-proc
@@ -4160,120 +4643,63 @@ class Swarm(Stateful, uw_object):
 
         V_fn_matrix = self.mesh.vector.to_matrix(V_fn)
 
-        # Use current velocity to estimate where the particles would have
-        # landed in an implicit step. WE CANT DO THIS WITH SUB-STEPPING unless
-        # We have a lot more information about the previous launch point / timestep
-        # Also: how does this interact with the particle restoration function ?
-
-        # if corrector == True and not self._X0_uninitialised:
-        #     with self.access(self._particle_coordinates):
-        #         v_at_Vpts = np.zeros_like(self.data)
+        if not integrator.adaptive:
+            h = delta_t_model / substeps
 
-        #         if evalf:
-        #             for d in range(self.dim):
-        #                 v_at_Vpts[:, d] = uw.function.evalf(
-        #                     V_fn_matrix[d], self.data
-        #                 ).reshape(-1)
-        #         else:
-        #             for d in range(self.dim):
-        #                 v_at_Vpts[:, d] = uw.function.evaluate(
-        #                     V_fn_matrix[d], self.data
-        #                 ).reshape(-1)
+            for step in range(0, substeps):
+                X0.array[:, 0, :] = self._particle_coordinates.data[...]
 
-        #         corrected_position = X0.data.copy() + delta_t * v_at_Vpts
-        #         if restore_points_to_domain_func is not None:
-        #             corrected_position = restore_points_to_domain_func(
-        #                 corrected_position
-        #             )
-
-        #         updated_current_coords = 0.5 * (corrected_position + self.data.copy())
-
-        #         # validate_coords to ensure they live within the domain (or there will be trouble)
-
-        #         if restore_points_to_domain_func is not None:
-        #             updated_current_coords = restore_points_to_domain_func(
-        #                 updated_current_coords
-        #             )
-
-        #         self.data[...] = updated_current_coords[...]
-
-        #         del updated_current_coords
-        #         del v_at_Vpts
-
-        # Wrap this whole thing in sub-stepping loop
-        for step in range(0, substeps):
-
-            X0.array[:, 0, :] = self._particle_coordinates.data[...]
-
-            # Mid point algorithm (2nd order)
-
-            if order == 2:
-                print(f"Advection (2nd): {self.local_size} - swarm points", flush=True)
-
-                # Use internal model-unit coordinates directly (no conversion needed)
-                v_at_Vpts = np.zeros_like(self._particle_coordinates.data[...])
-
-                # First evaluate the velocity at the particle locations
-                # (this is a local operation)
-
-                v_at_Vpts[...] = uw.function.evaluate(V_fn_matrix, self._particle_coordinates.data)[
-                    :, 0, :
-                ]
-
-                mid_pt_coords = (
-                    self._particle_coordinates.data[...]
-                    + 0.5 * delta_t_model * v_at_Vpts / substeps
-                )
-
-                # This will re-position particles in periodic domains (etc)
-                if self.mesh.return_coords_to_bounds is not None:
-                    mid_pt_coords = self.mesh.return_coords_to_bounds(mid_pt_coords)
-
-                # Now do a **Global** evaluation
-                # (since the mid-points might have moved off-proc)
-                #
-
-                v_at_Vpts[...] = uw.function.global_evaluate(V_fn_matrix, mid_pt_coords)[:, 0, :]
-
-                new_coords = X0.array[:, 0, :] + delta_t_model * v_at_Vpts / substeps
-
-                if self.mesh.return_coords_to_bounds is not None:
-                    new_coords = self.mesh.return_coords_to_bounds(new_coords)
+                new_coords, _ = self._advection_step(V_fn_matrix, h, integrator, evalf)
 
                 # Set the new particle positions (and automatically migrate)
                 self._particle_coordinates.data[...] = new_coords[...]
 
-                del new_coords
-                del v_at_Vpts
-
-            # forward Euler (1st order)
-            else:
-                coords = self._particle_coordinates.data
-                print(
-                    f"1. Advection (1st): {coords.shape} v {self.local_size} - swarm point shape",
-                    flush=True,
+        else:
+            if tolerance is None:
+                tolerance = 1.0e-3 * self.mesh.get_min_radius()
+
+            # Embedded error control with one (global) substep size, so that
+            # all particles migrate together after every accepted substep
+            direction = 1.0 if delta_t_model >= 0 else -1.0
+            remaining = abs(delta_t_model)
+            h = remaining if dt_limit is None else min(remaining, dt_limit)
+            accepted = rejected = 0
+
+            while remaining > 1.0e-12 * abs(delta_t_model):
+                h = min(h, remaining)
+
+                X0.array[:, 0, :] = self._particle_coordinates.data[...]
+                new_coords, error = self._advection_step(
+                    V_fn_matrix, direction * h, integrator, evalf
                 )
 
-                v_at_Vpts = np.zeros_like(coords)
-                v_at_Vpts[...] = uw.function.global_evaluate(V_fn_matrix, coords[...])[:, 0, :]
+                if error <= tolerance:
+                    self._particle_coordinates.data[...] = new_coords[...]
+                    remaining -= h
+                    accepted += 1
+                else:
+                    rejected += 1
 
-                print(
-                    f"2. Advection (1st): {coords.shape} v {self.local_size} - swarm point shape",
-                    flush=True,
-                )
+                # Standard step-size update (safety factor 0.9, growth in [0.2, 5])
+                if error == 0.0:
+                    factor = 5.0
+                else:
+                    factor = min(5.0, max(0.2, 0.9 * (tolerance / error) ** (1.0 / integrator.order)))
+                h *= factor
 
-                new_coords = coords[...] + delta_t_model * v_at_Vpts / substeps
+                if h < 1.0e-12 * abs(delta_t_model):
+                    raise RuntimeError(
+                        f"Adaptive advection ({integrator.name}) could not meet the tolerance "
+                        f"{tolerance} (error {error})"
+                    )
 
+            if uw.mpi.rank == 0 and self.verbose:
                 print(
-                    f"3. Advection (1st): {coords.shape} v {self.local_size} - swarm point shape",
+                    f"Advection ({integrator.name}): {accepted} substep(s) accepted, "
+                    f"{rejected} rejected",
                     flush=True,
                 )
 
-                if self.mesh.return_coords_to_bounds is not None:
-                    new_coords = self.mesh.return_coords_to_bounds(new_coords)
-
-                self._particle_coordinates.data[...] = new_coords[...]
-
         ## End of substepping loop
 
         ## Cycling of the swarm is a cheap and cheerful version of population control for particles. It turns the
@@ -4286,10 +4712,8 @@ class Swarm(Stateful, uw_object):
             # Remove remesh points and recreate a new set at the mesh-local
             # locations that we already have stored.
 
-            with self.access(self._particle_coordinates, self._remeshed):
-                remeshed = self._remeshed.data[:, 0] == 0
-                # This is one way to do it ... we can do this better though
-                self.data[remeshed, 0] = 1.0e100
+            remeshed = self._remeshed.data[:, 0] == 0
+            self._remove_particles(remeshed)
 
             swarm_size = self.dm.getLocalSize()
 
@@ -4324,6 +4748,7 @@ class Swarm(Stateful, uw_object):
             # self.dm.restoreField("DMSwarm_cellid")
             self.dm.restoreField("DMSwarmPIC_coor")
             self.dm.restoreField("DMSwarm_remeshed")
+            self._set_particle_cells(-1, start=swarm_size)
 
             # when we let this go, the particles may be re-distributed to
             # other processors, and we will need to rebuild the remeshed
@@ -4372,11 +4797,83 @@ class Swarm(Stateful, uw_object):
 
         return
 
+    @timing.routine_timer_decorator
+    def _advection_step(self, V_fn_matrix, h, integrator, evalf=False):
+        """
+        One Runge-Kutta step of length `h` from the current particle positions.
+
+        Returns
+        -------
+        new_coords : numpy.ndarray
+            Positions after the step (not yet assigned to the particles).
+        error : float or None
+            Global maximum of the embedded error estimate (adaptive schemes).
+        """
+        coords = np.asarray(self._particle_coordinates.data[...])
+        k = np.zeros((integrator.stages,) + coords.shape)
+
+        for stage in range(integrator.stages):
+            if stage == 0:
+                # The particles are local: walk from their known cells
+                k[0] = uw.function.evaluate(
+                    V_fn_matrix,
+                    coords,
+                    evalf=evalf,
+                    cell_hint=self._get_particle_cells(),
+                )[:, 0, :]
+                continue
+
+            stage_coords = coords + h * np.tensordot(integrator.a[stage], k[:stage], axes=1)
+
+            # This will re-position particles in periodic domains (etc)
+            if self.mesh.return_coords_to_bounds is not None:
+                stage_coords = self.mesh.return_coords_to_bounds(stage_coords)
+
+            # Stage points may have moved off-proc: a **global** evaluation,
+            # with a persistent plan for each stage
+            k[stage] = uw.function.global_evaluate(
+                V_fn_matrix,
+                stage_coords,
+                evalf=evalf,
+                plan=self._advection_plan(stage, V_fn_matrix),
+            )[:, 0, :]
+
+        new_coords = coords + h * np.tensordot(integrator.b, k, axes=1)
+
+        if self.mesh.return_coords_to_bounds is not None:
+            new_coords = self.mesh.return_coords_to_bounds(new_coords)
+
+        if not integrator.adaptive:
+            return new_coords, None
+
+        local_error = h * np.tensordot(integrator.b - integrator.b_embedded, k, axes=1)
+        local_max = float(np.sqrt((local_error**2).sum(axis=1)).max()) if coords.shape[0] else 0.0
+
+        from mpi4py import MPI
+
+        return new_coords, uw.mpi.comm.allreduce(local_max, op=MPI.MAX)
+
+    def _advection_plan(self, stage, V_fn_matrix):
+        """Persistent `EvaluationPlan` for one stage of the advection scheme."""
+        mesh, _, _ = uw.function.expressions.mesh_vars_in_expression(V_fn_matrix)
+        if mesh is None:
+            mesh = self.mesh
+
+        plan = self._advection_plans.get(stage)
+        if plan is None or plan.mesh is not mesh:
+            plan = uw.function.EvaluationPlan(mesh)
+            self._advection_plans[stage] = plan
+        return plan
+
     @timing.routine_timer_decorator
     def estimate_dt(self, V_fn):
         """
         Calculates an appropriate advective timestep for the given
         mesh and velocity configuration.
+
+        The velocity maximum is taken from the mesh nodes, not the particles:
+        if `V_fn` is a mesh variable (e.g. ``v.sym``) its nodal values are
+        used directly, otherwise `V_fn` is evaluated at the mesh vertices.
         """
         # we'll want to do this on an element by element basis
         # for more general mesh
@@ -4385,7 +4882,17 @@ class Swarm(Stateful, uw_object):
         import math
         import numpy as np
 
-        vel = uw.function.evaluate(V_fn, self._particle_coordinates.data, evalf=True)
+        V_fn_matrix = self.mesh.vector.to_matrix(V_fn)
+
+        vel = None
+        for var in self.mesh.vars.values():
+            if var.num_components == self.mesh.dim and var.sym.shape == V_fn_matrix.shape:
+                if var.sym == V_fn_matrix:
+                    vel = var.data  # non-dimensional
+                    break
+
+        if vel is None:
+            vel = uw.function.evaluate(V_fn_matrix, self.mesh._coords)
 
         # If vel is unit-aware (UnitAwareArray), nondimensionalise it to get
         # consistent nondimensional values that match mesh._radii
@@ -4397,14 +4904,10 @@ class Swarm(Stateful, uw_object):
             vel = vel.magnitude
 
         # Ensure vel is a plain numpy array
-        vel = np.asarray(vel)
+        vel = np.asarray(vel).reshape(-1, self.mesh.dim)
 
         try:
-            magvel_squared = vel[:, 0] ** 2 + vel[:, 1] ** 2
-            if self.mesh.dim == 3:
-                magvel_squared += vel[:, 2] ** 2
-
-            max_magvel = math.sqrt(magvel_squared.max())
+            max_magvel = math.sqrt((vel**2).sum(axis=1).max())
 
         except (ValueError, IndexError):
             max_magvel = 0.0
@@ -4530,6 +5033,7 @@ class NodalPointSwarm(Swarm):
         restore_points_to_domain_func=None,
         evalf=False,
         step_limit=True,
+        tolerance=None,
     ):
 
         with self.access(self._X0):
@@ -4546,6 +5050,7 @@ class NodalPointSwarm(Swarm):
             restore_points_to_domain_func,
             evalf,
             step_limit,
+            tolerance,
         )
 
         return
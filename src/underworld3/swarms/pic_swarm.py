@@ -155,6 +155,9 @@ class PICSwarm(Stateful, uw_object):
         self.dm.setCellDM(self.celldm)
         self._data = None
 
+        # names of the per-particle DM fields (see Swarm._remove_particles)
+        self._dm_field_names = ["DMSwarm_rank", "DMSwarmPIC_coor", "DMSwarm_cellid"]
+
         # Is the swarm a streak-swarm ?
         self.recycle_rate = recycle_rate
         self.cycle = 0
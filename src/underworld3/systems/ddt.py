@@ -754,6 +754,13 @@ class Eulerian(uw_object):
         self._psi_star_projection_solver.uw_function = self.psi_fn
         self._psi_star_projection_solver.bcs = self.bcs
         self._psi_star_projection_solver.smoothing = self.smoothing
+        self._psi_star_projection_solver.reuse_operator = True
+
+    def _jit_prepare(self, verbose=False):
+        """Submit the history projection for compilation (see `underworld3.jit.prepare`)."""
+        projection = getattr(self, "_psi_star_projection_solver", None)
+        if projection is not None:
+            projection._jit_prepare(verbose)
 
     @property
     def effective_order(self):
@@ -824,7 +831,9 @@ class Eulerian(uw_object):
         On the first call, automatically initialises history from the
         current field values. If V_fn is set, also applies an explicit
         grid-based advection correction so that bdf() approximates the
-        material derivative Dφ/Dt rather than ∂φ/∂t.
+        material derivative Dφ/Dt rather than ∂φ/∂t. For scalar and vector
+        psi the correction is one projection solve; with ``evalf`` it is
+        evaluated component by component instead.
         """
         self._dt = dt
 
@@ -836,30 +845,86 @@ class Eulerian(uw_object):
         _update_am_values(self._am_coeffs, self.effective_order, self.theta)
 
         if self.V_fn is not None and dt is not None:
-            coords = self.psi_star[0].coords
-            dim = self.mesh.dim
-            X = self.mesh.X
+            ncomp = max(self.psi_fn.shape)  # number of tracked components
+
+            # (evalf asks for evaluate's own handling of the expression, so it
+            # keeps the per-component path)
+            if ncomp in (1, self.mesh.dim) and not evalf:
+                # All the components in one projection solve, directly onto
+                # the psi_star nodes
+                self.psi_star[0].data[...] -= dt * self._advection_at_nodes()
+            else:
+                coords = self.psi_star[0].coords
+                advection = self._advection_fn()
+
+                for c in range(ncomp):
+                    advection_vals = uw.function.evaluate(
+                        advection[c], coords, evalf=evalf,
+                    ).reshape(-1)
 
-            # Build u·∇φ symbolically for each component of psi_fn
-            # psi_fn is a Matrix; V_fn is also a Matrix. For scalar
-            # psi_fn the shape is (1,1); for vector it is (1,dim).
-            psi = self.psi_fn
-            V = self.V_fn
-            ncomp = max(psi.shape)  # number of tracked components
+                    self.psi_star[0].data[:, c] -= dt * advection_vals
 
-            for c in range(ncomp):
-                # ∂φ_c/∂x_i for each spatial dimension
-                grad_c = sympy.Matrix([psi[c].diff(X[i]) for i in range(dim)])
-                # u·∇φ_c = V_i * ∂φ_c/∂x_i
-                advection_expr = sum(V[i] * grad_c[i] for i in range(dim))
+        return
 
-                advection_vals = uw.function.evaluate(
-                    advection_expr, coords, evalf=evalf,
-                ).reshape(-1)
+    def _advection_fn(self):
+        r"""The advection term :math:`\mathbf{u}\cdot\nabla\psi` as a row matrix."""
+        # psi_fn is a Matrix; V_fn is also a Matrix. For scalar
+        # psi_fn the shape is (1,1); for vector it is (1,dim).
+        psi = self.psi_fn
+        V = self.V_fn
+        X = self.mesh.X
+        dim = self.mesh.dim
+
+        # u·∇φ_c = V_i * ∂φ_c/∂x_i
+        return sympy.Matrix(
+            [[sum(V[i] * psi[c].diff(X[i]) for i in range(dim)) for c in range(max(psi.shape))]]
+        )
 
-                self.psi_star[0].data[:, c] -= dt * advection_vals
+    def _advection_at_nodes(self):
+        r"""
+        Nodal values of :math:`\mathbf{u}\cdot\nabla\psi` on the psi_star space.
 
-        return
+        The gradient contains derivatives, which `evaluate` can only resolve
+        with one projection solve per component. Instead, the whole advection
+        term is projected once (scalar or vector projection) onto a variable
+        that shares the psi_star nodes. The solver is kept between steps and
+        rebuilt only if psi_fn or V_fn change.
+        """
+        ncomp = max(self.psi_fn.shape)
+
+        if getattr(self, "_advection_projection_solver", None) is None:
+            self._advection_work = uw.discretisation.MeshVariable(
+                f"A_star_Eulerian_{self.instance_number}",
+                self.mesh,
+                vtype=uw.VarType.SCALAR if ncomp == 1 else uw.VarType.VECTOR,
+                degree=self.degree,
+                continuous=self.continuous,
+                varsymbol=r"{ \mathbf{u}\cdot\nabla\psi }",
+            )
+            if ncomp == 1:
+                self._advection_projection_solver = uw.systems.solvers.SNES_Projection(
+                    self.mesh, self._advection_work, verbose=False
+                )
+            else:
+                self._advection_projection_solver = uw.systems.solvers.SNES_Vector_Projection(
+                    self.mesh, self._advection_work, verbose=False
+                )
+            self._advection_projection_solver.smoothing = 1.0e-6
+            self._advection_projection_solver.petsc_options["snes_rtol"] = 1.0e-6
+            self._advection_projection_solver.reuse_operator = True
+            self._advection_fns = None
+
+        if self._advection_fns != (self.psi_fn, self.V_fn):
+            advection = self._advection_fn()
+            self._advection_projection_solver.uw_function = (
+                advection[0, 0] if ncomp == 1 else advection
+            )
+            self._advection_fns = (self.psi_fn, self.V_fn)
+
+        # Warm start from the previous step's values
+        self._advection_projection_solver.solve(zero_init_guess=False)
+
+        return self._advection_work.data[...].reshape(self.psi_star[0].data.shape)
 
     def update_post_solve(
         self,
@@ -1016,6 +1081,13 @@ class SemiLagrangian(uw_object):
         self._dt = None  # current timestep (set by solver or update_pre_solve)
         self._dt_history = [None] * order  # previous timesteps for variable-dt BDF
 
+        # Point ownership for the upstream evaluations, kept between steps
+        # (keyed by stage: "mid" | "end")
+        self._evaluation_plans = {}
+
+        # Node sample points: (psi_star coordinates, points nudged into cells)
+        self._node_coords_cache = None
+
         if swarm_degree is None:
             self.swarm_degree = degree
         else:
@@ -1124,6 +1196,7 @@ class SemiLagrangian(uw_object):
         self._psi_star_projection_solver.uw_function = self._workVar.sym
         self._psi_star_projection_solver.bcs = bcs
         self._psi_star_projection_solver.smoothing = smoothing
+        self._psi_star_projection_solver.reuse_operator = True
 
         self._smoothing = smoothing
 
@@ -1150,6 +1223,12 @@ class SemiLagrangian(uw_object):
 
         display(Latex(rf"$\quad$History steps = {self.order}"))
 
+    def _jit_prepare(self, verbose=False):
+        """Submit the history projection for compilation (see `underworld3.jit.prepare`)."""
+        projection = getattr(self, "_psi_star_projection_solver", None)
+        if projection is not None:
+            projection._jit_prepare(verbose)
+
     @property
     def effective_order(self):
         """Current effective BDF order, accounting for history startup.
@@ -1285,52 +1364,28 @@ class SemiLagrangian(uw_object):
         #    (e.g. of derivatives)
         #
 
-        # CRITICAL FIX (2025-11-28): Handle coordinates correctly for unit-aware mode.
-        # Previous bug: extracting .magnitude gives METERS (e.g., 1000000), but:
-        # - mesh.get_closest_cells() expects [0-1] non-dimensional coords
-        # - evaluate() assumes plain numpy is [0-1] non-dimensional
-        # Solution: use uw.non_dimensionalise() for proper conversion, OR pass
-        # unit-aware coords to evaluate() which handles conversion internally.
         from underworld3.utilities.unit_aware_array import UnitAwareArray
 
-        psi_star_0_coords = self.psi_star[0].coords
-
-        # For mesh internal operations, need non-dimensional [0-1] coordinates
-        if hasattr(psi_star_0_coords, "magnitude"):
-            # Unit-aware coords - need to non-dimensionalize (not just extract magnitude!)
-            psi_star_0_coords_nd = uw.non_dimensionalise(psi_star_0_coords)
-            # Extract to plain numpy for mesh operations
-            if isinstance(psi_star_0_coords_nd, UnitAwareArray):
-                psi_star_0_coords_nd = np.array(psi_star_0_coords_nd)
-            elif hasattr(psi_star_0_coords_nd, 'magnitude'):
-                psi_star_0_coords_nd = psi_star_0_coords_nd.magnitude
-            else:
-                psi_star_0_coords_nd = np.array(psi_star_0_coords_nd)
-        else:
-            # Plain numpy - assume already non-dimensional
-            psi_star_0_coords_nd = psi_star_0_coords
-
-        cellid = self.mesh.get_closest_cells(
-            psi_star_0_coords_nd,
-        )
+        node_coords_nd = self._node_sample_coords()
 
-        # Move slightly within the chosen cell to avoid edge effects
-        centroid_coords = self.mesh._centroids[cellid]
-
-        shift = 0.001
-        node_coords_nd = (1.0 - shift) * psi_star_0_coords_nd[:, :] + shift * centroid_coords[
-            :, :
-        ]
+        # The velocity at the nodes is the same for every history level; when
+        # possible it is evaluated together with psi_fn (one interpolation pass)
+        v_result = None
 
         try:
             # Use shifted ND coords to avoid quad mesh boundary issues
-            # node_coords_nd is slightly shifted toward cell centroids (lines 703-709)
             # evaluate() treats plain numpy as ND [0-1] coordinates
-            eval_result = uw.function.evaluate(
-                self.psi_fn,
-                node_coords_nd,
-                evalf=evalf,
-            )
+            if evalf:
+                eval_result = uw.function.evaluate(
+                    self.psi_fn,
+                    node_coords_nd,
+                    evalf=evalf,
+                )
+            else:
+                eval_result, v_result = uw.function.evaluate_many(
+                    [self.psi_fn, self.V_fn],
+                    node_coords_nd,
+                )
             # Wrap result with units if psi_star has units but eval didn't return UnitAwareArray
             psi_star_units = self.psi_star[0].units
             if psi_star_units is not None and not isinstance(eval_result, UnitAwareArray):
@@ -1347,13 +1402,8 @@ class SemiLagrangian(uw_object):
 
         # 3. Compute the upstream values from the psi_fn
 
-        # We use the u_star variable as a working value here so we have to work backwards
-        # so we don't over-write the history terms
-        #
-
         # Convert dt to model units for numerical arithmetic
         # (after symbolic logic that may use dt with units)
-        # Note: uw is already imported at module level (line 7)
         model = uw.get_default_model()
 
         # DIAGNOSTIC: Capture information about the unit system
@@ -1386,166 +1436,83 @@ class SemiLagrangian(uw_object):
                 # Already dimensionless
                 dt_for_calc = dt
 
-        for i in range(self.order - 1, -1, -1):
-            # 2nd order update along characteristics
-
-            # Use shifted ND coords to avoid quad mesh boundary issues
-            # node_coords_nd is slightly shifted toward cell centroids (lines 703-709)
-            # evaluate() treats plain numpy as ND [0-1] coordinates
+        if v_result is None:
             v_result = uw.function.evaluate(
                 self.V_fn,
                 node_coords_nd,
             )
 
-            # CRITICAL: Preserve UnitAwareArray through slicing
-            # Slicing can sometimes return plain numpy views - need to preserve wrapper
-            from underworld3.utilities.unit_aware_array import UnitAwareArray
-
-            if isinstance(v_result, UnitAwareArray):
-                # Slice and rewrap to preserve units
-                v_at_node_pts = v_result[:, 0, :]
-                if not isinstance(v_at_node_pts, UnitAwareArray):
-                    # Slicing lost the wrapper - rewrap it
-                    v_at_node_pts = UnitAwareArray(v_at_node_pts, units=v_result.units)
-            else:
-                v_at_node_pts = v_result[:, 0, :]
-
-            # Non-dimensionalize velocities when working with dimensionless coordinates
-            # This prevents dimensional mismatch: velocities in m/s mixed with coords in [0,1]
-            # CRITICAL: evaluate now returns UnitAwareArray with units attached
-            # Check if velocities already have units before trying to add them manually
-            if not has_units:
-                # Coordinates are dimensionless - need to non-dimensionalize velocities too
-                if isinstance(v_at_node_pts, UnitAwareArray):
-                    # Velocities already have units from evaluate - just non-dimensionalize
-                    v_nondim = uw.non_dimensionalise(v_at_node_pts, model)
-                    # Extract numpy array for dimensionless calculation
-                    if isinstance(v_nondim, UnitAwareArray):
-                        v_at_node_pts = np.array(v_nondim)
-                    elif hasattr(v_nondim, "value"):
-                        v_at_node_pts = v_nondim.value
-                    else:
-                        v_at_node_pts = v_nondim
-                else:
-                    # Velocities don't have units - try to add them manually (legacy path)
-                    v_units = uw.get_units(self.V_fn)
-                    if v_units and v_units != "dimensionless":
-                        v_with_units = UnitAwareArray(v_at_node_pts, units=v_units)
-                        v_nondim = uw.non_dimensionalise(v_with_units, model)
-                        if isinstance(v_nondim, UnitAwareArray):
-                            v_at_node_pts = np.array(v_nondim)
-                        elif hasattr(v_nondim, "value"):
-                            v_at_node_pts = v_nondim.value
-                        else:
-                            v_at_node_pts = v_nondim
-            else:
-                # Dimensional mode - ensure velocities have units
-                # CRITICAL FIX (2025-11-27): Variable data is stored NON-DIMENSIONALLY.
-                # We must DIMENSIONALIZE (not just wrap) the values before dimensional arithmetic.
-                # Previous bug: wrapping 0.01 (ND) with cm/yr gave 0.01 cm/yr instead of 1 cm/yr.
-                if not isinstance(v_at_node_pts, UnitAwareArray):
-                    v_units = uw.get_units(self.V_fn)
-                    if v_units and v_units != "dimensionless":
-                        # Re-dimensionalize using the scaling system
-                        if uw.is_nondimensional_scaling_active():
-                            from underworld3.scaling import dimensionalise
-                            # dimensionalise(nd_value, units) -> value * scale in those units
-                            v_dimensional = dimensionalise(v_at_node_pts, v_units)
-                            v_at_node_pts = UnitAwareArray(v_dimensional.magnitude, units=v_dimensional.units)
-                        else:
-                            # No scaling active - assume values are already dimensional
-                            v_at_node_pts = UnitAwareArray(v_at_node_pts, units=v_units)
-
-            # Get coordinates
-            coords = self.psi_star[i].coords
-
-            # CRITICAL: When working in dimensionless mode, extract coords to plain arrays
-            # to match the dimensionless velocities (otherwise unit mismatch occurs)
-            from underworld3.utilities.unit_aware_array import UnitAwareArray
-
-            if not has_units and isinstance(coords, UnitAwareArray):
-                # Extract to plain numpy for dimensionless arithmetic
-                coords = np.array(coords)
-
-            # CRITICAL (2025-11-27): Multiply velocity FIRST so UnitAwareArray.__mul__ handles it.
-            # If we do `dt_for_calc * v_at_node_pts`, Pint handles it and loses UnitAwareArray units.
-            mid_pt_coords = coords - v_at_node_pts * (0.5 * dt_for_calc)
-
-            # Clamp midpoint coordinates to the domain boundary
-            if self.mesh.return_coords_to_bounds is not None:
-                mid_pt_coords = self.mesh.return_coords_to_bounds(mid_pt_coords)
-
-            v_mid_result = uw.function.global_evaluate(
-                self.V_fn,
-                mid_pt_coords,
+        # Every psi_star shares the node coordinates, so the departure points
+        # are the same for all history levels: trace them once (2nd order,
+        # mid-point rule) ...
+
+        # evaluate() returns ND values for plain arrays: redimensionalise them
+        v_at_node_pts = self._velocity_for_tracing(v_result, model, has_units, redimensionalise=True)
+
+        # Get coordinates
+        coords = self.psi_star[0].coords
+
+        # CRITICAL: When working in dimensionless mode, extract coords to plain arrays
+        # to match the dimensionless velocities (otherwise unit mismatch occurs)
+        if not has_units and isinstance(coords, UnitAwareArray):
+            # Extract to plain numpy for dimensionless arithmetic
+            coords = np.array(coords)
+
+        # CRITICAL (2025-11-27): Multiply velocity FIRST so UnitAwareArray.__mul__ handles it.
+        # If we do `dt_for_calc * v_at_node_pts`, Pint handles it and loses UnitAwareArray units.
+        mid_pt_coords = coords - v_at_node_pts * (0.5 * dt_for_calc)
+
+        # Clamp midpoint coordinates to the domain boundary
+        if self.mesh.return_coords_to_bounds is not None:
+            mid_pt_coords = self.mesh.return_coords_to_bounds(mid_pt_coords)
+
+        v_mid_result = uw.function.global_evaluate(
+            self.V_fn,
+            mid_pt_coords,
+            plan=self._evaluation_plan("mid", self.V_fn),
+        )
+
+        # global_evaluate returns dimensional results (gateway fix 2025-11-28)
+        v_at_mid_pts = self._velocity_for_tracing(
+            v_mid_result, model, has_units, redimensionalise=False
+        )
+
+        # Calculate upstream coordinates: current position - velocity * timestep
+        end_pt_coords = coords - v_at_mid_pts * dt_for_calc
+
+        # Clamp upstream coordinates to the domain boundary
+        if self.mesh.return_coords_to_bounds is not None:
+            end_pt_coords = self.mesh.return_coords_to_bounds(end_pt_coords)
+
+        # ... and sample every history level there in one interpolation. The
+        # levels are read before any of them is overwritten, which is what the
+        # oldest-first, level-by-level update did.
+        sizes = [len(psi_star.sym) for psi_star in self.psi_star]
+        history_fn = sympy.Matrix.hstack(
+            *[psi_star.sym.reshape(1, size) for psi_star, size in zip(self.psi_star, sizes)]
+        )
+
+        values_at_end_points = uw.function.global_evaluate(
+            history_fn,
+            end_pt_coords,
+            plan=self._evaluation_plan("end", history_fn),
+        )
+
+        n_points = values_at_end_points.shape[0]
+        offsets = np.concatenate(([0], np.cumsum(sizes)))
+
+        for i in range(self.order - 1, -1, -1):
+            value_at_end_points = values_at_end_points[:, 0, offsets[i] : offsets[i + 1]].reshape(
+                n_points, *self.psi_star[i].sym.shape
             )
 
             # CRITICAL: Preserve UnitAwareArray through slicing
-            if isinstance(v_mid_result, UnitAwareArray):
-                # Slice and rewrap to preserve units
-                v_at_mid_pts = v_mid_result[:, 0, :]
-                if not isinstance(v_at_mid_pts, UnitAwareArray):
-                    # Slicing lost the wrapper - rewrap it
-                    v_at_mid_pts = UnitAwareArray(v_at_mid_pts, units=v_mid_result.units)
-            else:
-                v_at_mid_pts = v_mid_result[:, 0, :]
-
-            # Non-dimensionalize mid-point velocities when working with dimensionless coordinates
-            # CRITICAL: global_evaluate now returns UnitAwareArray with units attached
-            # Check if velocities already have units before trying to add them manually
-            if not has_units:
-                # Coordinates are dimensionless - need to non-dimensionalize velocities too
-                if isinstance(v_at_mid_pts, UnitAwareArray):
-                    # Velocities already have units from global_evaluate - just non-dimensionalize
-                    v_nondim = uw.non_dimensionalise(v_at_mid_pts, model)
-                    # Extract numpy array for dimensionless calculation
-                    if isinstance(v_nondim, UnitAwareArray):
-                        v_at_mid_pts = np.array(v_nondim)
-                    elif hasattr(v_nondim, "value"):
-                        v_at_mid_pts = v_nondim.value
-                    else:
-                        v_at_mid_pts = v_nondim
-                else:
-                    # Velocities don't have units - try to add them manually (legacy path)
-                    v_units = uw.get_units(self.V_fn)
-                    if v_units and v_units != "dimensionless":
-                        v_with_units = UnitAwareArray(v_at_mid_pts, units=v_units)
-                        v_nondim = uw.non_dimensionalise(v_with_units, model)
-                        if isinstance(v_nondim, UnitAwareArray):
-                            v_at_mid_pts = np.array(v_nondim)
-                        elif hasattr(v_nondim, "value"):
-                            v_at_mid_pts = v_nondim.value
-                        else:
-                            v_at_mid_pts = v_nondim
-            else:
-                # Dimensional mode - ensure velocities have units
-                # CRITICAL: If V_fn doesn't have unit metadata, evaluate() returns plain numpy
-                # We need to manually wrap it with units for dimensional arithmetic to work
-                if not isinstance(v_at_mid_pts, UnitAwareArray):
-                    v_units = uw.get_units(self.V_fn)
-                    if v_units and v_units != "dimensionless":
-                        # Wrap velocities with their proper units
-                        v_at_mid_pts = UnitAwareArray(v_at_mid_pts, units=v_units)
-
-            # Calculate upstream coordinates: current position - velocity * timestep
-            end_pt_coords = coords - v_at_mid_pts * dt_for_calc
-
-            # Clamp upstream coordinates to the domain boundary
-            if self.mesh.return_coords_to_bounds is not None:
-                end_pt_coords = self.mesh.return_coords_to_bounds(end_pt_coords)
-
-            # Extract scalar from (1,1) Matrix for scalar variables
-            # MeshVariable.sym returns Matrix([[value]]) for scalars
-            expr_to_evaluate = self.psi_star[i].sym
-            if hasattr(expr_to_evaluate, 'shape') and expr_to_evaluate.shape == (1, 1):
-                expr_to_evaluate = expr_to_evaluate[0, 0]
-
-            # Evaluate psi_star at upstream coordinates
-            # global_evaluate now returns dimensional results (gateway fix 2025-11-28)
-            value_at_end_points = uw.function.global_evaluate(
-                expr_to_evaluate,
-                end_pt_coords,
-            )
+            if isinstance(values_at_end_points, UnitAwareArray) and not isinstance(
+                value_at_end_points, UnitAwareArray
+            ):
+                value_at_end_points = UnitAwareArray(
+                    value_at_end_points, units=values_at_end_points.units
+                )
 
             # CRITICAL FIX (2025-11-27): If psi_star has units, ensure the assigned
             # value also has units. global_evaluate may return plain arrays.
@@ -1595,6 +1562,138 @@ class SemiLagrangian(uw_object):
 
         return
 
+    def _node_sample_coords(self):
+        """
+        Non-dimensional node coordinates of psi_star, nudged into their cells.
+
+        The nodes only move with the mesh, so the closest-cell search is
+        repeated only when the coordinates change.
+        """
+        # CRITICAL FIX (2025-11-28): Handle coordinates correctly for unit-aware mode.
+        # Previous bug: extracting .magnitude gives METERS (e.g., 1000000), but:
+        # - mesh.get_closest_cells() expects [0-1] non-dimensional coords
+        # - evaluate() assumes plain numpy is [0-1] non-dimensional
+        # Solution: use uw.non_dimensionalise() for proper conversion.
+        from underworld3.utilities.unit_aware_array import UnitAwareArray
+
+        psi_star_0_coords = self.psi_star[0].coords
+
+        # For mesh internal operations, need non-dimensional [0-1] coordinates
+        if hasattr(psi_star_0_coords, "magnitude"):
+            # Unit-aware coords - need to non-dimensionalize (not just extract magnitude!)
+            psi_star_0_coords_nd = uw.non_dimensionalise(psi_star_0_coords)
+            # Extract to plain numpy for mesh operations
+            if isinstance(psi_star_0_coords_nd, UnitAwareArray):
+                psi_star_0_coords_nd = np.array(psi_star_0_coords_nd)
+            elif hasattr(psi_star_0_coords_nd, 'magnitude'):
+                psi_star_0_coords_nd = psi_star_0_coords_nd.magnitude
+            else:
+                psi_star_0_coords_nd = np.array(psi_star_0_coords_nd)
+        else:
+            # Plain numpy - assume already non-dimensional
+            psi_star_0_coords_nd = np.asarray(psi_star_0_coords)
+
+        if self._node_coords_cache is not None and np.array_equal(
+            self._node_coords_cache[0], psi_star_0_coords_nd
+        ):
+            return self._node_coords_cache[1]
+
+        cellid = self.mesh.get_closest_cells(
+            psi_star_0_coords_nd,
+        )
+
+        # Move slightly within the chosen cell to avoid edge effects
+        centroid_coords = self.mesh._centroids[cellid]
+
+        shift = 0.001
+        node_coords_nd = (1.0 - shift) * psi_star_0_coords_nd[:, :] + shift * centroid_coords[
+            :, :
+        ]
+
+        self._node_coords_cache = (np.array(psi_star_0_coords_nd), node_coords_nd)
+
+        return node_coords_nd
+
+    def _velocity_for_tracing(self, v_result, model, has_units, redimensionalise):
+        """
+        Velocities from an evaluation, in the units of the coordinates.
+
+        `redimensionalise` marks values that come back non-dimensional when
+        V_fn carries no unit metadata (`evaluate`); `global_evaluate` returns
+        dimensional values.
+        """
+        from underworld3.utilities.unit_aware_array import UnitAwareArray
+
+        # CRITICAL: Preserve UnitAwareArray through slicing
+        # Slicing can sometimes return plain numpy views - need to preserve wrapper
+        if isinstance(v_result, UnitAwareArray):
+            # Slice and rewrap to preserve units
+            velocity = v_result[:, 0, :]
+            if not isinstance(velocity, UnitAwareArray):
+                # Slicing lost the wrapper - rewrap it
+                velocity = UnitAwareArray(velocity, units=v_result.units)
+        else:
+            velocity = v_result[:, 0, :]
+
+        # Non-dimensionalize velocities when working with dimensionless coordinates
+        # This prevents dimensional mismatch: velocities in m/s mixed with coords in [0,1]
+        # CRITICAL: evaluate now returns UnitAwareArray with units attached
+        # Check if velocities already have units before trying to add them manually
+        if not has_units:
+            # Coordinates are dimensionless - need to non-dimensionalize velocities too
+            if isinstance(velocity, UnitAwareArray):
+                # Velocities already have units from evaluate - just non-dimensionalize
+                v_nondim = uw.non_dimensionalise(velocity, model)
+                # Extract numpy array for dimensionless calculation
+                if isinstance(v_nondim, UnitAwareArray):
+                    velocity = np.array(v_nondim)
+                elif hasattr(v_nondim, "value"):
+                    velocity = v_nondim.value
+                else:
+                    velocity = v_nondim
+            else:
+                # Velocities don't have units - try to add them manually (legacy path)
+                v_units = uw.get_units(self.V_fn)
+                if v_units and v_units != "dimensionless":
+                    v_with_units = UnitAwareArray(velocity, units=v_units)
+                    v_nondim = uw.non_dimensionalise(v_with_units, model)
+                    if isinstance(v_nondim, UnitAwareArray):
+                        velocity = np.array(v_nondim)
+                    elif hasattr(v_nondim, "value"):
+                        velocity = v_nondim.value
+                    else:
+                        velocity = v_nondim
+        else:
+            # Dimensional mode - ensure velocities have units
+            # CRITICAL FIX (2025-11-27): Variable data is stored NON-DIMENSIONALLY.
+            # We must DIMENSIONALIZE (not just wrap) the values before dimensional arithmetic.
+            # Previous bug: wrapping 0.01 (ND) with cm/yr gave 0.01 cm/yr instead of 1 cm/yr.
+            if not isinstance(velocity, UnitAwareArray):
+                v_units = uw.get_units(self.V_fn)
+                if v_units and v_units != "dimensionless":
+                    if redimensionalise and uw.is_nondimensional_scaling_active():
+                        from underworld3.scaling import dimensionalise
+                        # dimensionalise(nd_value, units) -> value * scale in those units
+                        v_dimensional = dimensionalise(velocity, v_units)
+                        velocity = UnitAwareArray(v_dimensional.magnitude, units=v_dimensional.units)
+                    else:
+                        # Values are already dimensional - wrap them with their units
+                        velocity = UnitAwareArray(velocity, units=v_units)
+
+        return velocity
+
+    def _evaluation_plan(self, stage, expr):
+        """Persistent `EvaluationPlan` for one stage of the upstream update."""
+        mesh, _, _ = uw.function.expressions.mesh_vars_in_expression(expr)
+        if mesh is None:
+            mesh = self.mesh
+
+        plan = self._evaluation_plans.get(stage)
+        if plan is None or plan.mesh is not mesh:
+            plan = uw.function.EvaluationPlan(mesh)
+            self._evaluation_plans[stage] = plan
+        return plan
+
     def bdf(self, order=None):
         r"""Backward differentiation approximation of the time-derivative of :math:`\psi`.
 
@@ -2076,18 +2175,13 @@ class Lagrangian_Swarm(uw_object):
         be called manually after setting initial conditions.
         """
         psi_star_0 = self.psi_star[0]
-        with self.swarm.access(psi_star_0):
-            for i in range(psi_star_0.shape[0]):
-                for j in range(psi_star_0.shape[1]):
-                    updated_psi = uw.function.evaluate(
-                        self.psi_fn[i, j],
-                        self.swarm.data,
-                    )
-                    psi_star_0[i, j].data[:] = updated_psi
 
-        # Copy to all other history slots
-        for k in range(1, self.order):
-            with self.swarm.access(self.psi_star[k]):
+        # One deferred sync (proxy update) for all the history slots
+        with self.swarm.access(*self.psi_star):
+            psi_star_0.array[...] = self._evaluate_psi_fn()
+
+            # Copy to all other history slots
+            for k in range(1, self.order):
                 self.psi_star[k].data[...] = psi_star_0.data[...]
 
         self._history_initialised = True
@@ -2146,41 +2240,47 @@ class Lagrangian_Swarm(uw_object):
             self._dt_history[i] = self._dt_history[i - 1]
         self._dt_history[0] = dt
 
-        for h in range(self.order - 1):
-            i = self.order - (h + 1)
-
-            # copy the information down the chain
-            if verbose:
-                print(f"Lagrange swarm order = {self.order}", flush=True)
-                print(
-                    f"Mesh interpolant order = {self.psi_star[0]._meshVar.degree}",
-                    flush=True,
-                )
-                print(f"Lagrange swarm copying {i-1} to {i}", flush=True)
-
-            with self.swarm.access(self.psi_star[i]):
-                self.psi_star[i].data[...] = self.psi_star[i - 1].data[...]
+        if verbose:
+            print(f"Lagrange swarm order = {self.order}", flush=True)
+            print(
+                f"Mesh interpolant order = {self.psi_star[0]._meshVar.degree}",
+                flush=True,
+            )
 
         phi = 1 / self.step_averaging
 
         psi_star_0 = self.psi_star[0]
+
+        # copy the information down the chain (one sync for all the slots).
+        # This comes first: psi_fn may refer to the shifted history.
+        if self.order > 1:
+            with self.swarm.access(*self.psi_star[1:]):
+                for i in range(self.order - 1, 0, -1):
+                    if verbose:
+                        print(f"Lagrange swarm copying {i-1} to {i}", flush=True)
+                    self.psi_star[i].data[...] = self.psi_star[i - 1].data[...]
+
+        # The full psi_fn matrix is evaluated in one pass (not component by
+        # component)
+        updated_psi = self._evaluate_psi_fn(evalf=evalf)
+
         with self.swarm.access(psi_star_0):
-            for i in range(psi_star_0.shape[0]):
-                for j in range(psi_star_0.shape[1]):
-                    updated_psi = uw.function.evaluate(
-                        self.psi_fn[i, j],
-                        self.swarm.data,
-                        evalf=evalf,
-                    )
-                    psi_star_0[i, j].data[:] = (
-                        phi * updated_psi + (1 - phi) * psi_star_0[i, j].data[:]
-                    )
+            psi_star_0.array[...] = phi * updated_psi + (1 - phi) * psi_star_0.array[...]
 
         if self._n_solves_completed < self.order:
             self._n_solves_completed += 1
 
         return
 
+    def _evaluate_psi_fn(self, evalf=False):
+        """All the components of psi_fn at the particles, shape (N, *psi_star shape)."""
+        values = uw.function.evaluate(
+            self.psi_fn,
+            self.swarm.data,
+            evalf=evalf,
+        )
+        return values.reshape(-1, *self.psi_star[0].shape)
+
     def bdf(self, order=None):
         r"""Backward differentiation approximation of the time-derivative of :math:`\psi`.
 
@@ -0,0 +1,413 @@
+"""
+Persistent on-disk cache for JIT-compiled extension modules.
+
+The JIT machinery in :mod:`underworld3.utilities._jitextension` generates
+Cython/C sources for the pointwise functions of each solver and compiles
+them with ``setup.py build_ext``. The in-memory ``_ext_dict`` only lives as
+long as the process, so every new run (or pytest worker, or batch job) pays
+the full compilation cost again for exactly the same kernels.
+
+This module keeps the compiled shared objects in a content-addressed
+directory. The key is a SHA-256 digest of the generated sources (which are
+derived from the structural form of the expressions, with constants replaced
+by ``constants[i]`` placeholders) together with the PETSc, compiler, Python
+and Underworld versions, so a cached module is never reused against a
+different toolchain.
+
+Configuration (environment variables, or :func:`underworld3.jit.configure_cache`):
+
+- ``UW_JIT_CACHE`` : set to ``0`` / ``false`` / ``off`` to disable the cache.
+- ``UW_JIT_CACHE_DIR`` : cache location
+  (default ``$XDG_CACHE_HOME/underworld3/jit`` or ``~/.cache/underworld3/jit``).
+- ``UW_JIT_CACHE_SIZE_MB`` : size bound for LRU eviction (default 1024).
+
+Concurrent population (several processes asking for the same module) is
+serialised with a per-key ``fcntl`` lock so only one of them compiles; the
+others wait and then load the stored result.
+"""
+
+import os
+import re
+import sys
+import time
+import shutil
+import hashlib
+import sysconfig
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+
+_DEFAULT_SIZE_MB = 1024
+_FALSE_STRINGS = ("0", "false", "off", "no")
+
+# The files the cache itself writes: modules, lock files and temporary copies
+_KEY_PATTERN = "[0-9a-f]{64}"
+_LOCK_RE = re.compile(rf"{_KEY_PATTERN}\.lock")
+_TMP_RE = re.compile(rf"\.{_KEY_PATTERN}\.[0-9]+\.tmp")
+
+
+def _default_cache_dir():
+    base = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(base, "underworld3", "jit")
+
+
+def _toolchain_signature():
+    """Versions that a compiled module depends on (besides its source).
+
+    Any change here produces different cache keys, so modules built against a
+    different PETSc, compiler, Python ABI or Underworld release are never
+    loaded by mistake.
+    """
+    parts = [
+        sys.implementation.cache_tag or "",
+        sysconfig.get_config_var("EXT_SUFFIX") or "",
+        sysconfig.get_config_var("CC") or "",
+    ]
+
+    try:
+        import petsc4py
+        from petsc4py import PETSc
+
+        config = petsc4py.get_config()
+        parts.append(config.get("PETSC_DIR", "") + "/" + config.get("PETSC_ARCH", ""))
+        parts.append(".".join(str(v) for v in PETSc.Sys.getVersion()))
+    except Exception:
+        parts.append("petsc-unknown")
+
+    try:
+        import numpy
+
+        parts.append(numpy.__version__)
+    except Exception:
+        pass
+
+    try:
+        import underworld3
+
+        parts.append(str(underworld3.__version__))
+    except Exception:
+        parts.append("uw-unknown")
+
+    return "|".join(parts)
+
+
+class JITCache:
+    """
+    Content-addressed, size-bounded store of compiled JIT extension modules.
+
+    Entries are single shared-object files named ``<key><EXT_SUFFIX>``.
+    Recency is tracked through the file modification time (touched on every
+    hit), and the least recently used entries are removed when the total
+    size exceeds ``max_size_mb``.
+
+    Statistics (hits, misses, stores, evictions, load failures) are kept per
+    process and are available via :meth:`get_stats`.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_size_mb: Optional[float] = None,
+        enabled: Optional[bool] = None,
+    ):
+        if enabled is None:
+            enabled = os.environ.get("UW_JIT_CACHE", "1").strip().lower() not in _FALSE_STRINGS
+        if directory is None:
+            directory = os.environ.get("UW_JIT_CACHE_DIR", _default_cache_dir())
+        if max_size_mb is None:
+            max_size_mb = float(os.environ.get("UW_JIT_CACHE_SIZE_MB", _DEFAULT_SIZE_MB))
+
+        self.enabled = bool(enabled)
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_size_mb = float(max_size_mb)
+
+        self._signature = None
+        self._stats_lock = threading.Lock()  # background builds update the stats
+        self.reset_stats()
+
+    # ------------------------------------------------------------------
+    # Keys and paths
+    # ------------------------------------------------------------------
+
+    @property
+    def signature(self) -> str:
+        if self._signature is None:
+            self._signature = _toolchain_signature()
+        return self._signature
+
+    def key(self, *sources) -> str:
+        """SHA-256 digest of the given source texts and the toolchain signature."""
+        h = hashlib.sha256()
+        h.update(self.signature.encode())
+        for src in sources:
+            h.update(b"\0")
+            h.update(str(src).encode())
+        return h.hexdigest()
+
+    def path_for(self, key: str) -> str:
+        suffix = sysconfig.get_config_var("EXT_SUFFIX") or ".so"
+        return os.path.join(self.directory, key + suffix)
+
+    def _ensure_directory(self) -> bool:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            return True
+        except OSError:
+            return False
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def populate_lock(self, key: str):
+        """Exclusive, cross-process lock for populating ``key``.
+
+        Waiters block until the holder has finished compiling and storing the
+        module, then find it with :meth:`lookup`. Degrades to a no-op if the
+        cache directory is not writable or ``fcntl`` is unavailable.
+        """
+        if not self.enabled or fcntl is None or not self._ensure_directory():
+            yield
+            return
+
+        lockfile = os.path.join(self.directory, key + ".lock")
+        try:
+            fd = os.open(lockfile, os.O_CREAT | os.O_RDWR, 0o644)
+        except OSError:
+            yield
+            return
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Return the path of the cached module for ``key`` or ``None``."""
+        if not self.enabled:
+            return None
+
+        path = self.path_for(key)
+        if os.path.exists(path):
+            self._count("hits")
+            try:
+                os.utime(path, None)  # LRU bookkeeping
+            except OSError:
+                pass
+            return path
+
+        self._count("misses")
+        return None
+
+    def store(self, key: str, built_path: str) -> Optional[str]:
+        """Copy a freshly built module into the cache (atomically).
+
+        Returns the cached path, or ``None`` if the cache is disabled or the
+        copy failed (in which case the caller should load ``built_path``).
+        """
+        if not self.enabled or not self._ensure_directory():
+            return None
+
+        path = self.path_for(key)
+        tmp_path = os.path.join(self.directory, f".{key}.{os.getpid()}.tmp")
+        try:
+            shutil.copy2(built_path, tmp_path)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return None
+
+        self._count("stores")
+        self.evict()
+        return path
+
+    def discard(self, key: str):
+        """Remove an entry that could not be loaded (e.g. truncated file)."""
+        self._count("load_failures")
+        try:
+            os.remove(self.path_for(key))
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _is_module_name(fname) -> bool:
+        suffix = sysconfig.get_config_var("EXT_SUFFIX") or ".so"
+        return fname.endswith(suffix) and re.fullmatch(_KEY_PATTERN, fname[: -len(suffix)]) is not None
+
+    def _entries(self):
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+
+        for fname in names:
+            if not self._is_module_name(fname):
+                continue
+            path = os.path.join(self.directory, fname)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Remove least recently used entries until the size bound holds."""
+        max_bytes = self.max_size_mb * 1024 * 1024
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            # Lock files are left in place: another process may hold one.
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self._count("evictions")
+
+    def clear(self):
+        """Remove every cached module, lock file and temporary copy.
+
+        Only files named by the cache are touched, so the cache directory can
+        safely be shared with other files.
+        """
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+
+        for fname in names:
+            if not (
+                self._is_module_name(fname)
+                or _LOCK_RE.fullmatch(fname)
+                or _TMP_RE.fullmatch(fname)
+            ):
+                continue
+            try:
+                os.remove(os.path.join(self.directory, fname))
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics for this process.
+
+        Returns
+        -------
+        dict with metrics:
+            - enabled, directory, max_size_mb
+            - hits, misses, hit_rate
+            - stores, evictions, load_failures
+            - entries, size_mb: current on-disk contents
+            - compile_time: seconds spent compiling on misses
+        """
+        lookups = self._stats["hits"] + self._stats["misses"]
+        entries = self._entries()
+
+        return {
+            "enabled": self.enabled,
+            "directory": self.directory,
+            "max_size_mb": self.max_size_mb,
+            "hits": self._stats["hits"],
+            "misses": self._stats["misses"],
+            "hit_rate": self._stats["hits"] / lookups if lookups > 0 else 0.0,
+            "stores": self._stats["stores"],
+            "evictions": self._stats["evictions"],
+            "load_failures": self._stats["load_failures"],
+            "entries": len(entries),
+            "size_mb": sum(size for _, size, _ in entries) / (1024 * 1024),
+            "compile_time": self._stats["compile_time"],
+        }
+
+    def print_stats(self):
+        """Print cache statistics (user-facing)."""
+        stats = self.get_stats()
+
+        print(f"\n{'=' * 60}")
+        print(f"JIT Extension Cache: {stats['directory']}")
+        print(f"{'=' * 60}")
+        print(f"Enabled:       {str(stats['enabled']):>10}")
+        print(f"Hits:          {stats['hits']:>10,}  ({stats['hit_rate']*100:>5.1f}%)")
+        print(f"Misses:        {stats['misses']:>10,}")
+        print(f"Stores:        {stats['stores']:>10,}")
+        print(f"Evictions:     {stats['evictions']:>10,}")
+        print(f"Entries:       {stats['entries']:>10,}")
+        print(f"Size (MB):     {stats['size_mb']:>10.1f} / {stats['max_size_mb']:.0f}")
+        print(f"Compile time:  {stats['compile_time']:>10.1f} s")
+        print(f"{'=' * 60}\n")
+
+    def _count(self, name, amount=1):
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    def add_compile_time(self, seconds: float):
+        """Record time spent compiling a module (thread safe)."""
+        self._count("compile_time", seconds)
+
+    def reset_stats(self):
+        """Reset statistics (but keep cached entries)."""
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "load_failures": 0,
+            "compile_time": 0.0,
+        }
+
+
+_jit_cache = None
+
+
+def get_jit_cache() -> JITCache:
+    """Return the process-wide :class:`JITCache`, creating it on first use."""
+    global _jit_cache
+    if _jit_cache is None:
+        _jit_cache = JITCache()
+    return _jit_cache
+
+
+def configure_jit_cache(directory=None, max_size_mb=None, enabled=None) -> JITCache:
+    """Replace the process-wide cache with one using the given settings.
+
+    Unspecified settings keep their current values.
+    """
+    global _jit_cache
+    current = get_jit_cache()
+    _jit_cache = JITCache(
+        directory=directory if directory is not None else current.directory,
+        max_size_mb=max_size_mb if max_size_mb is not None else current.max_size_mb,
+        enabled=enabled if enabled is not None else current.enabled,
+    )
+    return _jit_cache
@@ -1,4 +1,5 @@
 from typing import List
+import os
 import subprocess
 from xmlrpc.client import boolean
 import sympy
@@ -6,6 +7,7 @@ import underworld3
 import underworld3.timing as timing
 from typing import Optional
 from collections import namedtuple
+from underworld3.utilities._jitcache import get_jit_cache
 
 
 ## This is not required in sympy >= 1.9
@@ -269,6 +271,747 @@ def debugging_text_bd(randstr, fn, fn_type, eqn_no):
     return debug_str
 
 
+_RANDSTR_PLACEHOLDER = "__UW_JIT_PREFIX__"
+
+_SETUP_PY_TEMPLATE = """
+try:
+    from setuptools import setup
+    from setuptools import Extension
+except ImportError:
+    from distutils.core import setup
+    from distutils.extension import Extension
+from Cython.Build import cythonize
+
+ext_mods = [Extension(
+    '{NAME}', ['cy_ext.pyx',],
+    include_dirs={HEADERS},
+    library_dirs={LIBDIRS},
+    runtime_library_dirs={LIBDIRS},
+    libraries={LIBFILES},
+    extra_compile_args=['-std=c99','-O3'],
+    extra_link_args=[]
+)]
+setup(ext_modules=cythonize(ext_mods))
+"""
+
+
+def _setup_py_source(modname):
+    """The `setup.py` used to build a JIT extension called `modname`."""
+    return _SETUP_PY_TEMPLATE.format(
+        NAME=modname,
+        HEADERS=list(underworld3._incdirs.keys()),
+        LIBDIRS=list(underworld3._libdirs.keys()),
+        LIBFILES=list(underworld3._libfiles.keys()),
+    )
+
+
+def _load_dynamic(name, path):
+    """
+    Load an extension module.
+    Borrowed from:
+        https://stackoverflow.com/a/55172547
+    """
+    import importlib.machinery
+    from importlib._bootstrap import _load
+
+    loader = importlib.machinery.ExtensionFileLoader(name, path)
+
+    # Issue #24748: Skip the sys.modules check in _load_module_shims
+    # always load new extension
+    spec = importlib.machinery.ModuleSpec(name=name, loader=loader, origin=path)
+    return _load(spec)
+
+
+def _build_extension(modname, codeguys, verbose=False):
+    """Write the generated sources to a fresh directory and compile them.
+
+    Returns
+    -------
+    (str, str or None)
+        The build directory and the path of the built shared object
+        (``None`` if the build failed).
+    """
+    import os
+    import sys
+    import time
+    import random
+
+    # Make directory name unique to avoid race conditions between parallel processes
+    unique_suffix = f"{os.getpid()}_{int(time.time() * 1000)}_{random.randint(1000, 9999)}"
+    tmpdir = os.path.join("/tmp", f"{modname}_{unique_suffix}")
+
+    try:
+        os.makedirs(tmpdir, exist_ok=True)
+    except OSError as e:
+        if verbose:
+            print(f"Warning: Failed to create tmpdir {tmpdir}: {e}")
+        raise RuntimeError(f"Cannot create temporary directory {tmpdir}") from e
+    for thing in codeguys:
+        filename = thing[0]
+        strguy = thing[1]
+        with open(os.path.join(tmpdir, filename), "w") as f:
+            f.write(strguy)
+
+    # Build
+    time_s = time.time()
+    process = subprocess.Popen(
+        [sys.executable] + "setup.py build_ext --inplace".split(),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=tmpdir,
+    )
+    stdout, stderr = process.communicate()
+    get_jit_cache().add_compile_time(time.time() - time_s)
+
+    # Check if build process failed
+    if process.returncode != 0:
+        if verbose:
+            print(f"Warning: Build process failed with return code {process.returncode}")
+            print(f"stdout: {stdout.decode() if stdout else 'None'}")
+            print(f"stderr: {stderr.decode() if stderr else 'None'}")
+
+    # Check if tmpdir exists before trying to list it
+    if os.path.exists(tmpdir):
+        for _file in os.listdir(tmpdir):
+            if _file.endswith(".so"):
+                return tmpdir, os.path.join(tmpdir, _file)
+    else:
+        # tmpdir doesn't exist, likely build process failed
+        if verbose:
+            print(f"Warning: tmpdir {tmpdir} does not exist - build process may have failed")
+
+    return tmpdir, None
+
+
+def _structural_fns(raw_fns, mesh):
+    """Structural form of a set of (pre-unwrap) functions.
+
+    Constant UWexpressions are replaced by `_JITConstant` placeholders and the
+    remaining expressions are unwrapped, so the result depends on the form
+    of the functions but not on the current values of constants.
+
+    Returns
+    -------
+    (list, dict, tuple)
+        The constants manifest, the constants substitution map and the
+        structurally-expanded functions.
+    """
+    # Extract constant UWexpressions that will go through constants[] array
+    constants_manifest, constants_subs_map = _extract_constants(raw_fns, mesh)
+
+    # Build structurally-expanded functions for cache hashing.
+    # Constants are replaced with placeholder symbols (value-independent),
+    # so changing a constant value won't cause a cache miss.
+    expanded_fns = []
+    for fn in raw_fns:
+        # Phase 1: Substitute constants with _JITConstant placeholders
+        if constants_subs_map and fn is not None:
+            try:
+                fn_structural = fn.xreplace(constants_subs_map) if hasattr(fn, 'xreplace') else fn
+            except Exception:
+                fn_structural = fn
+        else:
+            fn_structural = fn
+
+        # Phase 2: Unwrap remaining (non-constant) expressions
+        expanded_fns.append(
+            underworld3.function.expressions.unwrap(fn_structural, keep_constants=False, return_self=False)
+        )
+
+    return constants_manifest, constants_subs_map, tuple(expanded_fns)
+
+
+# ============================================================================
+# Pointwise Function Memoisation
+# ============================================================================
+#
+# Solvers derive their Jacobian blocks (G0-G3) by symbolic differentiation
+# and then JIT-compile everything whenever they are flagged as not set up.
+# Changing the value of a constant (a material parameter, the timestep) flags
+# the solver but leaves the pointwise functions structurally identical. The
+# memo maps the structural form of a solver's inputs to the derived blocks
+# and compiled extension so that such rebuilds skip differentiation and JIT;
+# the new constant values reach PETSc through PetscDSSetConstants.
+# ============================================================================
+
+from collections import OrderedDict as _OrderedDict
+
+_pointwise_memo = _OrderedDict()
+_pointwise_memo_settings = {
+    "enabled": os.environ.get("UW_JIT_MEMO", "1").strip().lower()
+    not in ("0", "false", "off", "no"),
+    "max_entries": 64,
+}
+_pointwise_memo_stats = {"hits": 0, "misses": 0}
+
+
+def _split_symbolic(inputs, symbolic, skeleton):
+    """Separate the sympy objects in a nested tuple from the rest."""
+    for item in inputs:
+        if isinstance(item, (tuple, list)):
+            sub = []
+            _split_symbolic(item, symbolic, sub)
+            skeleton.append(tuple(sub))
+        elif isinstance(item, (sympy.Basic, sympy.MatrixBase)):
+            symbolic.append(item)
+            skeleton.append(len(symbolic) - 1)
+        else:
+            skeleton.append(item)
+
+
+def pointwise_memo_key(mesh, kind, inputs):
+    """Key identifying a solver's pointwise functions by structure.
+
+    Parameters
+    ----------
+    mesh : underworld3.discretisation.Mesh
+    kind : str
+        Solver type (different solvers derive different blocks).
+    inputs : tuple
+        Nested tuple of the solver's symbolic inputs (residual terms,
+        unknowns, boundary conditions). Non-sympy entries (boundary names,
+        component lists) are compared as they are.
+
+    Returns
+    -------
+    tuple or None
+        Hashable key, or None if memoisation is disabled.
+    """
+    if not _pointwise_memo_settings["enabled"]:
+        return None
+
+    symbolic = []
+    skeleton = []
+    _split_symbolic(inputs, symbolic, skeleton)
+
+    # Both forms are needed: the wrapped expressions determine the derivatives,
+    # the structural (unwrapped) form determines the generated code.
+    _, _, structural = _structural_fns(tuple(symbolic), mesh)
+
+    return (
+        kind,
+        getattr(mesh, "instance_number", id(mesh)),
+        getattr(mesh, "_topology_version", 0),
+        getattr(mesh, "_mesh_version", 0),
+        tuple(mesh.vars.keys()),
+        tuple(skeleton),
+        tuple(symbolic),
+        structural,
+    )
+
+
+def pointwise_memo_lookup(key):
+    """Stored pointwise state for `key`, or None."""
+    if key is None:
+        return None
+
+    state = _pointwise_memo.get(key)
+    if state is None:
+        _pointwise_memo_stats["misses"] += 1
+        return None
+
+    _pointwise_memo.move_to_end(key)
+    _pointwise_memo_stats["hits"] += 1
+    return state
+
+
+def pointwise_memo_store(key, state):
+    """Remember the pointwise state derived for `key` (bounded, LRU)."""
+    if key is None:
+        return
+
+    _pointwise_memo[key] = state
+    _pointwise_memo.move_to_end(key)
+    while len(_pointwise_memo) > _pointwise_memo_settings["max_entries"]:
+        _pointwise_memo.popitem(last=False)
+
+
+# ============================================================================
+# Collective (MPI) JIT Compilation
+# ============================================================================
+#
+# With N ranks, compiling independently means N identical compiler processes
+# hitting the shared filesystem. In collective mode rank 0 compiles (or finds
+# the module in the disk cache), the shared-object bytes are broadcast to one
+# leader rank per node, written to node-local storage and loaded by every
+# rank on that node. Failures are broadcast too, so all ranks raise together.
+# ============================================================================
+
+_collective_settings = {
+    "enabled": os.environ.get("UW_JIT_COLLECTIVE", "1").strip().lower()
+    not in ("0", "false", "off", "no"),
+    "node_dir": os.environ.get("UW_JIT_NODE_DIR", None),
+}
+
+_collective_comms = {}
+
+
+def _collective_jit_active():
+    return _collective_settings["enabled"] and underworld3.mpi.size > 1
+
+
+def _node_comms():
+    """Communicators for the ranks on this node and for the node leaders.
+
+    Created once and reused. The leaders communicator is ``None`` on ranks
+    that are not the lowest rank on their node.
+    """
+    if not _collective_comms:
+        from mpi4py import MPI
+
+        comm = underworld3.mpi.comm
+        node_comm = comm.Split_type(MPI.COMM_TYPE_SHARED, key=comm.rank)
+        colour = 0 if node_comm.rank == 0 else MPI.UNDEFINED
+        leaders_comm = comm.Split(colour, key=comm.rank)
+        if leaders_comm == MPI.COMM_NULL:
+            leaders_comm = None
+
+        _collective_comms["node"] = node_comm
+        _collective_comms["leaders"] = leaders_comm
+
+    return _collective_comms["node"], _collective_comms["leaders"]
+
+
+def _node_local_dir():
+    import tempfile
+
+    node_dir = _collective_settings["node_dir"]
+    if node_dir is None:
+        node_dir = os.path.join(tempfile.gettempdir(), f"uw3_jit_{os.getuid()}")
+    return node_dir
+
+
+def _collective_build_and_load(modname, codeguys, cache_key, use_disk_cache, verbose=False):
+    """Compile once on rank 0, distribute the module, load it on every rank.
+
+    Must be called by all ranks of ``underworld3.mpi.comm``.
+
+    Returns
+    -------
+    module
+        The loaded extension module.
+
+    Raises
+    ------
+    RuntimeError
+        On every rank, if the build on rank 0 or the distribution/load on any
+        rank failed.
+    """
+    import sysconfig
+
+    comm = underworld3.mpi.comm
+    node_comm, leaders_comm = _node_comms()
+
+    # --- rank 0: obtain the shared object ---------------------------------
+    payload = None
+    if comm.rank == 0:
+        so_bytes = None
+        error = None
+        try:
+            tmpdir, so_path, _ = _obtain_shared_object(
+                modname, codeguys, cache_key, use_disk_cache, verbose
+            )
+
+            if so_path is None:
+                error = (
+                    f"The Underworld extension module {modname} failed to build on rank 0. "
+                    f"The generated module may be found at:\n    {str(tmpdir)}\n"
+                    f"Re-run with verbose=True for the compiler output."
+                )
+            else:
+                with open(so_path, "rb") as f:
+                    so_bytes = f.read()
+        except Exception as e:
+            error = f"JIT compilation of {modname} failed on rank 0: {e!r}"
+
+        payload = (so_bytes, error)
+
+    # --- broadcast to node leaders, who write to node-local storage --------
+    local_error = None
+    suffix = sysconfig.get_config_var("EXT_SUFFIX") or ".so"
+    node_dir = _node_local_dir()
+    local_path = os.path.join(node_dir, modname + suffix)
+
+    if leaders_comm is not None:
+        payload = leaders_comm.bcast(payload, root=0)
+        so_bytes, error = payload
+        if error is None and not os.path.exists(local_path):
+            try:
+                os.makedirs(node_dir, exist_ok=True)
+                tmp_path = os.path.join(node_dir, f".{modname}.{os.getpid()}.tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(so_bytes)
+                os.replace(tmp_path, local_path)
+            except OSError as e:
+                local_error = f"Could not write JIT module to {local_path}: {e!r}"
+        payload = None  # release the bytes
+    else:
+        error = None
+
+    # Root error is relayed to every rank of the node with the leader status
+    error, leader_error = node_comm.bcast(
+        (error, local_error) if node_comm.rank == 0 else None, root=0
+    )
+
+    # --- every rank loads its node-local copy ----------------------------
+    module = None
+    if error is None and leader_error is None:
+        try:
+            module = _load_dynamic(modname, local_path)
+        except ImportError as e:
+            local_error = f"rank {comm.rank}: could not load {local_path}: {e!r}"
+    else:
+        local_error = error or leader_error
+
+    # Fail together: every rank learns about any failure anywhere
+    errors = [msg for msg in comm.allgather(local_error) if msg is not None]
+    if errors:
+        raise RuntimeError(
+            "Collective JIT compilation failed:\n    " + "\n    ".join(sorted(set(errors)))
+        )
+
+    if verbose and comm.rank == 0:
+        print(f"JIT module {modname} compiled once and distributed to {comm.size} ranks", flush=True)
+
+    return module
+
+
+def _consistent_across_ranks(value):
+    """True on all ranks if `value` (a string) is identical on every rank."""
+    comm = underworld3.mpi.comm
+    root_value = comm.bcast(value, root=0)
+    return comm.allreduce(int(root_value != value)) == 0
+
+
+# ============================================================================
+# Background Compilation
+# ============================================================================
+#
+# Each compilation is a blocking `setup.py build_ext` subprocess. When a model
+# sets up several solvers, the sources for all of them can be generated first
+# and the compilers run concurrently: inside `deferred_builds()`, `getext`
+# submits the build to a thread pool and returns a `PendingExtension` in
+# place of the function pointers. The first real use of the module (normally
+# the solver's next solve) waits for that build only. Threads suffice because
+# the work happens in the compiler subprocesses.
+# ============================================================================
+
+import threading as _threading
+from contextlib import contextmanager as _contextmanager
+
+_compile_pool_settings = {
+    "max_workers": int(os.environ.get("UW_JIT_WORKERS", "0")) or min(8, os.cpu_count() or 1),
+}
+_compile_pool = None
+_deferred_state = {"active": False}
+_pending_builds = {}
+_pending_lock = _threading.Lock()
+
+_PendingBuild = namedtuple(
+    "_PendingBuild", ["future", "modname", "codeguys", "cache_key", "use_disk_cache", "verbose"]
+)
+
+
+def _get_compile_pool():
+    global _compile_pool
+    if _compile_pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        _compile_pool = ThreadPoolExecutor(
+            max_workers=_compile_pool_settings["max_workers"],
+            thread_name_prefix="uw_jit",
+        )
+    return _compile_pool
+
+
+def _shutdown_compile_pool():
+    """Wait for running builds and discard the pool (it is recreated on demand)."""
+    global _compile_pool
+    if _compile_pool is not None:
+        _compile_pool.shutdown(wait=True)
+        _compile_pool = None
+
+
+@_contextmanager
+def deferred_builds():
+    """Submit JIT builds to the background pool instead of waiting for them.
+
+    Within the context, `getext` returns a `PendingExtension` as the
+    `ptrobj` of modules that still have to be compiled.
+    """
+    previous = _deferred_state["active"]
+    _deferred_state["active"] = True
+    try:
+        yield
+    finally:
+        _deferred_state["active"] = previous
+
+
+def builds_deferred():
+    """True inside `deferred_builds()`."""
+    return _deferred_state["active"]
+
+
+class PendingExtension:
+    """Placeholder for the function pointers of a module still being compiled.
+
+    Parameters
+    ----------
+    name :
+        The `_ext_dict` key of the module.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    @property
+    def future(self):
+        """The `concurrent.futures.Future` of the build (None once loaded)."""
+        with _pending_lock:
+            pending = _pending_builds.get(self.name)
+        return None if pending is None else pending.future
+
+    def done(self):
+        future = self.future
+        return future is None or future.done()
+
+    def resolve(self):
+        """Wait for the build, load the module and return its function pointers."""
+        wait_for_extension(self.name)
+        return _ext_dict[self.name].getptrobj()
+
+    def __repr__(self):
+        state = "done" if self.done() else "compiling"
+        return f"PendingExtension({self.name!r}, {state})"
+
+
+def _obtain_shared_object(modname, codeguys, cache_key, use_disk_cache, verbose=False):
+    """Find a module in the disk cache, or compile (and store) it.
+
+    Does not load the module, so it is safe to run in a worker thread.
+
+    Returns
+    -------
+    (str or None, str or None, bool)
+        The build directory, the path of the shared object (None if the
+        build failed) and whether it came from the disk cache.
+    """
+    if not use_disk_cache:
+        tmpdir, built = _build_extension(modname, codeguys, verbose)
+        return tmpdir, built, False
+
+    jit_cache = get_jit_cache()
+    with jit_cache.populate_lock(cache_key):
+        so_path = jit_cache.lookup(cache_key)
+        if so_path is not None:
+            return None, so_path, True
+
+        tmpdir, built = _build_extension(modname, codeguys, verbose)
+        if built is None:
+            return tmpdir, None, False
+
+        return tmpdir, jit_cache.store(cache_key, built) or built, False
+
+
+def _load_shared_object(name, modname, codeguys, cache_key, use_disk_cache, obtained, verbose=False):
+    """Load the result of `_obtain_shared_object` into `_ext_dict[name]`.
+
+    A cached module that fails to load is discarded and rebuilt. Returns the
+    build directory (None for a cached module).
+    """
+    tmpdir, so_path, from_cache = obtained
+
+    if so_path is not None and from_cache:
+        try:
+            _ext_dict[name] = _load_dynamic(modname, so_path)
+            if verbose and underworld3.mpi.rank == 0:
+                print(f"JIT module loaded from disk cache ... {so_path}", flush=True)
+            return tmpdir
+        except ImportError:
+            get_jit_cache().discard(cache_key)
+            tmpdir, so_path, from_cache = _obtain_shared_object(
+                modname, codeguys, cache_key, use_disk_cache, verbose
+            )
+
+    if so_path is not None:
+        _ext_dict[name] = _load_dynamic(modname, so_path)
+
+    return tmpdir
+
+
+def _build_failed_error(tmpdir):
+    return RuntimeError(
+        f"The Underworld extension module does not appear to have been built successfully. "
+        f"The generated module may be found at:\n    {str(tmpdir)}\n"
+        f"To investigate, you may attempt to build it manually by running\n"
+        f"    python3 setup.py build_ext --inplace\n"
+        f"from the above directory. Note that a new module will always be written by "
+        f"Underworld and therefore any modifications to the above files will not persist into "
+        f"your Underworld runtime.\n"
+        f"Please contact the developers if you are unable to resolve the issue."
+    )
+
+
+def _submit_build(name, modname, codeguys, cache_key, use_disk_cache, verbose=False):
+    future = _get_compile_pool().submit(
+        _obtain_shared_object, modname, codeguys, cache_key, use_disk_cache, verbose
+    )
+    with _pending_lock:
+        _pending_builds[name] = _PendingBuild(
+            future, modname, codeguys, cache_key, use_disk_cache, verbose
+        )
+    return future
+
+
+def pending_build(name):
+    """The future of a background build of module `name`, or None."""
+    with _pending_lock:
+        pending = _pending_builds.get(name)
+    return None if pending is None else pending.future
+
+
+def wait_for_extension(name):
+    """Wait for a background build of module `name` and load it.
+
+    Does nothing if there is no pending build of that name.
+
+    Raises
+    ------
+    RuntimeError
+        If the module could not be built.
+    """
+    with _pending_lock:
+        pending = _pending_builds.pop(name, None)
+    if pending is None:
+        return
+
+    obtained = pending.future.result()
+    tmpdir = _load_shared_object(
+        name,
+        pending.modname,
+        pending.codeguys,
+        pending.cache_key,
+        pending.use_disk_cache,
+        obtained,
+        pending.verbose,
+    )
+    if name not in _ext_dict:
+        raise _build_failed_error(tmpdir)
+
+
+def wait_for_all_extensions():
+    """Wait for, and load, every pending background build."""
+    with _pending_lock:
+        names = list(_pending_builds.keys())
+    for name in names:
+        wait_for_extension(name)
+
+
+# ============================================================================
+# Common Subexpression Elimination
+# ============================================================================
+#
+# Each residual / Jacobian block is printed as its own C function, so a
+# nonlinear viscosity that appears in F1 and in every G3 entry would otherwise
+# be recomputed for each output component, at every quadrature point. With
+# CSE enabled, sympy.cse is run over the complete set of kernels; every kernel
+# then declares the shared temporaries it needs (once) and writes its outputs
+# in terms of them.
+# ============================================================================
+
+_codegen_settings = {
+    "cse": os.environ.get("UW_JIT_CSE", "0").strip().lower() in ("1", "true", "on", "yes"),
+}
+
+
+def _check_printed_code(code, index, fn):
+    """Raise if the C printer could not translate part of `fn`."""
+    if code.startswith("// Not supported in C:"):
+        spliteqn = code.split("\n")
+        raise RuntimeError(
+            f"Error encountered generating JIT extension:\n"
+            f"{spliteqn[0]}\n"
+            f"{spliteqn[1]}\n"
+            f"This is usually because code generation for a Sympy function (or its derivative) is not supported.\n"
+            f"Please contact the developers."
+            f"---"
+            f"The ID of the JIT component that failed is {index}"
+            f"The decription of the JIT component that failed:\n {fn}"
+        )
+
+
+def _cse_equations(fns, printer, verbose=False):
+    """Generate kernel bodies with common subexpressions hoisted.
+
+    Parameters
+    ----------
+    fns : list of sympy.Matrix
+        The fully unwrapped functions, in kernel order.
+    printer : sympy C code printer
+
+    Returns
+    -------
+    list of (str, str)
+        ``("eqn_<index>", body)`` for each kernel, as produced without CSE.
+    """
+    flat = []
+    offsets = [0]
+    for fn in fns:
+        flat.extend(fn)
+        offsets.append(len(flat))
+
+    replacements, reduced = sympy.cse(
+        flat, symbols=sympy.numbered_symbols("uw_cse_"), order="none"
+    )
+
+    replacement_rhs = dict(replacements)
+    ops_before = 0
+    ops_after = 0
+
+    eqns = []
+    for index, fn in enumerate(fns):
+        reduced_fn = sympy.Matrix(fn.shape[0], fn.shape[1], reduced[offsets[index] : offsets[index + 1]])
+
+        # Temporaries this kernel depends on (directly or through other
+        # temporaries); replacements are ordered so dependencies come first
+        needed = set(s for s in reduced_fn.free_symbols if s in replacement_rhs)
+        for sym, rhs in reversed(replacements):
+            if sym in needed:
+                needed.update(s for s in rhs.free_symbols if s in replacement_rhs)
+
+        body = ""
+        for sym, rhs in replacements:
+            if sym not in needed:
+                continue
+            code = printer.doprint(rhs, sym)
+            _check_printed_code(code, index, rhs)
+            body += f"PetscScalar {sym};\n{code}\n"
+
+        out = sympy.MatrixSymbol("out", *reduced_fn.shape)
+        code = printer.doprint(reduced_fn, out)
+        _check_printed_code(code, index, fn)
+        body += code
+
+        eqns.append(("eqn_" + str(index), body))
+
+        if verbose:
+            ops_before += sympy.count_ops(list(fn))
+            ops_after += sympy.count_ops(list(reduced_fn)) + sum(
+                sympy.count_ops(replacement_rhs[s]) for s in needed
+            )
+
+    if verbose and underworld3.mpi.rank == 0:
+        saved = ops_before - ops_after
+        print(
+            f"JIT CSE: {len(replacements)} shared temporaries, "
+            f"{ops_before} -> {ops_after} operations per quadrature point "
+            f"({saved} saved, {100.0 * saved / max(ops_before, 1):.1f}%)",
+            flush=True,
+        )
+
+    return eqns
+
+
 _GextResult = namedtuple("GextResult", ["ptrobj", "fn_dicts", "constants_manifest"])
 
 
@@ -285,11 +1028,20 @@ def getext(
     debug=False,
     debug_name=None,
     cache=True,
+    cse=None,
 ):
     """
     Check if we've already created an equivalent extension
     and use if available.
 
+    If `cse` is True, common subexpressions are eliminated across all
+    residual, Jacobian and boundary functions before code generation
+    (default: the global setting, see `underworld3.jit.configure_codegen`).
+
+    Inside `deferred_builds()` a module that needs compiling is submitted to
+    the background pool and `ptrobj` is a `PendingExtension`; otherwise this
+    waits for any pending build of the module it returns.
+
     Returns
     -------
     GextResult
@@ -301,6 +1053,9 @@ def getext(
 
     time_s = time.time()
 
+    if cse is None:
+        cse = _codegen_settings["cse"]
+
     raw_fns = (
         tuple(fns_residual)
         + tuple(fns_bcs)
@@ -309,29 +1064,7 @@ def getext(
         + tuple(fns_bd_jacobian)
     )
 
-    # Extract constant UWexpressions that will go through constants[] array
-    constants_manifest, constants_subs_map = _extract_constants(raw_fns, mesh)
-
-    # Build structurally-expanded functions for cache hashing.
-    # Constants are replaced with placeholder symbols (value-independent),
-    # so changing a constant value won't cause a cache miss.
-    expanded_fns = []
-    for fn in raw_fns:
-        # Phase 1: Substitute constants with _JITConstant placeholders
-        if constants_subs_map and fn is not None:
-            try:
-                fn_structural = fn.xreplace(constants_subs_map) if hasattr(fn, 'xreplace') else fn
-            except Exception:
-                fn_structural = fn
-        else:
-            fn_structural = fn
-
-        # Phase 2: Unwrap remaining (non-constant) expressions
-        expanded_fns.append(
-            underworld3.function.expressions.unwrap(fn_structural, keep_constants=False, return_self=False)
-        )
-
-    fns = tuple(expanded_fns)
+    constants_manifest, constants_subs_map, fns = _structural_fns(raw_fns, mesh)
 
     if debug and underworld3.mpi.rank == 0:
         print(f"Expanded functions for compilation:")
@@ -354,10 +1087,10 @@ def getext(
         jitname += "_" + str(len(_ext_dict.keys()))
 
     else:  # Else name from fns hash — uses structural form (constants as placeholders)
-        jitname = abs(hash((mesh, fns, tuple(mesh.vars.keys()))))
+        jitname = abs(hash((mesh, fns, tuple(mesh.vars.keys()), cse)))
 
-    # Create the module if not in dictionary
-    if jitname not in _ext_dict.keys() or not cache:
+    # Create the module if not in dictionary (or already being compiled)
+    if (jitname not in _ext_dict.keys() and pending_build(jitname) is None) or not cache:
         _createext(
             jitname,
             mesh,
@@ -371,13 +1104,17 @@ def getext(
             verbose=verbose,
             debug=debug,
             debug_name=debug_name,
+            cse=cse,
         )
     else:
         if verbose and underworld3.mpi.rank == 0:
             print(f"JIT compiled module cached ... {jitname} ", flush=True)
 
-    module = _ext_dict[jitname]
-    ptrobj = module.getptrobj()
+    if pending_build(jitname) is not None and builds_deferred():
+        ptrobj = PendingExtension(jitname)
+    else:
+        wait_for_extension(jitname)
+        ptrobj = _ext_dict[jitname].getptrobj()
 
     i_res = {}
     for index, fn in enumerate(fns_residual):
@@ -423,6 +1160,7 @@ def _createext(
     verbose: Optional[bool] = False,
     debug: Optional[bool] = False,
     debug_name=None,
+    cse: Optional[bool] = False,
 ):
     """
     This creates the required extension which houses the JIT
@@ -462,6 +1200,10 @@ def _createext(
         petsc auxiliary variable arrays. Note that *all* the variables in the
         calling system's corresponding `PetscDM` must be included in this list.
         They must also be ordered according to their `field_id`.
+    cse:
+        Eliminate common subexpressions across the whole set of functions
+        and evaluate each shared temporary once per kernel (see
+        `_cse_equations`).
 
     """
     from sympy import symbols, Eq, MatrixSymbol
@@ -637,6 +1379,7 @@ def _createext(
     underworld3._libfiles.clear()
 
     eqns = []
+    cse_fns = []
     for index, fn in enumerate(fns):
 
         # Save original for debugging
@@ -728,52 +1471,22 @@ def _createext(
                 for sym in free_syms:
                     print(f"    - {sym} (type: {type(sym).__name__}, _ccodestr: {getattr(sym, '_ccodestr', 'N/A')})")
 
+        if cse:
+            # Printed below, once the whole set has been seen
+            cse_fns.append(fn)
+            continue
+
         out = sympy.MatrixSymbol("out", *fn.shape)
         eqn = ("eqn_" + str(index), printer.doprint(fn, out))
-        if eqn[1].startswith("// Not supported in C:"):
-            spliteqn = eqn[1].split("\n")
-            raise RuntimeError(
-                f"Error encountered generating JIT extension:\n"
-                f"{spliteqn[0]}\n"
-                f"{spliteqn[1]}\n"
-                f"This is usually because code generation for a Sympy function (or its derivative) is not supported.\n"
-                f"Please contact the developers."
-                f"---"
-                f"The ID of the JIT component that failed is {index}"
-                f"The decription of the JIT component that failed:\n {fn}"
-            )
+        _check_printed_code(eqn[1], index, fn)
         eqns.append(eqn)
 
+    if cse:
+        eqns = _cse_equations(cse_fns, printer, verbose=verbose)
+
     MODNAME = "fn_ptr_ext_" + str(name)
 
     codeguys = []
-    # Create a `setup.py`
-    setup_py_str = """
-try:
-    from setuptools import setup
-    from setuptools import Extension
-except ImportError:
-    from distutils.core import setup
-    from distutils.extension import Extension
-from Cython.Build import cythonize
-
-ext_mods = [Extension(
-    '{NAME}', ['cy_ext.pyx',],
-    include_dirs={HEADERS},
-    library_dirs={LIBDIRS},
-    runtime_library_dirs={LIBDIRS},
-    libraries={LIBFILES},
-    extra_compile_args=['-std=c99','-O3'],
-    extra_link_args=[]
-)]
-setup(ext_modules=cythonize(ext_mods))
-""".format(
-        NAME=MODNAME,
-        HEADERS=list(underworld3._incdirs.keys()),
-        LIBDIRS=list(underworld3._libdirs.keys()),
-        LIBFILES=list(underworld3._libfiles.keys()),
-    )
-    codeguys.append(["setup.py", setup_py_str])
 
     residual_sig = "(PetscInt dim, PetscInt Nf, PetscInt NfAux, const PetscInt uOff[], const PetscInt uOff_x[], const PetscScalar petsc_u[], const PetscScalar petsc_u_t[], const PetscScalar petsc_u_x[], const PetscInt aOff[], const PetscInt aOff_x[], const PetscScalar petsc_a[], const PetscScalar petsc_a_t[], const PetscScalar petsc_a_x[], PetscReal petsc_t,                           const PetscReal petsc_x[], PetscInt numConstants, const PetscScalar constants[], PetscScalar out[])"
     jacobian_sig = "(PetscInt dim, PetscInt Nf, PetscInt NfAux, const PetscInt uOff[], const PetscInt uOff_x[], const PetscScalar petsc_u[], const PetscScalar petsc_u_t[], const PetscScalar petsc_u_x[], const PetscInt aOff[], const PetscInt aOff_x[], const PetscScalar petsc_a[], const PetscScalar petsc_a_t[], const PetscScalar petsc_a_x[], PetscReal petsc_t, PetscReal petsc_u_tShift, const PetscReal petsc_x[], PetscInt numConstants, const PetscScalar constants[], PetscScalar out[])"
@@ -816,7 +1529,28 @@ cdef extern from "cy_ext.h" nogil:
     import random
     import os
 
-    if not "UW_JITNAME" in os.environ:
+    # Modules destined for the persistent cache get a content-derived prefix
+    # (substituted once the sources are complete) which is just as unique.
+    jit_cache = get_jit_cache()
+    use_disk_cache = (
+        jit_cache.enabled
+        and debug_name is None
+        and not debug
+        and not "UW_JITNAME" in os.environ
+    )
+
+    # Collective builds need a module name that is identical on every rank,
+    # so they also use content-derived naming.
+    collective = (
+        _collective_jit_active()
+        and debug_name is None
+        and not "UW_JITNAME" in os.environ
+    )
+    content_named = use_disk_cache or collective
+
+    if content_named:
+        randstr = _RANDSTR_PLACEHOLDER
+    elif not "UW_JITNAME" in os.environ:
         randstr = "".join(random.choices(string.ascii_uppercase, k=5))
     else:
         if debug_name is None:
@@ -889,7 +1623,6 @@ cdef extern from "cy_ext.h" nogil:
         pyx_str += "    void {}_petsc_{}{}\n".format(randstr, eqn[0], bd_jacobian_sig)
         fn_counter += 1
 
-    codeguys.append(["cy_ext.h", h_str])
     # Note that the malloc below will cause a leak, but it's just a bunch of function
     # pointers so we don't need to worry about it (yet)
     pyx_str += """
@@ -940,90 +1673,63 @@ cpdef PtrContainer getptrobj():
     boundary_jacobian_equations = (boundary_residual_equations[1], eqn_count)
 
     pyx_str += "    return clsguy"
-    codeguys.append(["cy_ext.pyx", pyx_str])
-
-    # Write out files
-    import os
-
-    import time
-    import random
-
-    # Make directory name unique to avoid race conditions between parallel processes
-    unique_suffix = f"{os.getpid()}_{int(time.time() * 1000)}_{random.randint(1000, 9999)}"
-    tmpdir = os.path.join("/tmp", f"{MODNAME}_{unique_suffix}")
-
-    try:
-        os.makedirs(tmpdir, exist_ok=True)
-    except OSError as e:
-        if verbose:
-            print(f"Warning: Failed to create tmpdir {tmpdir}: {e}")
-        raise RuntimeError(f"Cannot create temporary directory {tmpdir}") from e
-    for thing in codeguys:
-        filename = thing[0]
-        strguy = thing[1]
-        with open(os.path.join(tmpdir, filename), "w") as f:
-            f.write(strguy)
-
-    # Build
-    import sys
-
-    process = subprocess.Popen(
-        [sys.executable] + "setup.py build_ext --inplace".split(),
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        cwd=tmpdir,
-    )
-    stdout, stderr = process.communicate()
-
-    # Check if build process failed
-    if process.returncode != 0:
-        if verbose:
-            print(f"Warning: Build process failed with return code {process.returncode}")
-            print(f"stdout: {stdout.decode() if stdout else 'None'}")
-            print(f"stderr: {stderr.decode() if stderr else 'None'}")
-
-    # Load and add to dictionary
-    from importlib._bootstrap import _load
 
-    def load_dynamic(name, path, file=None):
-        """
-        Load an extension module.
-        Borrowed from:
-            https://stackoverflow.com/a/55172547
-        """
-        import importlib.machinery
+    # Content-addressed module naming for the persistent cache. The sources
+    # were generated with a placeholder symbol prefix, so the digest depends
+    # only on the structural form of the kernels (constants are already
+    # placeholders) and the link configuration, not on this process.
+    cache_key = None
+    if content_named:
+        link_config = (
+            list(underworld3._incdirs.keys()),
+            list(underworld3._libdirs.keys()),
+            list(underworld3._libfiles.keys()),
+        )
+        cache_key = jit_cache.key(h_str, pyx_str, link_config)
+        randstr = "UW" + cache_key[:12]
+        h_str = h_str.replace(_RANDSTR_PLACEHOLDER, randstr)
+        pyx_str = pyx_str.replace(_RANDSTR_PLACEHOLDER, randstr)
+        MODNAME = "fn_ptr_ext_" + cache_key[:24]
 
-        loader = importlib.machinery.ExtensionFileLoader(name, path)
+    codeguys.append(["setup.py", _setup_py_source(MODNAME)])
+    codeguys.append(["cy_ext.h", h_str])
+    codeguys.append(["cy_ext.pyx", pyx_str])
 
-        # Issue #24748: Skip the sys.modules check in _load_module_shims
-        # always load new extension
-        spec = importlib.machinery.ModuleSpec(name=name, loader=loader, origin=path)
-        return _load(spec)
+    import os
 
-    # Check if tmpdir exists before trying to list it
-    if os.path.exists(tmpdir):
-        for _file in os.listdir(tmpdir):
-            if _file.endswith(".so"):
-                _ext_dict[name] = load_dynamic(MODNAME, os.path.join(tmpdir, _file))
+    # Guard against ranks generating different sources (which would make a
+    # single compiled module wrong for some of them): fall back to building
+    # independently on every rank.
+    if collective and not _consistent_across_ranks(cache_key):
+        if verbose and underworld3.mpi.rank == 0:
+            print("JIT sources differ between ranks - compiling independently", flush=True)
+        collective = False
+
+    tmpdir = None
+    if collective:
+        # Collective builds involve every rank and are never deferred
+        _ext_dict[name] = _collective_build_and_load(
+            MODNAME, codeguys, cache_key, use_disk_cache, verbose
+        )
+    elif builds_deferred():
+        _submit_build(name, MODNAME, codeguys, cache_key, use_disk_cache, verbose)
+        if underworld3.mpi.rank == 0 and verbose:
+            print(f"JIT module {MODNAME} submitted for background compilation", flush=True)
+        return
     else:
-        # tmpdir doesn't exist, likely build process failed
-        if verbose:
-            print(f"Warning: tmpdir {tmpdir} does not exist - build process may have failed")
+        obtained = _obtain_shared_object(MODNAME, codeguys, cache_key, use_disk_cache, verbose)
+        tmpdir = _load_shared_object(
+            name, MODNAME, codeguys, cache_key, use_disk_cache, obtained, verbose
+        )
 
     if name not in _ext_dict.keys():
-        raise RuntimeError(
-            f"The Underworld extension module does not appear to have been built successfully. "
-            f"The generated module may be found at:\n    {str(tmpdir)}\n"
-            f"To investigate, you may attempt to build it manually by running\n"
-            f"    python3 setup.py build_ext --inplace\n"
-            f"from the above directory. Note that a new module will always be written by "
-            f"Underworld and therefore any modifications to the above files will not persist into "
-            f"your Underworld runtime.\n"
-            f"Please contact the developers if you are unable to resolve the issue."
-        )
+        raise _build_failed_error(tmpdir)
 
     if underworld3.mpi.rank == 0 and verbose:
-        print(f"Location of compiled module: {str(tmpdir)}")
+        # The build directory holds the generated sources; a module taken
+        # straight from a cache has no build directory of its own.
+        location = tmpdir if tmpdir is not None else _ext_dict[name].__file__
+        print(f"Location of compiled module: {str(location)}")
 
         print(
             f"{randstr} Equation count - {eqn_count}",
@@ -193,14 +193,25 @@ def mem_footprint():
     return python_process.memory_info().rss // 1000000
 
 
-def gather_data(val, bcast=False, dtype="float64"):
+_gather_reductions = {
+    "sum": (np.nansum, "SUM"),
+    "min": (np.nanmin, "MIN"),
+    "max": (np.nanmax, "MAX"),
+}
+
+
+def gather_data(val, bcast=False, dtype="float64", op=None):
     """
     gather values on root (bcast=False) or all (bcast = True) processors
     Parameters:
         vals : Values to combine into a single array on the root or all processors
+        op : "sum", "min" or "max" to reduce the values to a single scalar
+             instead. This is a single allreduce (no gather, broadcast or
+             barriers) and the result is available on all processors.
 
     returns:
         val_global : combination of values form all processors
+                     (or their reduction if `op` is given)
 
     """
 
@@ -208,6 +219,30 @@ def gather_data(val, bcast=False, dtype="float64"):
     rank = uw.mpi.rank
     size = uw.mpi.size
 
+    if op is not None:
+        from mpi4py import MPI
+
+        try:
+            local_reduce, mpi_op = _gather_reductions[op]
+        except KeyError:
+            raise ValueError(f"Unknown reduction '{op}' - use one of {list(_gather_reductions)}")
+
+        # NaN values are ignored, as in the gathered case; an empty (or all-NaN)
+        # contribution is replaced by the identity of the reduction
+        val_local = np.asarray(val, dtype=dtype).reshape(-1)
+        if op != "sum":
+            val_local = val_local[~np.isnan(val_local)] if val_local.dtype.kind == "f" else val_local
+
+        if val_local.shape[0] > 0:
+            local = local_reduce(val_local)
+        elif op == "sum":
+            local = np.zeros((), dtype=dtype)
+        else:
+            info = np.finfo if np.dtype(dtype).kind == "f" else np.iinfo
+            local = info(dtype).max if op == "min" else info(dtype).min
+
+        return np.asarray(comm.allreduce(local, op=getattr(MPI, mpi_op)), dtype=dtype)[()]
+
     ### make sure all data comes in the same order
     with uw.mpi.call_pattern(pattern="sequential"):
         if isinstance(val, np.ndarray):
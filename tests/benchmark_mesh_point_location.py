@@ -0,0 +1,281 @@
+"""
+Benchmark: construction of the mesh point-location tables.
+
+Compares the array-based construction of the point-location tables
+(`_build_kd_tree_index`, `_mark_faces_inside_and_out`,
+`_mark_local_boundary_faces_inside_and_out`, `_get_mesh_sizes`) against
+the original per-cell DMPlex loops, which are kept here as the reference.
+
+Questions to answer:
+1. Are the tables identical to the loop-built ones?
+2. How does the construction time scale with the number of cells?
+
+Run with: python tests/benchmark_mesh_point_location.py [quick]
+"""
+
+import numpy as np
+import underworld3 as uw
+import time
+import sys
+
+
+## Reference (loop) implementations
+
+
+def legacy_kd_tree_index(mesh):
+    cStart, cEnd = mesh.dm.getHeightStratum(0)
+    pStart, pEnd = mesh.dm.getDepthStratum(0)
+    cell_num_points = mesh.element.entities[mesh.dim]
+
+    control_points_list = []
+    control_points_cell_list = []
+
+    for cell_id in range(cStart, cEnd):
+        points = mesh.dm.getTransitiveClosure(cell_id)[0][-cell_num_points:]
+        cell_point_coords = mesh._coords[points - pStart]
+        cell_centroid = cell_point_coords.mean(axis=0)
+
+        for i in range(cell_point_coords.shape[0]):
+            control_points_list.append(0.99 * cell_point_coords[i] + 0.01 * cell_centroid)
+            control_points_cell_list.append(cell_id)
+
+        control_points_list.append(cell_centroid)
+        control_points_cell_list.append(cell_id)
+
+    return np.array(control_points_list), np.array(control_points_cell_list, dtype=np.int64)
+
+
+def _normal(mesh, point_coords, face_centroid, cell_centroid):
+    if mesh.dim == 2:
+        vector = point_coords[1] - point_coords[0]
+        normal = np.array((-vector[1], vector[0]))
+    else:
+        normal = np.cross(
+            (point_coords[1] - point_coords[0]),
+            (point_coords[2] - point_coords[0]),
+        )
+
+    inward_outward = np.sign(normal.dot(face_centroid - cell_centroid))
+    return normal * inward_outward / np.sqrt(normal.dot(normal))
+
+
+def legacy_faces_inside_and_out(mesh):
+    cStart, cEnd = mesh.dm.getHeightStratum(0)
+    pStart, pEnd = mesh.dm.getDepthStratum(0)
+    cell_num_faces = mesh.element.entities[1]
+    cell_num_points = mesh.element.entities[mesh.dim]
+    face_num_points = mesh.element.face_entities[mesh.dim]
+
+    outer = np.ndarray(shape=(cell_num_faces, cEnd - cStart, mesh.dim))
+    inner = np.ndarray(shape=(cell_num_faces, cEnd - cStart, mesh.dim))
+
+    for cell, cell_id in enumerate(range(cStart, cEnd)):
+        cell_faces = mesh.dm.getCone(cell_id)
+        points = mesh.dm.getTransitiveClosure(cell_id)[0][-cell_num_points:]
+        cell_centroid = mesh._coords[points - pStart].mean(axis=0)
+
+        for face in range(cell_num_faces):
+            points = mesh.dm.getTransitiveClosure(cell_faces[face])[0][-face_num_points:]
+            point_coords = mesh._coords[points - pStart]
+            face_centroid = point_coords.mean(axis=0)
+            normal = _normal(mesh, point_coords, face_centroid, cell_centroid)
+
+            outer[face, cell, :] = 1e-3 * normal + face_centroid
+            inner[face, cell, :] = -1e-3 * normal + face_centroid
+
+    return inner, outer
+
+
+def legacy_boundary_control_points(mesh):
+    cStart, cEnd = mesh.dm.getHeightStratum(0)
+    fStart, fEnd = mesh.dm.getHeightStratum(1)
+    pStart, pEnd = mesh.dm.getDepthStratum(0)
+    face_num_points = mesh.element.face_entities[mesh.dim]
+
+    control_points_list = []
+    control_point_sign_list = []
+
+    for face in range(fStart, fEnd):
+        if mesh.dm.getJoin(face).shape[0] != 1:
+            continue
+
+        cell = mesh.dm.getJoin(face)[0]
+        points = mesh.dm.getTransitiveClosure(face)[0][-face_num_points:]
+        point_coords = mesh._coords[points - pStart]
+        face_centroid = point_coords.mean(axis=0)
+        normal = _normal(mesh, point_coords, face_centroid, mesh._centroids[cell - cStart])
+
+        for anchor in [face_centroid] + [
+            0.8 * point_coords[pt] + 0.2 * face_centroid for pt in range(face_num_points)
+        ]:
+            control_points_list.append(1e-8 * normal + anchor)
+            control_point_sign_list.append(-1)
+            control_points_list.append(-1e-8 * normal + anchor)
+            control_point_sign_list.append(1)
+
+    return np.array(control_points_list), np.array(control_point_sign_list)
+
+
+def legacy_mesh_sizes(mesh, centroids_kd_tree):
+    # Uses every cell vertex (the original used the cone size, which is
+    # the number of faces, and so skipped two vertices of each hexahedron)
+    cStart, cEnd = mesh.dm.getHeightStratum(0)
+    pStart, pEnd = mesh.dm.getDepthStratum(0)
+    cell_num_points = mesh.element.entities[mesh.dim]
+
+    cell_length = np.empty(cEnd - cStart)
+    cell_min_r = np.empty(cEnd - cStart)
+    cell_r = np.empty(cEnd - cStart)
+
+    for cell in range(cEnd - cStart):
+        cell_points = mesh.dm.getTransitiveClosure(cell + cStart)[0][-cell_num_points:]
+        distsq, _ = centroids_kd_tree.query(mesh._coords[cell_points - pStart], k=1, sqr_dists=True)
+
+        cell_length[cell] = np.sqrt(distsq.max())
+        cell_r[cell] = np.sqrt(distsq.mean())
+        cell_min_r[cell] = np.sqrt(distsq.min())
+
+    return cell_min_r, cell_r, cell_length
+
+
+## Vectorised implementations (as called by the mesh)
+
+
+def vectorised_tables(mesh):
+    mesh._cell_connectivity = None
+    mesh._index = None
+    mesh._build_kd_tree_index()
+    mesh._mark_faces_inside_and_out()
+    mesh._mark_local_boundary_faces_inside_and_out()
+
+    centroids_kd_tree = uw.kdtree.KDTree(mesh._centroids)
+    cell_min_r, cell_r, _, cell_length = mesh._get_mesh_sizes()
+
+    return centroids_kd_tree, (cell_min_r, cell_r, cell_length)
+
+
+def legacy_tables(mesh, centroids_kd_tree):
+    legacy_kd_tree_index(mesh)
+    legacy_faces_inside_and_out(mesh)
+    legacy_boundary_control_points(mesh)
+    return legacy_mesh_sizes(mesh, centroids_kd_tree)
+
+
+def check_identical(mesh):
+    """Assert that the vectorised tables match the loop-built ones."""
+    centroids_kd_tree, sizes = vectorised_tables(mesh)
+
+    index_coords, index_map = legacy_kd_tree_index(mesh)
+    np.testing.assert_allclose(mesh._indexCoords, index_coords, rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(mesh._indexMap, index_map)
+
+    inner, outer = legacy_faces_inside_and_out(mesh)
+    np.testing.assert_allclose(mesh.faces_inner_control_points, inner, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(mesh.faces_outer_control_points, outer, rtol=0, atol=1e-12)
+
+    points, sign = legacy_boundary_control_points(mesh)
+    np.testing.assert_allclose(
+        mesh.boundary_face_control_points_kdtree.kdtree_points(), points, rtol=0, atol=1e-12
+    )
+    np.testing.assert_array_equal(mesh.boundary_face_control_points_sign, sign)
+
+    for vectorised, legacy in zip(sizes, legacy_mesh_sizes(mesh, centroids_kd_tree)):
+        np.testing.assert_allclose(vectorised, legacy, rtol=1e-12)
+
+
+def make_meshes(res):
+    return {
+        "simplex_2d": lambda: uw.meshing.UnstructuredSimplexBox(
+            minCoords=(0.0, 0.0), maxCoords=(1.0, 1.0), cellSize=1.0 / res, regular=True
+        ),
+        "simplex_3d": lambda: uw.meshing.UnstructuredSimplexBox(
+            minCoords=(0.0, 0.0, 0.0),
+            maxCoords=(1.0, 1.0, 1.0),
+            cellSize=4.0 / res,
+            regular=True,
+        ),
+        "quad_2d": lambda: uw.meshing.StructuredQuadBox(elementRes=(res, res)),
+        "hex_3d": lambda: uw.meshing.StructuredQuadBox(elementRes=(res // 4,) * 3),
+    }
+
+
+def run_benchmark(resolutions=None, verbose=True):
+    """
+    Time the loop and vectorised constructions across element types.
+
+    Returns
+    -------
+    list : All benchmark results
+    """
+    if resolutions is None:
+        resolutions = [16, 32, 64]
+
+    results = []
+
+    for res in resolutions:
+        for name, build in make_meshes(res).items():
+            mesh = build()
+            n_cells = mesh.dm.getHeightStratum(0)[1] - mesh.dm.getHeightStratum(0)[0]
+
+            check_identical(mesh)
+
+            t0 = time.perf_counter()
+            centroids_kd_tree, _ = vectorised_tables(mesh)
+            t_vectorised = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            legacy_tables(mesh, centroids_kd_tree)
+            t_legacy = time.perf_counter() - t0
+
+            result = {
+                'name': name,
+                'resolution': res,
+                'n_cells': n_cells,
+                'time_legacy': t_legacy,
+                'time_vectorised': t_vectorised,
+                'speedup': t_legacy / t_vectorised,
+            }
+            results.append(result)
+
+            if verbose:
+                print(f"  {name:12s} res={res:<4d} cells={n_cells:<8d}: "
+                      f"loops={t_legacy*1000:9.2f}ms, arrays={t_vectorised*1000:8.2f}ms, "
+                      f"{result['speedup']:6.1f}x")
+
+            del mesh
+
+    return results
+
+
+def print_summary(results):
+    """Print summary table of results."""
+    print(f"\n{'='*72}")
+    print("SUMMARY")
+    print(f"{'='*72}")
+
+    print(f"\n{'Mesh':<14} {'Res':<6} {'Cells':<10} {'Loops':<12} {'Arrays':<12} {'Speedup':<10}")
+    print("-" * 72)
+
+    for r in results:
+        print(f"{r['name']:<14} {r['resolution']:<6} {r['n_cells']:<10} "
+              f"{r['time_legacy']*1000:>8.2f}ms  {r['time_vectorised']*1000:>8.2f}ms  "
+              f"{r['speedup']:>6.1f}x")
+
+
+def quick_test():
+    """Quick check that the tables are identical for every element type."""
+    print("Quick identity test...")
+
+    for name, build in make_meshes(8).items():
+        check_identical(build())
+        print(f"  {name}: identical")
+
+    print("\nQuick test PASSED!")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "quick":
+        quick_test()
+    else:
+        results = run_benchmark(resolutions=[16, 32, 64])
+        print_summary(results)
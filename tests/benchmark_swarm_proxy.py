@@ -0,0 +1,281 @@
+"""
+Benchmark: swarm-to-mesh proxy and level-set reductions.
+
+Compares the scatter-add (bincount) kernels used by
+`IndexSwarmVariable._update_proxy_variables` (update_type 0 and 1) and
+`SwarmVariable._rbf_reduce_to_meshVar` against the original per-particle /
+per-node loops, which are kept here as the reference.
+
+Questions to answer:
+1. Do the level-set values match the loop-built ones?
+2. How does the refresh time scale with particles and material count?
+
+Run with: python tests/benchmark_swarm_proxy.py [quick]
+"""
+
+import numpy as np
+import underworld3 as uw
+import time
+import sys
+
+
+## Reference (loop) implementations
+
+
+def legacy_update_type_0(material, n_distance, n_indices, n, index_data):
+    values = []
+
+    for ii in range(material.indices):
+        node_values = np.zeros((material._n_nodes,))
+        w = np.zeros((material._n_nodes,))
+
+        for i in range(index_data.shape[0]):
+            tem = np.isclose(n_distance[i, :], n_distance[i, 0])
+            dist = n_distance[i, tem]
+            indices = n_indices[i, tem]
+            tem = dist < material.radius_s
+            dist = dist[tem]
+            indices = indices[tem]
+            for j, ind in enumerate(indices):
+                node_values[ind] += (np.isclose(index_data[i], ii) / (1.0e-16 + dist[j]))[0]
+                w[ind] += 1.0 / (1.0e-16 + dist[j])
+
+        node_values[np.where(w > 0.0)[0]] /= w[np.where(w > 0.0)[0]]
+
+        ind_w0 = np.where(w == 0.0)[0]
+        if len(ind_w0) > 0:
+            ind_ = np.where(index_data[n[ind_w0]] == ii)[0]
+            if len(ind_) > 0:
+                node_values[ind_w0[ind_]] = 1.0
+
+        values.append(node_values)
+
+    return np.array(values).T
+
+
+def legacy_update_type_1(material, n_distance, n_indices, index_data, ind_bc, nnn_bc):
+    values = []
+
+    for ii in range(material.indices):
+        node_values = np.zeros((material._n_nodes,))
+        w = np.zeros((material._n_nodes,))
+        for i in range(material._n_nodes):
+            if i not in ind_bc:
+                ind = np.where(n_distance[i, :] < material.radius_s)
+                a = 1.0 / (n_distance[i, ind] + 1.0e-16)
+                w[i] = np.sum(a)
+                b = np.isclose(index_data[n_indices[i, ind]], ii)
+                node_values[i] = np.sum(np.dot(a, b))
+                if ind[0].size == 0:
+                    w[i] = 0
+            else:
+                ind = np.where(n_distance[i, :nnn_bc] < material.radius_s)
+                a = 1.0 / (n_distance[i, :nnn_bc][ind] + 1.0e-16)
+                w[i] = np.sum(a)
+                b = np.isclose(index_data[n_indices[i, :nnn_bc][ind]], ii)
+                node_values[i] = np.sum(np.dot(a, b))
+                if ind[0].size == 0:
+                    w[i] = 0
+
+        node_values[np.where(w > 0.0)[0]] /= w[np.where(w > 0.0)[0]]
+
+        ind_w0 = np.where(w == 0.0)[0]
+        if len(ind_w0) > 0:
+            ind_ = np.where(index_data[n_indices[ind_w0]] == ii)[0]
+            if len(ind_) > 0:
+                node_values[ind_w0[ind_]] = 1.0
+
+        values.append(node_values)
+
+    return np.array(values).T
+
+
+def legacy_rbf_reduce(var, meshVar):
+    kd = uw.kdtree.KDTree(meshVar.coords_nd)
+    d, n = kd.query(var.swarm._particle_coordinates.data, k=1, sqr_dists=False)
+    data = np.asarray(var.data).reshape(-1, var.num_components)
+
+    node_values = np.zeros((meshVar.coords.shape[0], var.num_components))
+    w = np.zeros(meshVar.coords.shape[0])
+
+    for i in range(data.shape[0]):
+        node_values[n[i], :] += data[i, :] / (1.0e-24 + d[i])
+        w[n[i]] += 1.0 / (1.0e-24 + d[i])
+
+    node_values[np.where(w > 0.0)[0], :] /= w[np.where(w > 0.0)[0]].reshape(-1, 1)
+
+    p_nnmap = var.swarm._get_map(var)
+    node_values[np.where(w == 0.0), :] = data[p_nnmap[np.where(w == 0.0)], :]
+
+    return node_values
+
+
+def check_rbf_reduce():
+    """Assert that the proxy reduction matches the loop-built one."""
+    mesh = uw.meshing.UnstructuredSimplexBox(cellSize=1.0 / 8.0)
+    swarm = uw.swarm.Swarm(mesh)
+    var = uw.swarm.SwarmVariable("V", swarm, 2, proxy_degree=2)
+    swarm.populate(fill_param=2)
+
+    coords = swarm._particle_coordinates.data
+    var.data[:, 0] = np.sin(3.0 * coords[:, 0])
+    var.data[:, 1] = coords[:, 0] * coords[:, 1]
+
+    var._rbf_reduce_to_meshVar(var._meshVar)
+    np.testing.assert_allclose(
+        np.asarray(var._meshVar.data).reshape(-1, 2),
+        legacy_rbf_reduce(var, var._meshVar),
+        rtol=1.0e-10,
+    )
+
+
+## Problem setup
+
+
+def make_problem(res, fill_param, n_materials, update_type):
+    mesh = uw.meshing.UnstructuredSimplexBox(
+        minCoords=(0.0, 0.0), maxCoords=(1.0, 1.0), cellSize=1.0 / res, regular=True
+    )
+    swarm = uw.swarm.Swarm(mesh)
+
+    material = uw.swarm.IndexSwarmVariable(
+        "M", swarm, indices=n_materials, update_type=update_type, radius=2.0 / res, npoints_bc=2
+    )
+    swarm.populate(fill_param=fill_param)
+
+    # Horizontal layers of material (with a few out-of-range values)
+    coords = swarm._particle_coordinates.data
+    material.data[:, 0] = np.minimum((coords[:, 1] * n_materials).astype(int), n_materials - 1)
+    material.data[::97, 0] = n_materials
+
+    # Boundary nodes of the level-set variable are the "bc" nodes
+    if update_type == 1:
+        level_set_coords = material._meshLevelSetVars[0].coords
+        on_boundary = np.any((level_set_coords < 1.0e-6) | (level_set_coords > 1.0 - 1.0e-6), axis=1)
+        material.ind_bc = np.where(on_boundary)[0]
+
+    material._n_nodes = material._meshLevelSetVars[0].coords.shape[0]
+
+    return mesh, swarm, material
+
+
+def legacy_values(material):
+    swarm = material.swarm
+    index_data = np.asarray(material.data).reshape(-1, 1)
+
+    if material.update_type == 0:
+        kd = uw.kdtree.KDTree(material._meshLevelSetVars[0].coords_nd)
+        n_distance, n_indices = kd.query(
+            swarm._particle_coordinates.data, k=material.nnn, sqr_dists=False
+        )
+        kd_swarm = uw.kdtree.KDTree(swarm._particle_coordinates.data)
+        d, n = kd_swarm.query(material._meshLevelSetVars[0].coords, k=1, sqr_dists=False)
+        return legacy_update_type_0(material, n_distance, n_indices, n, index_data)
+    else:
+        kd = uw.kdtree.KDTree(swarm._particle_coordinates.data)
+        n_distance, n_indices = kd.query(
+            material._meshLevelSetVars[0].coords, k=material.nnn, sqr_dists=False
+        )
+        return legacy_update_type_1(
+            material, n_distance, n_indices, index_data, material.ind_bc, material.nnn_bc
+        )
+
+
+def vectorised_values(material):
+    material._update_proxy_variables()
+    return np.column_stack(
+        [np.asarray(var.data[:, 0]) for var in material._meshLevelSetVars]
+    )
+
+
+def check_identical(material):
+    """Assert that the level-set values match the loop-built ones."""
+    np.testing.assert_allclose(
+        vectorised_values(material), legacy_values(material), rtol=1.0e-10, atol=1.0e-12
+    )
+
+
+def run_benchmark(cases=None, verbose=True):
+    """
+    Time the loop and vectorised level-set refresh.
+
+    Returns
+    -------
+    list : All benchmark results
+    """
+    if cases is None:
+        cases = [(16, 3, 2), (32, 4, 4), (64, 4, 8)]
+
+    results = []
+
+    for res, fill_param, n_materials in cases:
+        for update_type in (0, 1):
+            mesh, swarm, material = make_problem(res, fill_param, n_materials, update_type)
+            n_particles = swarm.dm.getLocalSize()
+
+            check_identical(material)
+
+            t0 = time.perf_counter()
+            vectorised_values(material)
+            t_vectorised = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            legacy_values(material)
+            t_legacy = time.perf_counter() - t0
+
+            result = {
+                'update_type': update_type,
+                'n_particles': n_particles,
+                'n_materials': n_materials,
+                'time_legacy': t_legacy,
+                'time_vectorised': t_vectorised,
+                'speedup': t_legacy / t_vectorised,
+            }
+            results.append(result)
+
+            if verbose:
+                print(f"  type={update_type} particles={n_particles:<8d} materials={n_materials:<3d}: "
+                      f"loops={t_legacy*1000:10.2f}ms, arrays={t_vectorised*1000:8.2f}ms, "
+                      f"{result['speedup']:7.1f}x")
+
+            del material, swarm, mesh
+
+    return results
+
+
+def print_summary(results):
+    """Print summary table of results."""
+    print(f"\n{'='*72}")
+    print("SUMMARY")
+    print(f"{'='*72}")
+
+    print(f"\n{'Type':<6} {'Particles':<11} {'Materials':<11} {'Loops':<13} {'Arrays':<12} {'Speedup':<10}")
+    print("-" * 72)
+
+    for r in results:
+        print(f"{r['update_type']:<6} {r['n_particles']:<11} {r['n_materials']:<11} "
+              f"{r['time_legacy']*1000:>9.2f}ms  {r['time_vectorised']*1000:>8.2f}ms  "
+              f"{r['speedup']:>6.1f}x")
+
+
+def quick_test():
+    """Quick check that both update types match the loops."""
+    print("Quick identity test...")
+
+    for update_type in (0, 1):
+        _, _, material = make_problem(8, 2, 3, update_type)
+        check_identical(material)
+        print(f"  update_type={update_type}: identical")
+
+    check_rbf_reduce()
+    print("  proxy reduction: identical")
+
+    print("\nQuick test PASSED!")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "quick":
+        quick_test()
+    else:
+        results = run_benchmark()
+        print_summary(results)
@@ -0,0 +1,166 @@
+"""
+Benchmark: particle ordering and the cost of swarm operations.
+
+Scrambles the particles (as repeated migration does), then times
+evaluation at the particles and an `IndexSwarmVariable` proxy refresh in
+the scrambled order, after `Swarm.sort("cell")` and after
+`Swarm.sort("hilbert")`.
+
+Questions to answer:
+1. Are the results the same in every order (up to the permutation)?
+2. How much does a cache-friendly order save, and what does sorting cost?
+
+Run with: python tests/benchmark_swarm_sort.py [quick]
+"""
+
+import numpy as np
+import underworld3 as uw
+import time
+import sys
+
+
+## Problem setup
+
+
+def make_problem(res, fill_param, n_materials=4):
+    mesh = uw.meshing.UnstructuredSimplexBox(
+        minCoords=(0.0, 0.0), maxCoords=(1.0, 1.0), cellSize=1.0 / res, regular=True
+    )
+    swarm = uw.swarm.Swarm(mesh)
+
+    material = uw.swarm.IndexSwarmVariable(
+        "M", swarm, indices=n_materials, update_type=1, radius=2.0 / res
+    )
+    T = uw.discretisation.MeshVariable("T", mesh, 1, degree=2)
+    swarm.populate(fill_param=fill_param)
+
+    T.data[:, 0] = np.sin(np.pi * T.coords[:, 0]) * np.cos(np.pi * T.coords[:, 1])
+
+    # Scramble the particle order
+    rng = np.random.default_rng(0)
+    swarm._permute_particles(rng.permutation(swarm.dm.getLocalSize()))
+
+    coords = swarm._particle_coordinates.data
+    material.data[:, 0] = np.minimum((coords[:, 1] * n_materials).astype(int), n_materials - 1)
+
+    return mesh, swarm, material, T
+
+
+def evaluate_at_particles(swarm, T):
+    return uw.function.evaluate(
+        T.sym, swarm._particle_coordinates.data, cell_hint=swarm._get_particle_cells()
+    )
+
+
+def refresh_proxy(material):
+    material._update_proxy_variables()
+    return np.column_stack([np.asarray(var.data[:, 0]) for var in material._meshLevelSetVars])
+
+
+def time_operations(swarm, material, T):
+    t0 = time.perf_counter()
+    values = evaluate_at_particles(swarm, T)
+    t_evaluate = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    level_sets = refresh_proxy(material)
+    t_proxy = time.perf_counter() - t0
+
+    return values, level_sets, t_evaluate, t_proxy
+
+
+def check_identical(swarm, material, T):
+    """Assert that sorting only permutes the particle results."""
+    values, level_sets, _, _ = time_operations(swarm, material, T)
+
+    for order in ("cell", "hilbert"):
+        permutation = swarm.sort(order)
+        values = values[permutation]
+        sorted_values, sorted_level_sets, _, _ = time_operations(swarm, material, T)
+
+        np.testing.assert_allclose(sorted_values, values, rtol=1.0e-12)
+        np.testing.assert_allclose(sorted_level_sets, level_sets, rtol=1.0e-10, atol=1.0e-12)
+
+
+def run_benchmark(cases=None, verbose=True):
+    """
+    Time the swarm operations in scrambled, cell and Hilbert order.
+
+    Returns
+    -------
+    list : All benchmark results
+    """
+    if cases is None:
+        cases = [(16, 4), (32, 5), (64, 5)]
+
+    results = []
+
+    for res, fill_param in cases:
+        for order in ("cell", "hilbert"):
+            mesh, swarm, material, T = make_problem(res, fill_param)
+            n_particles = swarm.dm.getLocalSize()
+
+            _, _, t_evaluate, t_proxy = time_operations(swarm, material, T)
+
+            t0 = time.perf_counter()
+            swarm.sort(order)
+            t_sort = time.perf_counter() - t0
+
+            _, _, t_evaluate_sorted, t_proxy_sorted = time_operations(swarm, material, T)
+
+            result = {
+                'order': order,
+                'n_particles': n_particles,
+                'time_sort': t_sort,
+                'time_evaluate': t_evaluate,
+                'time_evaluate_sorted': t_evaluate_sorted,
+                'time_proxy': t_proxy,
+                'time_proxy_sorted': t_proxy_sorted,
+                'speedup': (t_evaluate + t_proxy) / (t_evaluate_sorted + t_proxy_sorted),
+            }
+            results.append(result)
+
+            if verbose:
+                print(f"  {order:8s} particles={n_particles:<8d}: sort={t_sort*1000:8.2f}ms, "
+                      f"evaluate={t_evaluate*1000:8.2f}->{t_evaluate_sorted*1000:8.2f}ms, "
+                      f"proxy={t_proxy*1000:8.2f}->{t_proxy_sorted*1000:8.2f}ms, "
+                      f"{result['speedup']:5.2f}x")
+
+            del material, T, swarm, mesh
+
+    return results
+
+
+def print_summary(results):
+    """Print summary table of results."""
+    print(f"\n{'='*84}")
+    print("SUMMARY")
+    print(f"{'='*84}")
+
+    print(f"\n{'Order':<9} {'Particles':<11} {'Sort':<11} {'Evaluate':<23} {'Proxy':<23} {'Speedup':<8}")
+    print("-" * 84)
+
+    for r in results:
+        print(f"{r['order']:<9} {r['n_particles']:<11} {r['time_sort']*1000:>8.2f}ms  "
+              f"{r['time_evaluate']*1000:>8.2f} ->{r['time_evaluate_sorted']*1000:>8.2f}ms  "
+              f"{r['time_proxy']*1000:>8.2f} ->{r['time_proxy_sorted']*1000:>8.2f}ms  "
+              f"{r['speedup']:>6.2f}x")
+
+
+def quick_test():
+    """Quick check that sorting only permutes the results."""
+    print("Quick identity test...")
+
+    _, swarm, material, T = make_problem(8, 3)
+    check_identical(swarm, material, T)
+    print("  cell and hilbert order: identical")
+
+    print("\nQuick test PASSED!")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "quick":
+        quick_test()
+    else:
+        results = run_benchmark()
+        print_summary(results)
@@ -313,6 +313,72 @@ def test_parallel_mesh_coordinate_access():
         assert abs(global_x_max - 1.0) < 0.1, f"Expected x_max near 1.0, got {global_x_max}"
 
 
+@pytest.mark.mpi(min_size=2)
+def test_cached_global_mesh_extents():
+    """Test that cached global radii / bounds agree with gathered values."""
+    mesh = uw.meshing.UnstructuredSimplexBox(
+        minCoords=(0.0, 0.0),
+        maxCoords=(1.0, 1.0),
+        cellSize=0.25,
+    )
+
+    gathered = uw.utilities.gather_data(np.array((mesh._radii.max(),)), bcast=True)
+    assert mesh.get_max_radius() == gathered.max()
+    assert uw.utilities.gather_data(mesh._radii.max(), op="max") == gathered.max()
+
+    n_local = uw.utilities.gather_data(mesh._centroids.shape[0], dtype=int, op="sum")
+    assert n_local == uw.mpi.comm.allreduce(mesh._centroids.shape[0], op=MPI.SUM)
+
+    extents = mesh._get_global_extents()
+    assert mesh._get_global_extents() is extents
+    assert np.allclose(extents["min_coords"], 0.0)
+    assert np.allclose(extents["max_coords"], 1.0)
+    assert mesh._get_domain_centroids().shape == (uw.mpi.size, mesh.dim)
+
+    # Invalidated (collectively) by the mesh-version hook
+    mesh._increment_mesh_version()
+    assert mesh._global_extents is None
+    assert mesh._neighbour_domains is None
+    assert mesh.get_max_radius() == gathered.max()
+
+
+@pytest.mark.mpi(min_size=2)
+def test_neighbour_swarm_migration():
+    """Test that migrated particles all land on the rank that owns them."""
+    mesh = uw.meshing.UnstructuredSimplexBox(
+        minCoords=(0.0, 0.0),
+        maxCoords=(1.0, 1.0),
+        cellSize=0.1,
+    )
+
+    # Built on first use (not with the mesh) and then cached
+    assert mesh._neighbour_domains is None
+    assert mesh._get_neighbour_domains() is mesh._get_neighbour_domains()
+
+    # The partition adjacency is symmetric
+    neighbours = uw.mpi.comm.allgather(set(mesh._get_neighbour_domains()[0]))
+    for rank, ranks in enumerate(neighbours):
+        assert rank not in ranks
+        assert all(rank in neighbours[other] for other in ranks)
+
+    swarm = uw.swarm.Swarm(mesh)
+    swarm.populate(fill_param=2)
+    n_global = uw.mpi.comm.allreduce(swarm.dm.getLocalSize(), op=MPI.SUM)
+
+    # Shift all particles, including some a long way (global fallback)
+    coords = swarm._particle_coordinates.data.copy()
+    shifted = 0.02 + 0.9 * coords
+    shifted[::25] = 1.0 - shifted[::25]
+
+    with swarm.migration_control(disable=True):
+        swarm._particle_coordinates.data[...] = shifted
+    swarm.migrate(remove_sent_points=True, delete_lost_points=False)
+
+    local_coords = swarm._particle_coordinates.data
+    assert np.all(mesh.points_in_domain(local_coords))
+    assert uw.mpi.comm.allreduce(swarm.dm.getLocalSize(), op=MPI.SUM) == n_global
+
+
 @pytest.mark.mpi(min_size=2)
 def test_that_parallel_tests_end():
     """Sentinel test to ensure test suite completes."""
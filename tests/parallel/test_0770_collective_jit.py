@@ -0,0 +1,60 @@
+"""
+Collective JIT compilation: one rank compiles, every rank loads the result.
+
+Run with:
+    mpirun -n 2 python -m pytest --with-mpi tests/parallel/test_0770_collective_jit.py
+"""
+
+import pytest
+import underworld3 as uw
+from mpi4py import MPI
+
+pytestmark = [pytest.mark.mpi(min_size=2), pytest.mark.timeout(120)]
+
+
+def _poisson(mesh, T):
+    poisson = uw.systems.Poisson(mesh, u_Field=T)
+    poisson.constitutive_model = uw.constitutive_models.DiffusionModel
+    poisson.constitutive_model.Parameters.diffusivity = 1
+    poisson.f = 1.0
+    poisson.add_dirichlet_bc(0.0, "Bottom")
+    poisson.add_dirichlet_bc(0.0, "Top")
+    return poisson
+
+
+@pytest.mark.mpi(min_size=2)
+@pytest.mark.level_2
+@pytest.mark.tier_b
+def test_collective_jit_single_compile(tmp_path_factory):
+    from underworld3.utilities import _jitextension
+
+    comm = MPI.COMM_WORLD
+    node_dir = comm.bcast(str(tmp_path_factory.mktemp("uw_jit_node")), root=0)
+
+    previous = uw.jit.cache_stats()
+    uw.jit.configure_cache(enabled=False)
+    uw.jit.configure_collective(enabled=True, node_dir=node_dir)
+
+    try:
+        mesh = uw.meshing.UnstructuredSimplexBox(cellSize=0.2)
+        T = uw.discretisation.MeshVariable("T_collective", mesh, 1, degree=1)
+
+        n_modules = len(_jitextension._ext_dict)
+        _poisson(mesh, T).solve()
+
+        # Every rank loaded the same module, and only rank 0 ran the compiler
+        new_modules = list(_jitextension._ext_dict.values())[n_modules:]
+        assert new_modules
+
+        names = comm.allgather(sorted(m.__name__ for m in new_modules))
+        assert all(n == names[0] for n in names)
+
+        compile_time = uw.jit.cache_stats()["compile_time"]
+        if uw.mpi.rank == 0:
+            assert compile_time > 0.0
+        else:
+            assert compile_time == 0.0
+
+    finally:
+        uw.jit.configure_cache(enabled=previous["enabled"])
+        uw.jit.configure_collective(enabled=True)
@@ -0,0 +1,58 @@
+"""
+Persistent evaluation plans for global_evaluate.
+
+A plan keeps the rank ownership of the evaluation points, so repeated
+evaluation at the same points moves no points at all, and small moves only
+re-locate the points that changed owner.
+
+Run with:
+    mpirun -n 2 python -m pytest --with-mpi tests/parallel/test_0775_evaluation_plan.py
+"""
+
+import pytest
+import numpy as np
+import underworld3 as uw
+from mpi4py import MPI
+
+pytestmark = [pytest.mark.mpi(min_size=2), pytest.mark.timeout(60)]
+
+
+@pytest.mark.mpi(min_size=2)
+@pytest.mark.level_1
+@pytest.mark.tier_a
+def test_evaluation_plan_reuse_and_update():
+    mesh = uw.meshing.UnstructuredSimplexBox(minCoords=(0.0, 0.0), maxCoords=(1.0, 1.0))
+    T = uw.discretisation.MeshVariable("T_plan", mesh, 1, degree=1)
+    T.array[:, 0, 0] = T.coords[:, 0]
+
+    # Every rank asks for points all over the domain
+    np.random.seed(7 + uw.mpi.rank)
+    N = 200
+    coords = 0.05 + 0.9 * np.random.random((N, mesh.dim))
+
+    plan = uw.function.EvaluationPlan(mesh)
+    result = uw.function.global_evaluate(T.sym, coords, plan=plan)
+    assert result.shape[0] == N
+    assert np.allclose(result.reshape(-1), coords[:, 0], atol=1.0e-6)
+
+    # New field values at the same points: no location work
+    T.array[:, 0, 0] = 2.0 * T.coords[:, 0]
+    result = uw.function.global_evaluate(T.sym, coords, plan=plan)
+    assert np.allclose(result.reshape(-1), 2.0 * coords[:, 0], atol=1.0e-6)
+
+    stats = plan.get_stats()
+    assert stats["rebuilds"] == 1
+    assert stats["reuses"] == 1
+
+    # Move some of the points: incremental update
+    coords[: N // 4, 0] = 1.0 - coords[: N // 4, 0]
+    result = uw.function.global_evaluate(T.sym, coords, plan=plan)
+    assert np.allclose(result.reshape(-1), 2.0 * coords[:, 0], atol=1.0e-6)
+
+    stats = plan.get_stats()
+    assert stats["rebuilds"] == 1
+    assert stats["updates"] == 1
+
+    # Every point is evaluated exactly once across the job
+    total_owned = MPI.COMM_WORLD.allreduce(stats["owned"], op=MPI.SUM)
+    assert total_owned == N * uw.mpi.size
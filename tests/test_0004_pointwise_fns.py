@@ -47,6 +47,7 @@ w = uw.discretisation.MeshVariable(
 shutil.rmtree("/tmp/fn_ptr_ext_TEST_0", ignore_errors=True)
 shutil.rmtree("/tmp/fn_ptr_ext_TEST_1", ignore_errors=True)
 shutil.rmtree("/tmp/fn_ptr_ext_TEST_2", ignore_errors=True)
+shutil.rmtree("/tmp/fn_ptr_ext_TEST_3", ignore_errors=True)
 
 
 ## This needs to be fixed up for systems that don't use /tmp like this
@@ -234,6 +235,67 @@ def test_getext_meshVar():
     ), "Expected expression N.x*exp(...) not found in JIT 5"
 
 
+def test_cse_equations_hoist_shared_terms():
+    from sympy.printing.c import c_code_printers
+    from underworld3.utilities._jitextension import _cse_equations
+
+    printer = c_code_printers["c99"]({})
+    a, b = sympy.symbols("a b")
+    eta = sympy.exp(a * b) / (1 + a**2)
+
+    fns = [
+        sympy.Matrix([[2 * eta * a, eta * b]]),
+        sympy.Matrix([[eta, 2 * eta], [eta * a, b]]),
+    ]
+    eqns = _cse_equations(fns, printer)
+
+    assert [e[0] for e in eqns] == ["eqn_0", "eqn_1"]
+
+    # The shared viscosity-like term is evaluated once in each kernel
+    for _, body in eqns:
+        assert body.count("exp(") == 1
+        assert "PetscScalar uw_cse_" in body
+
+
+def test_getext_cse():
+
+    res_fn = sympy.ImmutableDenseMatrix([sympy.exp(v.sym[0] * x) * v.sym[1], w.sym])
+    jac_fn = sympy.ImmutableDenseMatrix(
+        [sympy.exp(v.sym[0] * x) * y, 2 * sympy.exp(v.sym[0] * x) * v.sym[1]]
+    )
+
+    with uw.utilities.CaptureStdout(split=True) as captured_setup_solver:
+        _getext_result = getext(
+            mesh,
+            [res_fn],
+            [jac_fn],
+            [],
+            [],
+            [],
+            mesh.vars.values(),
+            verbose=True,
+            debug=False,
+            debug_name="TEST_3",
+            cache=False,
+            cse=True,
+        )
+
+    assert any("JIT CSE:" in line for line in captured_setup_solver)
+
+    module_location = None
+    prefix = "Location of compiled module: "
+    for output_line in captured_setup_solver:
+        if prefix in output_line:
+            module_location = output_line[output_line.find(prefix) + len(prefix) :]
+            break
+
+    assert module_location is not None, "Could not find module location in verbose output"
+    with open(os.path.join(str(module_location).strip(), "cy_ext.h")) as f:
+        header = f.read()
+
+    assert "uw_cse_" in header
+
+
 # def test_build_functions():
 #     stokes = uw.systems.Stokes(mesh, velocityField=v, pressureField=p)
 #     stokes.constitutive_model = uw.constitutive_models.ViscousFlowModel
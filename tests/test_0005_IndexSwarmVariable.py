@@ -79,6 +79,35 @@ def test_IndexSwarmVariable(mesh):
         del material
 
 
+@pytest.mark.parametrize("update_type", [0, 1])
+def test_IndexSwarmVariable_level_sets_partition_unity(update_type):
+    # All particles carry a valid index, so the level sets of all indices
+    # (computed together in one pass) sum to one on every node
+    uw.reset_default_model()
+
+    mesh = uw.meshing.UnstructuredSimplexBox(
+        minCoords=(0.0, 0.0), maxCoords=(1.0, 1.0), cellSize=1.0 / 8.0
+    )
+    swarm = uw.swarm.Swarm(mesh)
+    material = uw.swarm.IndexSwarmVariable(
+        "M", swarm, indices=3, update_type=update_type, radius=0.25, ind_bc=[0]
+    )
+    swarm.populate(fill_param=3)
+
+    y = swarm._particle_coordinates.data[:, 1]
+    material.data[:, 0] = np.minimum((3 * y).astype(int), 2)
+    material._update_proxy_variables()
+
+    level_sets = np.column_stack([var.data[:, 0] for var in material._meshLevelSetVars])
+    assert np.allclose(level_sets.sum(axis=1), 1.0)
+    assert np.all((level_sets >= 0.0) & (level_sets <= 1.0))
+
+    # Nodes deep inside a layer see only that material
+    node_y = material._meshLevelSetVars[0].coords[:, 1]
+    assert np.allclose(level_sets[node_y < 0.1, 0], 1.0)
+    assert np.allclose(level_sets[node_y > 0.9, 2], 1.0)
+
+
 # del meshStructuredQuadBox
 # del meshUnstructuredSimplexbox_regular
 # del meshUnstructuredSimplexbox_irregular
@@ -0,0 +1,315 @@
+"""
+Tests for the persistent on-disk JIT extension cache.
+
+The cache is exercised directly with dummy module files (no compiler
+needed), and once end-to-end with a Poisson solve to check that a module
+is stored and then found again after the in-memory dictionary is emptied.
+Reuse of derived functions across solver rebuilds and background
+compilation (`uw.jit.prepare`) are checked with small Poisson problems.
+"""
+
+import os
+import pytest
+import sympy
+
+# All tests in this module are quick core tests
+pytestmark = pytest.mark.level_1
+
+import underworld3 as uw
+from underworld3.utilities._jitcache import JITCache
+
+
+def _fake_module(tmp_path, name, nbytes):
+    path = tmp_path / name
+    path.write_bytes(b"\0" * nbytes)
+    return str(path)
+
+
+def test_key_depends_on_source_and_is_stable(tmp_path):
+    cache = JITCache(directory=str(tmp_path / "cache"), enabled=True)
+
+    k1 = cache.key("void f(){}", "pyx")
+    k2 = cache.key("void f(){}", "pyx")
+    k3 = cache.key("void g(){}", "pyx")
+
+    assert k1 == k2
+    assert k1 != k3
+    assert len(k1) == 64
+
+
+def test_store_lookup_and_stats(tmp_path):
+    cache = JITCache(directory=str(tmp_path / "cache"), enabled=True)
+    key = cache.key("source")
+
+    assert cache.lookup(key) is None
+
+    built = _fake_module(tmp_path, "built.so", 128)
+    stored = cache.store(key, built)
+
+    assert stored is not None and os.path.exists(stored)
+    assert cache.lookup(key) == stored
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["stores"] == 1
+    assert stats["entries"] == 1
+
+
+def test_lru_eviction(tmp_path):
+    # 1.5 kB bound, 1 kB entries: only the most recent entry survives
+    cache = JITCache(directory=str(tmp_path / "cache"), max_size_mb=1.5 / 1024, enabled=True)
+
+    keys = [cache.key(f"source_{i}") for i in range(3)]
+    for i, key in enumerate(keys):
+        built = _fake_module(tmp_path, f"built_{i}.so", 1024)
+        cache.store(key, built)
+        os.utime(cache.path_for(key), (i, i))  # well-separated access times
+
+    cache.evict()
+
+    assert not os.path.exists(cache.path_for(keys[0]))
+    assert not os.path.exists(cache.path_for(keys[1]))
+    assert os.path.exists(cache.path_for(keys[2]))
+    assert cache.get_stats()["evictions"] >= 2
+
+
+def test_clear_only_removes_cache_files(tmp_path):
+    directory = tmp_path / "shared"
+    cache = JITCache(directory=str(directory), enabled=True)
+    key = cache.key("source")
+
+    cache.store(key, _fake_module(tmp_path, "built.so", 16))
+    with cache.populate_lock(key):
+        pass
+    (directory / f".{key}.123.tmp").write_bytes(b"")
+
+    # Unrelated files in a shared directory, including another module
+    (directory / "notes.txt").write_text("keep")
+    _fake_module(directory, "other.so", 16)
+
+    assert cache.get_stats()["entries"] == 1
+
+    cache.clear()
+
+    assert sorted(os.listdir(directory)) == ["notes.txt", "other.so"]
+
+
+def test_disabled_cache_is_inert(tmp_path):
+    cache = JITCache(directory=str(tmp_path / "cache"), enabled=False)
+    key = cache.key("source")
+    built = _fake_module(tmp_path, "built.so", 16)
+
+    assert cache.store(key, built) is None
+    assert cache.lookup(key) is None
+
+    with cache.populate_lock(key):
+        pass
+
+    assert not os.path.exists(str(tmp_path / "cache"))
+
+
+def test_solver_module_reused_from_disk(tmp_path):
+    from underworld3.utilities import _jitextension
+
+    previous = uw.jit.cache_stats()
+    uw.jit.configure_cache(directory=str(tmp_path / "jit"), enabled=True)
+
+    try:
+        mesh = uw.meshing.UnstructuredSimplexBox(cellSize=0.25)
+        T = uw.discretisation.MeshVariable("T_jitcache", mesh, 1, degree=1)
+
+        poisson = uw.systems.Poisson(mesh, u_Field=T)
+        poisson.constitutive_model = uw.constitutive_models.DiffusionModel
+        poisson.constitutive_model.Parameters.diffusivity = 1
+        poisson.f = 1.0
+        poisson.add_dirichlet_bc(0.0, "Bottom")
+        poisson.add_dirichlet_bc(0.0, "Top")
+        poisson.solve()
+
+        stats = uw.jit.cache_stats()
+        assert stats["stores"] >= 1
+        assert stats["entries"] >= 1
+
+        # Forget the in-memory modules; an equivalent solver must now be
+        # satisfied from disk without compiling.
+        _jitextension._ext_dict.clear()
+
+        poisson2 = uw.systems.Poisson(mesh, u_Field=T)
+        poisson2.constitutive_model = uw.constitutive_models.DiffusionModel
+        poisson2.constitutive_model.Parameters.diffusivity = 1
+        poisson2.f = 1.0
+        poisson2.add_dirichlet_bc(0.0, "Bottom")
+        poisson2.add_dirichlet_bc(0.0, "Top")
+        poisson2.solve()
+
+        assert uw.jit.cache_stats()["hits"] >= 1
+
+    finally:
+        uw.jit.configure_cache(
+            directory=previous["directory"],
+            max_size_mb=previous["max_size_mb"],
+            enabled=previous["enabled"],
+        )
+
+
+def test_constant_change_reuses_pointwise_functions():
+    # Changing only the value of a constant keeps the solver DM and skips
+    # differentiation / JIT on the rebuild.
+    mesh = uw.meshing.UnstructuredSimplexBox(cellSize=0.25)
+    T = uw.discretisation.MeshVariable("T_jitmemo", mesh, 1, degree=1)
+
+    poisson = uw.systems.Poisson(mesh, u_Field=T)
+    poisson.constitutive_model = uw.constitutive_models.DiffusionModel
+    poisson.constitutive_model.Parameters.diffusivity = 1
+    poisson.f = 1.0
+    poisson.add_dirichlet_bc(0.0, "Bottom")
+    poisson.add_dirichlet_bc(0.0, "Top")
+    poisson.solve()
+
+    dm = poisson.dm
+    extensions = poisson.compiled_extensions
+    T_max_1 = float(T.data.max())
+
+    poisson.constitutive_model.Parameters.diffusivity = 2
+    poisson.solve()
+
+    assert poisson.dm is dm
+    assert poisson.compiled_extensions is extensions
+
+    # The new constant value reached PETSc: doubling the diffusivity halves T
+    T_max_2 = float(T.data.max())
+    assert T_max_2 == pytest.approx(0.5 * T_max_1, rel=1.0e-6)
+
+
+@pytest.mark.parametrize("deferred", [False, True])
+def test_named_build_without_disk_cache(tmp_path, deferred):
+    # debug_name and a disabled cache both skip the content-addressed naming
+    from underworld3.utilities import _jitextension
+
+    previous = uw.jit.cache_stats()
+    uw.jit.configure_cache(directory=str(tmp_path / "jit"), enabled=False)
+
+    try:
+        mesh = uw.meshing.UnstructuredSimplexBox(cellSize=0.5)
+        fn = sympy.ImmutableDenseMatrix([sympy.sympify(1), sympy.sympify(2)])
+        compile_time = uw.jit.cache_stats()["compile_time"]
+
+        args = (mesh, [fn], [fn], [fn], [fn], [fn], mesh.vars.values())
+        name = f"TEST_NOCACHE_{int(deferred)}"
+
+        if deferred:
+            with _jitextension.deferred_builds():
+                result = _jitextension.getext(*args, debug_name=name, cache=False)
+            assert isinstance(result.ptrobj, _jitextension.PendingExtension)
+            result.ptrobj.resolve()
+        else:
+            _jitextension.getext(*args, debug_name=name, cache=False)
+
+        assert name in _jitextension._ext_dict
+        assert uw.jit.cache_stats()["compile_time"] > compile_time
+        assert not os.path.exists(str(tmp_path / "jit"))
+
+    finally:
+        uw.jit.configure_cache(
+            directory=previous["directory"],
+            max_size_mb=previous["max_size_mb"],
+            enabled=previous["enabled"],
+        )
+
+
+def test_prepare_compiles_in_background(tmp_path):
+    from underworld3.utilities import _jitextension
+
+    previous = uw.jit.cache_stats()
+    uw.jit.configure_cache(directory=str(tmp_path / "jit"), enabled=True)
+
+    try:
+        mesh = uw.meshing.UnstructuredSimplexBox(cellSize=0.25)
+        x, y = mesh.X
+        T1 = uw.discretisation.MeshVariable("T_prep1", mesh, 1, degree=1)
+        T2 = uw.discretisation.MeshVariable("T_prep2", mesh, 1, degree=2)
+
+        solvers = []
+        for T, f in ((T1, x), (T2, sympy.sin(y))):
+            poisson = uw.systems.Poisson(mesh, u_Field=T)
+            poisson.constitutive_model = uw.constitutive_models.DiffusionModel
+            poisson.constitutive_model.Parameters.diffusivity = 1
+            poisson.f = f
+            poisson.add_dirichlet_bc(0.0, "Bottom")
+            poisson.add_dirichlet_bc(0.0, "Top")
+            solvers.append(poisson)
+
+        integral = uw.maths.Integral(mesh, T1.sym[0] * T2.sym[0] * x)
+
+        futures = uw.jit.prepare(solvers + [integral])
+        assert len(futures) == 3
+
+        for poisson in solvers:
+            poisson.solve()
+        integral.evaluate()
+
+        assert all(f.done() for f in futures)
+        assert not _jitextension._pending_builds
+
+    finally:
+        uw.jit.configure_cache(
+            directory=previous["directory"],
+            max_size_mb=previous["max_size_mb"],
+            enabled=previous["enabled"],
+        )
+
+
+def test_prepare_vector_and_stokes_solvers(tmp_path):
+    from underworld3.utilities import _jitextension
+
+    previous = uw.jit.cache_stats()
+    uw.jit.configure_cache(directory=str(tmp_path / "jit"), enabled=True)
+
+    try:
+        mesh = uw.meshing.UnstructuredSimplexBox(cellSize=0.25)
+        x, y = mesh.X
+        v = uw.discretisation.MeshVariable("V_prep", mesh, mesh.dim, degree=2)
+        p = uw.discretisation.MeshVariable("P_prep", mesh, 1, degree=1)
+        w = uw.discretisation.MeshVariable("W_prep", mesh, mesh.dim, degree=2)
+
+        projection = uw.systems.Vector_Projection(mesh, w)
+        projection.uw_function = sympy.Matrix([[y, x]])
+
+        # The natural BC makes the solve add its Null_Boundary term
+        stokes = uw.systems.Stokes(mesh, velocityField=v, pressureField=p)
+        stokes.constitutive_model = uw.constitutive_models.ViscousFlowModel
+        stokes.constitutive_model.Parameters.shear_viscosity_0 = 1
+        stokes.bodyforce = sympy.Matrix([0, x])
+        stokes.add_dirichlet_bc((0.0, 0.0), "Bottom")
+        stokes.add_dirichlet_bc((0.0, 0.0), "Top")
+        stokes.add_dirichlet_bc((0.0, sympy.oo), "Left")
+        stokes.add_natural_bc((0.0, 0.0), "Right")
+
+        futures = uw.jit.prepare([projection, stokes])
+        assert len(futures) == 2
+        assert not isinstance(projection.compiled_extensions, _jitextension.PendingExtension)
+        assert not isinstance(stokes.compiled_extensions, _jitextension.PendingExtension)
+
+        with _jitextension._pending_lock:
+            prepared = set(_jitextension._pending_builds) | set(_jitextension._ext_dict)
+
+        projection.solve()
+        stokes.solve()
+
+        # Both solves used the prepared modules and compiled nothing else
+        assert all(f.done() for f in futures)
+        assert not _jitextension._pending_builds
+        assert set(_jitextension._ext_dict) <= prepared
+
+    finally:
+        uw.jit.configure_cache(
+            directory=previous["directory"],
+            max_size_mb=previous["max_size_mb"],
+            enabled=previous["enabled"],
+        )
+
+
+def test_prepare_rejects_unsupported_objects():
+    with pytest.raises(TypeError):
+        uw.jit.prepare([object()])
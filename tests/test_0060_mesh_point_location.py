@@ -0,0 +1,70 @@
+"""
+Tests for point location by walking through the mesh cell adjacency
+(`Mesh.locate_points`), with and without previous-cell hints.
+"""
+
+import pytest
+import numpy as np
+
+# All tests in this module are quick core tests
+pytestmark = pytest.mark.level_1
+
+import underworld3 as uw
+
+
+def _meshes():
+    return [
+        uw.meshing.UnstructuredSimplexBox(
+            minCoords=(0.0, 0.0), maxCoords=(1.0, 1.0), cellSize=0.1
+        ),
+        uw.meshing.StructuredQuadBox(elementRes=(6, 5, 4)),
+    ]
+
+
+@pytest.mark.parametrize("mesh_index", [0, 1])
+def test_locate_points_finds_containing_cells(mesh_index):
+    mesh = _meshes()[mesh_index]
+
+    rng = np.random.default_rng(1)
+    points = rng.uniform(0.02, 0.98, size=(500, mesh.dim))
+
+    cells, reference = mesh.locate_points(points)
+
+    assert np.all(cells >= 0)
+    assert np.all(mesh._test_if_points_in_cells_internal(points, cells))
+
+    # PETSc reference cells span [-1, 1]
+    assert reference.shape == (points.shape[0], mesh.dim)
+    assert np.all(np.abs(reference) <= 1.0 + 1.0e-8)
+
+
+@pytest.mark.parametrize("mesh_index", [0, 1])
+def test_locate_points_with_previous_cells(mesh_index):
+    mesh = _meshes()[mesh_index]
+
+    rng = np.random.default_rng(2)
+    points = rng.uniform(0.05, 0.95, size=(500, mesh.dim))
+    cells, _ = mesh.locate_points(points)
+
+    # Small moves: the walk starts from the previous cells
+    moved = points + rng.uniform(-0.03, 0.03, size=points.shape)
+    hinted_cells, hinted_reference = mesh.locate_points(moved, cell_hint=cells)
+    fresh_cells, fresh_reference = mesh.locate_points(moved)
+
+    assert np.all(mesh._test_if_points_in_cells_internal(moved, hinted_cells))
+
+    # Points can only disagree if they sit on a face shared by two cells
+    same = hinted_cells == fresh_cells
+    assert np.count_nonzero(same) > 0.99 * points.shape[0]
+    assert np.allclose(hinted_reference[same], fresh_reference[same])
+
+
+def test_locate_points_outside_domain():
+    mesh = _meshes()[0]
+
+    points = np.array([[0.5, 0.5], [1.5, 0.5], [-0.2, 0.3]])
+    cells, reference = mesh.locate_points(points)
+
+    assert cells[0] >= 0
+    assert np.all(cells[1:] == -1)
+    assert np.all(np.isnan(reference[1:]))
@@ -157,3 +157,194 @@ def test_particle_clip_context_manager(setup_data):
 
     npts1 = swarm._particle_coordinates.data.shape[0]
     assert npts1 == 0
+
+
+def test_particle_cells_follow_migration(setup_data):
+    import numpy as np
+    import underworld3 as uw
+
+    swarm = setup_data
+    mesh = swarm.mesh
+    x, y = mesh.X
+
+    # Degree 2 represents x * y exactly
+    T = uw.discretisation.MeshVariable("T_hint", mesh, 1, degree=2)
+    T.data[:, 0] = T.coords[:, 0] * T.coords[:, 1]
+
+    swarm.populate(fill_param=2)
+
+    cells = swarm._get_particle_cells()
+    coords = swarm._particle_coordinates.data.copy()
+    assert np.all(mesh._test_if_points_in_cells_internal(coords, cells))
+
+    # Small move: the stored cells are walked to the new containing cells
+    rng = np.random.default_rng(0)
+    moved = np.clip(coords + rng.uniform(-0.02, 0.02, size=coords.shape), 0.001, 0.999)
+    swarm._particle_coordinates.data[...] = moved
+
+    cells = swarm._get_particle_cells()
+    coords = swarm._particle_coordinates.data.copy()
+    assert np.all(cells >= 0)
+    assert np.all(mesh._test_if_points_in_cells_internal(coords, cells))
+
+    # Cell hints only change where the search starts: correct, stale
+    # (another particle's cell) and missing (-1) hints give the same values
+    stale = np.roll(cells, 7)
+    mixed = np.where(np.arange(cells.shape[0]) % 2 == 0, cells, -1)
+    expected = coords[:, 0] * coords[:, 1]
+
+    for hint in (None, cells, stale, mixed, np.full_like(cells, -1)):
+        # Interpolation structures are cached per set of coordinates
+        mesh._dminterpolation_cache.invalidate_all("test")
+        values = uw.function.evaluate(T.sym[0], coords, cell_hint=hint)
+        np.testing.assert_allclose(np.asarray(values).reshape(-1), expected, atol=1.0e-10)
+
+
+def test_bulk_particle_removal(setup_data):
+    import numpy as np
+
+    swarm = setup_data
+    var = swarm.add_variable(name="tag", size=1)
+    swarm.populate(fill_param=2)
+
+    coords = swarm._particle_coordinates.data.copy()
+    var.data[:, 0] = coords[:, 0] + 10.0 * coords[:, 1]
+
+    remove = coords[:, 0] < 0.3
+    assert swarm._remove_particles(remove) == np.count_nonzero(remove)
+
+    # Survivors keep their order and every field stays aligned
+    assert swarm.dm.getLocalSize() == np.count_nonzero(~remove)
+    np.testing.assert_array_equal(swarm._particle_coordinates.data, coords[~remove])
+    kept = swarm._particle_coordinates.data
+    np.testing.assert_allclose(var.data[:, 0], kept[:, 0] + 10.0 * kept[:, 1])
+    assert np.all(swarm.mesh._test_if_points_in_cells_internal(kept, swarm._get_particle_cells()))
+
+
+def test_shared_particle_kdtree(setup_data):
+    import numpy as np
+    import underworld3 as uw
+
+    swarm = setup_data
+    a = swarm.add_variable(name="a", size=1)
+    b = swarm.add_variable(name="b", size=2)
+    swarm.populate(fill_param=2)
+
+    coords = swarm._particle_coordinates.data
+    a.data[:, 0] = coords[:, 0]
+    b.data[:, :] = coords[:, ::-1]
+
+    targets = swarm.mesh._centroids
+    va = a.rbf_interpolate(targets, nnn=3)
+    tree = swarm._get_particle_kdtree()
+    vb = b.rbf_interpolate(targets, nnn=3)
+
+    # One tree and one neighbour table serve both variables
+    assert swarm._get_particle_kdtree() is tree
+    assert len(swarm._rbf_tables) == 1
+
+    reference = uw.kdtree.KDTree(coords[:, :])
+    np.testing.assert_allclose(va, reference.rbf_interpolator_local(targets, a.data, 3, 2, False))
+    np.testing.assert_allclose(vb, reference.rbf_interpolator_local(targets, b.data, 3, 2, False))
+
+    # Moving the particles rebuilds the tree
+    swarm._particle_coordinates.data[...] = 0.5 + 0.9 * (coords - 0.5)
+    assert swarm._get_particle_kdtree() is not tree
+    assert len(swarm._rbf_tables) == 0
+
+
+def test_sort_particles(setup_data):
+    import numpy as np
+
+    swarm = setup_data
+    a = swarm.add_variable(name="a", size=2)
+    swarm.populate(fill_param=2)
+
+    # Scramble the particles, then put them back in cell order
+    rng = np.random.default_rng(3)
+    swarm._permute_particles(rng.permutation(swarm.dm.getLocalSize()))
+
+    coords = np.array(swarm._particle_coordinates.data)
+    a.data[:, :] = coords
+    cells = swarm._get_particle_cells()
+
+    permutation = swarm.sort("cell")
+    assert permutation is swarm.sort_permutation
+    assert np.all(np.diff(swarm._get_particle_cells()) >= 0)
+
+    # Every field moved together
+    np.testing.assert_array_equal(swarm._particle_coordinates.data, coords[permutation])
+    np.testing.assert_array_equal(a.data, coords[permutation])
+    np.testing.assert_array_equal(swarm._get_particle_cells(), cells[permutation])
+
+    swarm._permute_particles(rng.permutation(swarm.dm.getLocalSize()))
+    a.data[:, :] = swarm._particle_coordinates.data
+    coords = np.array(swarm._particle_coordinates.data)
+    permutation = swarm.sort("hilbert")
+    np.testing.assert_array_equal(a.data, coords[permutation])
+
+    # Consecutive particles along the curve are close together
+    sorted_coords = swarm._particle_coordinates.data
+    step = np.linalg.norm(np.diff(sorted_coords, axis=0), axis=1)
+    scrambled = np.linalg.norm(np.diff(coords, axis=0), axis=1)
+    assert np.median(step) < 0.5 * np.median(scrambled)
+
+    # Automatic sorting after migration
+    swarm.sort_interval = 1
+    swarm._permute_particles(rng.permutation(swarm.dm.getLocalSize()))
+    swarm.migrate()
+    assert np.all(np.diff(swarm._get_particle_cells()) >= 0)
+
+
+def test_lagrangian_swarm_tensor_history(setup_data):
+    import numpy as np
+    import sympy
+    import underworld3 as uw
+
+    swarm = setup_data
+    x, y = swarm.mesh.X
+    M = sympy.Matrix([[x, y], [y, x * y]])
+
+    DuDt = uw.systems.ddt.Lagrangian_Swarm(
+        swarm, M, vtype=uw.VarType.SYM_TENSOR, degree=1, continuous=True, order=2
+    )
+    swarm.populate(fill_param=2)
+
+    coords = np.array(swarm._particle_coordinates.data)
+    expected = np.empty((coords.shape[0], 2, 2))
+    expected[:, 0, 0] = coords[:, 0]
+    expected[:, 0, 1] = expected[:, 1, 0] = coords[:, 1]
+    expected[:, 1, 1] = coords[:, 0] * coords[:, 1]
+
+    DuDt.initialise_history()
+    np.testing.assert_allclose(DuDt.psi_star[0].array, expected)
+    np.testing.assert_allclose(DuDt.psi_star[1].array, expected)
+
+    # The history shifts down and psi_star[0] averages old and new values
+    DuDt.psi_fn = 2 * M
+    DuDt.update_post_solve(0.1)
+    np.testing.assert_allclose(DuDt.psi_star[1].array, expected)
+    np.testing.assert_allclose(DuDt.psi_star[0].array, 1.5 * expected)
+
+
+def test_lagrangian_swarm_psi_fn_sees_shifted_history(setup_data):
+    import numpy as np
+    import underworld3 as uw
+
+    swarm = setup_data
+
+    DuDt = uw.systems.ddt.Lagrangian_Swarm(
+        swarm, swarm.mesh.X[0], vtype=uw.VarType.SCALAR, degree=1, continuous=True, order=2
+    )
+    swarm.populate(fill_param=2)
+
+    with swarm.access(*DuDt.psi_star):
+        DuDt.psi_star[0].data[...] = 3.0
+        DuDt.psi_star[1].data[...] = 1.0
+
+    # psi_fn is evaluated after the shift, so it sees the old psi_star[0]
+    DuDt.psi_fn = DuDt.psi_star[1].sym[0, 0]
+    DuDt.update_post_solve(0.1)
+
+    np.testing.assert_allclose(DuDt.psi_star[1].data, 3.0)
+    np.testing.assert_allclose(DuDt.psi_star[0].data, 3.0)
@@ -0,0 +1,98 @@
+"""
+Tests for the particle advection schemes (`Swarm.advection(order=...)`).
+
+Particles are carried by a solid-body rotation, which a degree-2 mesh
+variable represents exactly, so the trajectory error is the integrator's
+own error.
+"""
+
+import pytest
+import numpy as np
+
+# All tests in this module are quick core tests
+pytestmark = pytest.mark.level_1
+
+import underworld3 as uw
+
+
+def _rotating_swarm():
+    mesh = uw.meshing.UnstructuredSimplexBox(
+        minCoords=(0.0, 0.0), maxCoords=(1.0, 1.0), cellSize=1.0 / 16.0
+    )
+    v = uw.discretisation.MeshVariable("V_rot", mesh, mesh.dim, degree=2)
+    v.data[:, 0] = 0.5 - v.coords[:, 1]
+    v.data[:, 1] = v.coords[:, 0] - 0.5
+
+    swarm = uw.swarm.Swarm(mesh)
+    theta = np.linspace(0.0, 2.0 * np.pi, 24, endpoint=False)
+    start = np.column_stack((0.5 + 0.3 * np.cos(theta), 0.5 + 0.3 * np.sin(theta)))
+    swarm.add_particles_with_coordinates(start)
+
+    return swarm, v
+
+
+def _rotation_error(swarm, angle):
+    coords = swarm._particle_coordinates.data
+    radius = np.hypot(coords[:, 0] - 0.5, coords[:, 1] - 0.5)
+    start_angle = np.arctan2(coords[:, 1] - 0.5, coords[:, 0] - 0.5) - angle
+
+    # Every particle started on the circle at a multiple of 2 pi / 24
+    nearest = np.round(start_angle / (2.0 * np.pi / 24)) * (2.0 * np.pi / 24)
+    expected = 0.5 + 0.3 * np.column_stack(
+        (np.cos(nearest + angle), np.sin(nearest + angle))
+    )
+    return np.abs(coords - expected).max(), np.abs(radius - 0.3).max()
+
+
+def test_higher_order_schemes_are_more_accurate():
+    angle = 0.6
+    errors = {}
+
+    for order in (2, 4, "rk4"):
+        swarm, v = _rotating_swarm()
+        swarm.advection(v.sym, delta_t=angle, order=order)
+        errors[order], _ = _rotation_error(swarm, angle)
+
+    assert errors[4] == pytest.approx(errors["rk4"])
+    assert errors[4] < 0.1 * errors[2]
+    assert errors[4] < 5.0e-4
+
+
+def test_adaptive_rk45_meets_tolerance():
+    swarm, v = _rotating_swarm()
+    swarm.advection(v.sym, delta_t=1.0, order="rk45", tolerance=1.0e-6)
+
+    error, radial_error = _rotation_error(swarm, 1.0)
+    assert error < 1.0e-4
+    assert radial_error < 1.0e-4
+
+
+def test_custom_integrator_and_bad_scheme():
+    heun = uw.swarm.AdvectionIntegrator("heun", [[], [1.0]], [0.5, 0.5], order=2)
+
+    swarm, v = _rotating_swarm()
+    swarm.advection(v.sym, delta_t=0.1, order=heun, step_limit=True)
+    error, _ = _rotation_error(swarm, 0.1)
+    assert error < 1.0e-3
+
+    with pytest.raises(ValueError):
+        swarm.advection(v.sym, delta_t=0.1, order=3)
+
+
+def test_nodal_swarm_forwards_tolerance():
+    swarm, v = _rotating_swarm()
+    T = uw.discretisation.MeshVariable("T_nodal_rk45", v.mesh, 1, degree=1)
+    nswarm = uw.swarm.NodalPointSwarm(T)
+
+    nswarm.advection(v.sym, delta_t=0.2, order="rk45", tolerance=1.0e-6)
+
+    # A solid-body rotation keeps each node at its distance from the centre
+    # (_X0 carries the starting point of every particle)
+    start = np.asarray(nswarm._X0.data).reshape(-1, 2)
+    end = nswarm._particle_coordinates.data
+    r_start = np.hypot(start[:, 0] - 0.5, start[:, 1] - 0.5)
+    r_end = np.hypot(end[:, 0] - 0.5, end[:, 1] - 0.5)
+
+    inside = r_start < 0.45
+    assert np.count_nonzero(inside) > 0
+    np.testing.assert_allclose(r_end[inside], r_start[inside], atol=1.0e-4)
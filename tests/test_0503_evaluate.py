@@ -100,3 +100,133 @@ def test_single_vector_variable():
     assert np.allclose(np.array(((1.1, 1.2),)), result, rtol=1e-05, atol=1e-08)
 
     del mesh
+
+
+def test_evaluation_kernel_reused():
+    from underworld3.function.evaluation_kernel_cache import evaluation_kernel_cache
+
+    mesh = uw.meshing.StructuredQuadBox()
+    var = uw.discretisation.MeshVariable(
+        varname="scalar_var_kernel", mesh=mesh, num_components=1, vtype=uw.VarType.SCALAR
+    )
+    var.array[...] = 2.0
+
+    alpha = uw.function.expression(r"\alpha_{kernel}", sym=3.0)
+    expr = alpha * var.sym[0] + mesh.r[0]
+
+    result = fn.evaluate(expr, coords).squeeze()
+    assert np.allclose(6.0 + coords[:, 0], result, rtol=1e-05, atol=1e-08)
+
+    # Same structure, new values: the kernel is reused
+    hits = evaluation_kernel_cache.get_stats()["hits"]
+    alpha.sym = 4.0
+    var.array[...] = 1.0
+
+    result = fn.evaluate(expr, coords).squeeze()
+    assert np.allclose(4.0 + coords[:, 0], result, rtol=1e-05, atol=1e-08)
+    assert evaluation_kernel_cache.get_stats()["hits"] > hits
+
+    del mesh
+
+
+def test_only_referenced_variables_interpolated():
+    mesh = uw.meshing.StructuredQuadBox()
+    var_a = uw.discretisation.MeshVariable(
+        varname="scalar_var_sel_a", mesh=mesh, num_components=1, vtype=uw.VarType.SCALAR
+    )
+    var_b = uw.discretisation.MeshVariable(
+        varname="vector_var_sel_b", mesh=mesh, num_components=2, vtype=uw.VarType.VECTOR
+    )
+    var_a.array[...] = 3.0
+    var_b.array[...] = (1.1, 1.2)
+
+    result = fn.evaluate(var_b.sym[1] * var_a.sym[0], coords).squeeze()
+    assert np.allclose(3.6, result, rtol=1e-05, atol=1e-08)
+
+    result = fn.evaluate(var_a.sym, coords).squeeze()
+    assert np.allclose(3.0, result, rtol=1e-05, atol=1e-08)
+
+    # The interpolation structure for var_a alone carries only its field
+    fields = [key[2] for key in mesh._dminterpolation_cache._cache]
+    assert (var_a.field_id,) in fields
+
+    del mesh
+
+
+def test_global_evaluate_with_plan():
+    mesh = uw.meshing.StructuredQuadBox()
+    var = uw.discretisation.MeshVariable(
+        varname="scalar_var_plan", mesh=mesh, num_components=1, vtype=uw.VarType.SCALAR
+    )
+    var.array[...] = 2.0
+
+    plan = fn.EvaluationPlan(mesh)
+    result = fn.global_evaluate(var.sym, coords, plan=plan)
+    assert np.allclose(2.0, result, rtol=1e-05, atol=1e-08)
+
+    var.array[...] = 3.0
+    result = fn.global_evaluate(var.sym, coords, plan=plan)
+    assert np.allclose(3.0, result, rtol=1e-05, atol=1e-08)
+
+    stats = plan.get_stats()
+    assert stats["rebuilds"] == 1
+    assert stats["reuses"] == 1
+    assert stats["owned"] == coords.shape[0]
+
+    del mesh
+
+
+def test_evaluate_many_matches_evaluate():
+    mesh = uw.meshing.StructuredQuadBox()
+    scalar = uw.discretisation.MeshVariable(
+        varname="scalar_var_many", mesh=mesh, num_components=1, vtype=uw.VarType.SCALAR
+    )
+    vector = uw.discretisation.MeshVariable(
+        varname="vector_var_many", mesh=mesh, num_components=2, vtype=uw.VarType.VECTOR
+    )
+    scalar.array[...] = 2.0
+    vector.array[...] = (1.1, 1.2)
+
+    x, y = mesh.X
+    exprs = [scalar.sym, vector.sym, scalar.sym[0] * vector.sym[1] + x, sympy.sin(y)]
+
+    results = fn.evaluate_many(exprs, coords)
+    assert isinstance(results, tuple) and len(results) == len(exprs)
+
+    for expr, result in zip(exprs, results):
+        expected = fn.evaluate(expr, coords)
+        assert result.shape == expected.shape
+        assert np.allclose(expected, result, rtol=1e-05, atol=1e-08)
+
+    named = fn.evaluate_many({"s": scalar.sym, "v": vector.sym}, coords)
+    assert set(named.keys()) == {"s", "v"}
+    assert np.allclose(np.array(((1.1, 1.2),)), named["v"], rtol=1e-05, atol=1e-08)
+
+    del mesh
+
+
+def test_chunked_evaluate_into_output_array():
+    mesh = uw.meshing.StructuredQuadBox()
+    var = uw.discretisation.MeshVariable(
+        varname="vector_var_chunk", mesh=mesh, num_components=2, vtype=uw.VarType.VECTOR
+    )
+    var.array[...] = (1.1, 1.2)
+
+    x, y = mesh.X
+    expr = var.sym * x
+
+    expected = fn.evaluate(expr, coords)
+    n_cached = len(mesh._dminterpolation_cache._cache)
+
+    result = fn.evaluate(expr, coords, chunk_size=7)
+    assert np.allclose(expected, result, rtol=1e-05, atol=1e-08)
+
+    out = np.zeros_like(np.asarray(expected))
+    result = fn.evaluate(expr, coords, chunk_size=7, out=out)
+    assert np.shares_memory(np.asarray(result), out)
+    assert np.allclose(expected, out, rtol=1e-05, atol=1e-08)
+
+    # Blocks do not accumulate interpolation structures in the mesh cache
+    assert len(mesh._dminterpolation_cache._cache) == n_cached
+
+    del mesh
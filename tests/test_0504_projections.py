@@ -104,4 +104,59 @@ def test_gradient_recovery():
     scalar_projection.solve()
 
 
+def test_eulerian_advection_correction():
+    # u·∇ψ for every component comes from one projection solve
+    s_soln.array[:, 0, 0] = s_soln.coords[:, 0] ** 2
+    v_soln.array[:, 0, 0] = s_soln.coords[:, 1]
+    v_soln.array[:, 0, 1] = s_soln.coords[:, 0]
+
+    V = sympy.Matrix([[1.0, 0.5]])
+    dt = 0.01
+
+    for psi, expected in (
+        (s_soln, lambda c: (c[:, 0] ** 2 - dt * 2.0 * c[:, 0]).reshape(-1, 1)),
+        (v_soln, lambda c: np.column_stack((c[:, 1] - 0.5 * dt, c[:, 0] - dt))),
+    ):
+        DuDt = uw.systems.ddt.Eulerian(
+            mesh, psi, vtype=psi.vtype, degree=2, continuous=True, V_fn=V
+        )
+        DuDt.update_pre_solve(dt)
+
+        coords = DuDt.psi_star[0].coords
+        assert np.allclose(DuDt.psi_star[0].data, expected(coords), atol=1.0e-4)
+
+    # evalf keeps the per-component evaluation (no projection solver)
+    DuDt = uw.systems.ddt.Eulerian(
+        mesh, s_soln, vtype=s_soln.vtype, degree=2, continuous=True, V_fn=V
+    )
+    DuDt.update_pre_solve(dt, evalf=True)
+    assert getattr(DuDt, "_advection_projection_solver", None) is None
+
+
 # -
+
+
+def test_projection_reuses_operator():
+    projection = uw.systems.Projection(mesh, gradient)
+    projection.uw_function = s_soln.sym[0]
+    projection.reuse_operator = True
+
+    s_soln.array[:, 0, 0] = s_soln.coords[:, 0]
+    projection.solve()
+    assert projection.get_operator_stats()["last"] == "assembled"
+
+    # Only the right-hand side changes: the operator is kept
+    s_soln.array[:, 0, 0] = 2.0 * s_soln.coords[:, 0]
+    projection.solve()
+    stats = projection.get_operator_stats()
+    assert stats["last"] == "reused"
+    assert stats["assembled"] == 1 and stats["reused"] == 1
+    assert np.allclose(gradient.data[:, 0], 2.0 * gradient.coords[:, 0], atol=1.0e-4)
+
+    # A weighting in the Jacobian that changes forces a new assembly
+    projection.uw_weighting_function = 1.0 + s_soln.sym[0] ** 2
+    projection.solve()
+    assert projection.get_operator_stats()["last"] == "assembled"
+    s_soln.array[:, 0, 0] = 3.0 * s_soln.coords[:, 0]
+    projection.solve()
+    assert projection.get_operator_stats()["last"] == "assembled"
@@ -3,6 +3,7 @@ import pytest
 # Physics solver tests - full solver execution
 pytestmark = pytest.mark.level_3
 import sympy
+import numpy as np
 import underworld3 as uw
 
 # These are tested by test_001_meshes.py
@@ -432,3 +433,35 @@ def test_stokes_viscosity_with_variable_fn():
     assert stokes.snes.getConvergedReason() > 0
 
     return
+
+
+def test_stokes_warm_start():
+    """A warm start from a converged solution keeps it and the SNES type."""
+    mesh = uw.meshing.UnstructuredSimplexBox(cellSize=0.2, regular=True, qdegree=2)
+    x, y = mesh.X
+
+    u = uw.discretisation.MeshVariable(
+        r"mathbf{u}", mesh, mesh.dim, vtype=uw.VarType.VECTOR, degree=2
+    )
+    p = uw.discretisation.MeshVariable(r"mathbf{p}", mesh, 1, vtype=uw.VarType.SCALAR, degree=1)
+
+    stokes = uw.systems.Stokes(mesh, velocityField=u, pressureField=p)
+    stokes.constitutive_model = uw.constitutive_models.ViscousFlowModel
+    stokes.constitutive_model.Parameters.shear_viscosity_0 = 1
+    stokes.petsc_options["snes_type"] = "newtonls"
+
+    stokes.bodyforce = sympy.Matrix([0, sympy.sin(sympy.pi * x)])
+    stokes.add_dirichlet_bc((0.0, 0.0), "Bottom")
+    stokes.add_dirichlet_bc((0.0, 0.0), "Top")
+    stokes.add_dirichlet_bc((0.0, sympy.oo), "Left")
+    stokes.add_dirichlet_bc((0.0, sympy.oo), "Right")
+
+    stokes.solve()
+    u_cold = u.data.copy()
+
+    stokes.solve(zero_init_guess=False)
+
+    assert stokes.snes.getConvergedReason() > 0
+    assert stokes.snes.getType() == "newtonls"
+    assert stokes.snes.getIterationNumber() <= 1
+    assert np.allclose(u.data, u_cold, atol=1.0e-6 * np.abs(u_cold).max())
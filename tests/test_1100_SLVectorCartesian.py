@@ -2,6 +2,7 @@
 import underworld3 as uw
 import sympy
 import math
+import numpy as np
 import pytest
 
 # Physics solver tests - full solver execution
@@ -167,4 +168,55 @@ def test_SLVec_boxmesh(mesh_type):
     del DuDt
 
 
+
+def test_SL_history_levels_share_departure_points():
+    """Every history level is sampled at the same departure points, in one pass."""
+    mesh = uw.meshing.UnstructuredSimplexBox(cellSize=1 / res, regular=True, qdegree=3)
+
+    T = uw.discretisation.MeshVariable("T_sl", mesh, 1, degree=2)
+    v = uw.discretisation.MeshVariable("V_sl", mesh, mesh.dim, degree=2)
+    v.array[:, 0, 0] = 0.1
+    v.array[:, 0, 1] = 0.05
+
+    DuDt = uw.systems.ddt.SemiLagrangian(
+        mesh,
+        T.sym,
+        v.sym,
+        vtype=uw.VarType.SCALAR,
+        degree=2,
+        continuous=True,
+        order=2,
+    )
+
+    # Linear fields are represented exactly (the nodes are sampled 0.1% of
+    # the way towards the cell centroids, hence the tolerance)
+    T.array[:, 0, 0] = T.coords[:, 0] + 2.0 * T.coords[:, 1]
+    DuDt.initialise_history()
+    coords = DuDt.psi_star[0].coords
+    DuDt.psi_star[0].array[:, 0, 0] = 3.0 * coords[:, 0] - coords[:, 1]
+
+    for step in range(2):
+        DuDt.update_pre_solve(0.5)
+
+    # The second step samples the first step's results at the same points
+    departure_x = coords[:, 0] - 2 * 0.05
+    departure_y = coords[:, 1] - 2 * 0.025
+    interior = (departure_x > 0.01) & (departure_y > 0.01)
+
+    expected_0 = (coords[:, 0] - 0.05) + 2.0 * (coords[:, 1] - 0.025)
+    expected_1 = departure_x + 2.0 * departure_y
+    assert np.abs(DuDt.psi_star[1].array[interior, 0, 0] - expected_1).max() < 1.0e-3
+
+    interior = (coords[:, 0] - 0.05 > 0.01) & (coords[:, 1] - 0.025 > 0.01)
+    assert np.abs(DuDt.psi_star[0].array[interior, 0, 0] - expected_0).max() < 1.0e-3
+
+    # One mid-point and one end-point evaluation per step
+    assert set(DuDt._evaluation_plans) == {"mid", "end"}
+    for plan in DuDt._evaluation_plans.values():
+        assert plan.get_stats()["evaluations"] == 2
+
+    del mesh
+    del DuDt
+
+
 # Meshes are now created inside test functions, no need to delete them here